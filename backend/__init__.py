@@ -1,13 +1,45 @@
 """Backend package for Career-Sync-AI resume tailoring workflow."""
 
-from .state import ResumeState
-from .graph import create_resume_workflow
-from .utils import parse_pdf, save_markdown, convert_markdown_to_pdf
-
-__all__ = [
-    "ResumeState",
-    "create_resume_workflow",
-    "parse_pdf",
-    "save_markdown",
-    "convert_markdown_to_pdf",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> defining module. Resolved on first access (PEP 562) so that
+# importing any backend submodule doesn't pull in langgraph, openai or
+# PyPDF2 until they are actually used.
+_EXPORTS = {
+    "ResumeState": "backend.state",
+    "create_resume_workflow": "backend.graph",
+    "parse_pdf": "backend.utils",
+    "save_markdown": "backend.utils",
+    "convert_markdown_to_pdf": "backend.utils",
+    "export_document": "backend.exporters",
+    "export_batch": "backend.exporters",
+    "build_initial_state": "backend.pipeline",
+    "run_evaluation": "backend.pipeline",
+    "run_generation": "backend.pipeline",
+    "run_drafting": "backend.pipeline",
+    "warm_up": "backend.warmup",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .state import ResumeState
+    from .graph import create_resume_workflow
+    from .utils import parse_pdf, save_markdown, convert_markdown_to_pdf
+    from .exporters import export_document, export_batch
+    from .pipeline import build_initial_state, run_evaluation, run_generation, run_drafting
+    from .warmup import warm_up
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'backend' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
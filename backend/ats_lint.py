@@ -0,0 +1,341 @@
+"""
+Deterministic ATS/format linter for resumes.
+
+Replaces the LLM's formatting score and most of its ATS score with a
+weighted rule set that runs locally in milliseconds. Each rule scores the
+resume from 0 to 1 and explains what cost it points:
+
+    Rule        Dimension   Weight  Checks
+    headings    ats         2.0     Name, standard Experience/Education/Skills sections
+    contact     ats         2.0     Email (0.5), phone (0.3) and a profile link (0.2) in the header
+    layout      ats         2.0     No tables, images or raw HTML (Markdown, or the source PDF)
+    characters  ats         1.0     No icons/emoji or private-use glyphs ATS parsers drop
+    bullets     formatting  2.0     One bullet marker, bullets under BULLET_MAX_WORDS, bulleted experience
+    dates       formatting  1.5     One date style ("Jan 2020", "January 2020", "01/2020", "2020")
+    length      formatting  1.5     LENGTH_IDEAL_WORDS words, at most MAX_PAGES pages
+
+A dimension's score is 10 x the weighted mean of its rules.
+"""
+
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.resume_profile import parse_resume_profile
+from backend.sections import GENERAL_FEEDBACK_PREFIX, section_key
+
+# Share of ats_score taken from the linter; the rest is the LLM's judgement
+ATS_LINT_WEIGHT = float(os.getenv("ATS_LINT_WEIGHT", "0.7"))
+
+# Sections every ATS looks for
+STANDARD_SECTIONS = ("experience", "education", "skills")
+
+# Longest line taken for a plain-text heading or name (text extracted from a PDF)
+PLAIN_HEADING_MAX_WORDS = 4
+
+BULLET_MAX_WORDS = 40
+# Word counts scored 1.0; within the tolerance band 0.6, beyond it 0.2
+LENGTH_IDEAL_WORDS = (300, 900)
+LENGTH_TOLERABLE_WORDS = (150, 1300)
+MAX_PAGES = 2
+
+BULLET_MARKER = re.compile(r'^\s*([-*+•◦▪‣·])\s+')
+TABLE_ROW = re.compile(r'^\s*\|.*\|\s*$')
+MARKDOWN_IMAGE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+HTML_TAG = re.compile(r'</?(?:table|tr|td|img|div|span|br|font)\b', re.IGNORECASE)
+
+# "Jan 2020", "January 2020", "01/2020", "2020", optionally a range ending in "Present"
+_MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?'
+_DATE = rf'(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|(?:19|20)\d{{2}})'
+DATE_PATTERN = re.compile(
+    rf'{_DATE}(?:\s*(?:-|–|—|to)\s*(?:{_DATE}|Present|Current|Now))?',
+    re.IGNORECASE
+)
+
+# Month names; 'May' reads as either style, so it isn't counted
+FULL_MONTHS = frozenset(
+    "january february march april june july august september october november december".split()
+)
+MONTH_YEAR = re.compile(r'^([A-Za-z]+)\.?\s+\d{4}$')
+NUMERIC_DATE = re.compile(r'^\d{1,2}/\d{4}$')
+YEAR = re.compile(r'^\d{4}$')
+DATE_RANGE_SEPARATOR = re.compile(r'\s*(?:-|–|—|\bto\b)\s*', re.IGNORECASE)
+
+
+@dataclass
+class LintInput:
+    """What the rules look at, parsed once per lint."""
+
+    text: str
+    lines: List[str]
+    profile: Dict[str, Any]
+    layout: Optional[Dict[str, Any]]
+
+
+# Rule check: input -> (score 0-1, issues)
+Check = Callable[[LintInput], Tuple[float, List[str]]]
+
+
+@dataclass(frozen=True)
+class LintRule:
+    """One weighted check."""
+
+    id: str
+    dimension: str
+    weight: float
+    check: Check
+
+
+def _base_key(section: Dict[str, Any]) -> str:
+    # Profiles saved before base_key was added
+    key: str = section.get("base_key") or section["key"]
+    return key
+
+
+def _plain_lines(lint: LintInput) -> List[str]:
+    """Short standalone lines, which head sections in text extracted from a PDF."""
+    lines = []
+    for line in lint.lines:
+        line = line.strip().rstrip(':')
+        if (line and not line.startswith('#') and not BULLET_MARKER.match(line)
+                and not line.endswith('.') and len(line.split()) <= PLAIN_HEADING_MAX_WORDS):
+            lines.append(line)
+    return lines
+
+
+def check_headings(lint: LintInput) -> Tuple[float, List[str]]:
+    keys = {_base_key(section) for section in lint.profile["sections"]}
+    name = lint.profile["name"]
+    issues = []
+    score = 1.0
+
+    # Without '#' headings (plain text), a standalone line naming a section
+    # ('EXPERIENCE', 'Work History:') is taken as its heading and a leading
+    # short line without an email or digits as the name
+    if not lint.profile["name"] or len(keys) <= 1:
+        plain = _plain_lines(lint)
+        keys.update(section_key(line) for line in plain)
+        first = next((line.strip() for line in lint.lines if line.strip()), "")
+        if not name and first in plain and '@' not in first and not any(c.isdigit() for c in first):
+            name = first
+
+    if not name:
+        issues.append("Start with your name as a '# ' title")
+        score -= 0.25
+    missing = [key for key in STANDARD_SECTIONS if key not in keys]
+    if missing:
+        issues.append(f"Add standard section headings: {', '.join(m.title() for m in missing)}")
+        score -= 0.75 * len(missing) / len(STANDARD_SECTIONS)
+    return max(score, 0.0), issues
+
+
+def check_contact(lint: LintInput) -> Tuple[float, List[str]]:
+    contact = lint.profile["contact"]
+    score = 0.0
+    issues = []
+    for field, weight, issue in (
+        ("email", 0.5, "Add an email address near your name"),
+        ("phone", 0.3, "Add a phone number near your name"),
+        ("links", 0.2, "Add a LinkedIn or portfolio link"),
+    ):
+        if contact.get(field):
+            score += weight
+        else:
+            issues.append(issue)
+    return score, issues
+
+
+def check_layout(lint: LintInput) -> Tuple[float, List[str]]:
+    layout = lint.layout or {}
+    problems = []
+
+    if sum(1 for line in lint.lines if TABLE_ROW.match(line)) >= 2 or layout.get("tables"):
+        problems.append("Replace tables with plain sections and bullets; ATS parsers scramble table cells")
+    if MARKDOWN_IMAGE.search(lint.text) or layout.get("images"):
+        problems.append("Remove images, logos and photos; ATS parsers ignore them")
+    if HTML_TAG.search(lint.text):
+        problems.append("Remove raw HTML; keep to plain Markdown")
+    return max(1.0 - 0.5 * len(problems), 0.0), problems
+
+
+def check_characters(lint: LintInput) -> Tuple[float, List[str]]:
+    symbols = sum(1 for char in lint.text if unicodedata.category(char) in ("So", "Co"))
+    if not symbols:
+        return 1.0, []
+    return max(1.0 - symbols / 10, 0.0), [
+        f"Replace {symbols} icon/emoji character(s) with plain text; ATS parsers drop them"
+    ]
+
+
+def check_bullets(lint: LintInput) -> Tuple[float, List[str]]:
+    markers = [match.group(1) for match in map(BULLET_MARKER.match, lint.lines) if match]
+    bullets = [bullet for section in lint.profile["sections"] for bullet in section["bullets"]]
+    issues = []
+    score = 1.0
+
+    if len(set(markers)) > 1:
+        issues.append(f"Use one bullet style throughout (found {' '.join(sorted(set(markers)))})")
+        score -= 0.3
+    long_bullets = [bullet for bullet in bullets if len(bullet.split()) > BULLET_MAX_WORDS]
+    if long_bullets:
+        issues.append(f"Shorten {len(long_bullets)} bullet(s) to under {BULLET_MAX_WORDS} words")
+        score -= min(0.4, 0.1 * len(long_bullets))
+    experience = [s for s in lint.profile["sections"] if _base_key(s) == "experience"]
+    if experience and not any(section["bullets"] for section in experience):
+        issues.append("List experience achievements as bullets")
+        score -= 0.3
+    return max(score, 0.0), issues
+
+
+def _date_style(date: str) -> Optional[str]:
+    """Style of one DATE_PATTERN endpoint, or None if it could be either."""
+    match = MONTH_YEAR.match(date)
+    if match:
+        month = match.group(1).lower()
+        if month == "may":
+            return None
+        return "Month YYYY" if month in FULL_MONTHS else "Mon YYYY"
+    if NUMERIC_DATE.match(date):
+        return "MM/YYYY"
+    if YEAR.match(date):
+        return "YYYY"
+    return None
+
+
+def check_dates(lint: LintInput) -> Tuple[float, List[str]]:
+    styles: Dict[str, int] = {}
+    for line in lint.lines:
+        for match in DATE_PATTERN.finditer(line):
+            for endpoint in DATE_RANGE_SEPARATOR.split(match.group(0)):
+                style = _date_style(endpoint.strip())
+                if style:
+                    styles[style] = styles.get(style, 0) + 1
+
+    total = sum(styles.values())
+    # A bare year (e.g. a graduation year) alongside another style is fine
+    ranged = {style: count for style, count in styles.items() if style != "YYYY"}
+    if total == 0 or len(ranged) <= 1:
+        return 1.0, []
+
+    dominant = max(ranged.values())
+    consistency = dominant / sum(ranged.values())
+    return consistency, [f"Use one date format throughout (found {', '.join(sorted(ranged))})"]
+
+
+def check_length(lint: LintInput) -> Tuple[float, List[str]]:
+    words = len(lint.text.split())
+    low, high = LENGTH_IDEAL_WORDS
+    tolerable_low, tolerable_high = LENGTH_TOLERABLE_WORDS
+    issues = []
+
+    if low <= words <= high:
+        score = 1.0
+    elif tolerable_low <= words <= tolerable_high:
+        score = 0.6
+    else:
+        score = 0.2
+    if words < low:
+        issues.append(f"Resume is short ({words} words); aim for {low}-{high}")
+    elif words > high:
+        issues.append(f"Resume is long ({words} words); aim for {low}-{high}")
+
+    pages = (lint.layout or {}).get("pages", 0)
+    if pages > MAX_PAGES:
+        issues.append(f"Keep the resume to {MAX_PAGES} pages (it has {pages})")
+        score = min(score, 0.4)
+    return score, issues
+
+
+RULES = (
+    LintRule("headings", "ats", 2.0, check_headings),
+    LintRule("contact", "ats", 2.0, check_contact),
+    LintRule("layout", "ats", 2.0, check_layout),
+    LintRule("characters", "ats", 1.0, check_characters),
+    LintRule("bullets", "formatting", 2.0, check_bullets),
+    LintRule("dates", "formatting", 1.5, check_dates),
+    LintRule("length", "formatting", 1.5, check_length),
+)
+
+
+def lint_resume(text: str, layout: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run every rule over a resume.
+
+    Args:
+        text: Resume Markdown or extracted text
+        layout: Result of utils.inspect_pdf when the resume came from a PDF
+
+    Returns:
+        Dict with 'ats_score' and 'formatting_score' (0-10), 'rules'
+        (per-rule score and issues) and 'issues' (all issues in rule order)
+    """
+    lint = LintInput(text=text, lines=text.split('\n'), profile=parse_resume_profile(text), layout=layout)
+
+    rules: List[Dict[str, Any]] = []
+    totals: Dict[str, List[float]] = {}
+    for rule in RULES:
+        score, issues = rule.check(lint)
+        rules.append({"id": rule.id, "dimension": rule.dimension, "score": round(score, 3), "issues": issues})
+        weighted, weights = totals.get(rule.dimension, [0.0, 0.0])
+        totals[rule.dimension] = [weighted + rule.weight * score, weights + rule.weight]
+
+    result: Dict[str, Any] = {
+        f"{dimension}_score": round(10 * weighted / weights, 1)
+        for dimension, (weighted, weights) in totals.items()
+    }
+    result["rules"] = rules
+    result["issues"] = [issue for rule in rules for issue in rule["issues"]]
+    return result
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def apply_lint(critique: Dict[str, Any], lint: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge lint results into an LLM critique.
+
+    formatting_score comes from the linter alone; ats_score is blended
+    (ATS_LINT_WEIGHT from the linter) and overall_score becomes the mean of
+    the four dimensions. Lint issues are added to improvements_needed,
+    prefixed with GENERAL_FEEDBACK_PREFIX so section redrafts treat them as
+    general notes rather than routing them to the sections they name.
+
+    Args:
+        critique: Critique from the model (without formatting_score)
+        lint: Result of lint_resume
+
+    Returns:
+        The updated critique
+    """
+    critique = dict(critique)
+    critique["formatting_score"] = lint["formatting_score"]
+
+    llm_ats = _number(critique.get("ats_score"))
+    if llm_ats is not None:
+        critique["ats_score"] = round(ATS_LINT_WEIGHT * lint["ats_score"] + (1 - ATS_LINT_WEIGHT) * llm_ats, 1)
+    else:
+        critique["ats_score"] = lint["ats_score"]
+
+    dimensions = [critique["ats_score"], critique["formatting_score"]]
+    dimensions += [
+        score for score in (_number(critique.get(key)) for key in ("keyword_score", "experience_score"))
+        if score is not None
+    ]
+    overall = _number(critique.get("overall_score"))
+    if len(dimensions) == 2 and overall is not None:
+        # The model only gave an overall score; let it stand for the other two
+        dimensions += [overall, overall]
+    critique["overall_score"] = round(sum(dimensions) / len(dimensions), 1)
+
+    critique["improvements_needed"] = list(critique.get("improvements_needed") or []) + [
+        f"{GENERAL_FEEDBACK_PREFIX}: {issue}" for issue in lint["issues"]
+    ]
+    critique["lint"] = {key: lint[key] for key in ("ats_score", "formatting_score", "rules")}
+    return critique
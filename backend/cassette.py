@@ -0,0 +1,188 @@
+"""
+Record/replay of LLM interactions for offline benchmarks and regression runs.
+
+In record mode every reply returned by call_llm_with_retry is appended to a
+JSONL cassette (gzip if the path ends in .gz), keyed by a hash of the
+normalized request. In replay mode replies come from the cassette instead
+of the API, so parsing, database writes and rendering can be profiled on
+real traffic shapes without a model. Repeated identical requests replay
+their recorded replies in order, cycling when they run out.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# "off", "record" or "replay"
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", "off").lower()
+LLM_CASSETTE_PATH = os.getenv(
+    "LLM_CASSETTE_PATH", str(Path(__file__).parent.parent / "data" / "cassettes" / "llm.jsonl")
+)
+# Replay delay: "none", "recorded" (the original call's duration) or seconds
+LLM_CASSETTE_LATENCY = os.getenv("LLM_CASSETTE_LATENCY", "none").lower()
+
+WHITESPACE = re.compile(r'\s+')
+
+
+class CassetteMissError(Exception):
+    """A replayed request has no recorded reply."""
+
+
+def request_key(
+    node: str,
+    messages: Sequence[Dict[str, str]],
+    required_keys: Optional[Sequence[str]] = None,
+    temperature: Optional[float] = None
+) -> str:
+    """
+    Hash of a request, ignoring whitespace differences.
+
+    Model and endpoint are left out so a cassette still replays after
+    routing changes. The requested temperature is kept: best-of-n drafting
+    sends the same prompt at several temperatures for different replies.
+
+    Args:
+        node: Calling node
+        messages: Chat messages
+        required_keys: Structured-output keys, if any
+        temperature: Temperature the caller asked for
+
+    Returns:
+        Hex digest identifying the request
+    """
+    normalized = {
+        "node": node,
+        "messages": [
+            [m.get("role", ""), WHITESPACE.sub(" ", m.get("content", "")).strip()]
+            for m in messages
+        ],
+        "required_keys": list(required_keys or ()),
+        "temperature": None if temperature is None else round(temperature, 3),
+    }
+    encoded = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def _open(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """Recorded replies of one cassette file."""
+
+    def __init__(self, path: Path, mode: str, latency: str = "none"):
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.positions: Dict[str, int] = {}
+
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _load(self):
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        with _open(self.path, "r") as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries.setdefault(entry["key"], []).append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.entries.values())
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, key: str, node: str, model: Optional[str], response: str, seconds: float):
+        """Append one reply to the cassette."""
+        line = json.dumps({
+            "key": key,
+            "node": node,
+            "model": model,
+            "seconds": round(seconds, 3),
+            "response": response,
+        }, ensure_ascii=False)
+        with self.lock:
+            with _open(self.path, "a") as file:
+                file.write(line + "\n")
+
+    def replay(self, key: str) -> Dict[str, Any]:
+        """
+        Next recorded reply for a request, after the configured delay.
+
+        Returns:
+            Entry with 'response', 'model' and 'seconds'
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        with self.lock:
+            entries = self.entries.get(key)
+            if not entries:
+                raise CassetteMissError(f"No recorded reply for request {key} in {self.path}")
+            position = self.positions.get(key, 0)
+            self.positions[key] = position + 1
+            entry = entries[position % len(entries)]
+
+        if self.latency == "recorded":
+            time.sleep(entry.get("seconds", 0))
+        elif self.latency not in ("none", "0", ""):
+            time.sleep(float(self.latency))
+        return entry
+
+
+_cassette: Optional[Cassette] = None
+_configured = False
+_cassette_lock = threading.Lock()
+
+
+def _build(mode: str, path: Optional[str], latency: Optional[str]) -> Optional[Cassette]:
+    if mode not in ("off", "record", "replay"):
+        raise ValueError(f"Unknown cassette mode: {mode}")
+    if mode == "off":
+        return None
+    return Cassette(Path(path or LLM_CASSETTE_PATH), mode, latency or LLM_CASSETTE_LATENCY)
+
+
+def configure_cassette(mode: str, path: Optional[str] = None, latency: Optional[str] = None) -> Optional[Cassette]:
+    """
+    Switch the process-wide cassette (e.g. from the CLI or a benchmark).
+
+    Args:
+        mode: "off", "record" or "replay"
+        path: Cassette file (defaults to LLM_CASSETTE_PATH)
+        latency: Replay delay (defaults to LLM_CASSETTE_LATENCY)
+
+    Returns:
+        The active cassette, or None when off
+    """
+    global _cassette, _configured
+    cassette = _build(mode, path, latency)
+    with _cassette_lock:
+        _cassette = cassette
+        _configured = True
+    return cassette
+
+
+def get_cassette() -> Optional[Cassette]:
+    """Active cassette, created from the LLM_CASSETTE_* settings on first use."""
+    global _cassette, _configured
+    with _cassette_lock:
+        if not _configured:
+            _cassette = _build(LLM_CASSETTE_MODE, None, None)
+            _configured = True
+        return _cassette
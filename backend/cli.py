@@ -0,0 +1,327 @@
+"""
+Command-line interface for running the optimizer without the Streamlit UI.
+
+Usage:
+    resume-optimizer evaluate --resume resume.pdf --jd job.txt [--json] [--save-state state.json]
+    resume-optimizer generate --state state.json [--mode best_of_n] [--formats md,pdf,docx]
+    resume-optimizer generate --resume resume.md --jd - < job.txt --json
+    resume-optimizer export resume.md --formats pdf,docx --output-dir out/
+    resume-optimizer match --resume resume.md [--k 5]
+    resume-optimizer serve [--host 0.0.0.0] [--port 8080]
+    resume-optimizer --cassette-mode record --cassette run.jsonl evaluate ...
+    resume-optimizer --cassette-mode replay --cassette run.jsonl evaluate ...
+    resume-optimizer --events events.ndjson generate --state state.json
+
+Any input path may be '-' to read from stdin. Progress goes to stderr, so
+stdout carries only the result (Markdown, or JSON with --json).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.state import ResumeState
+from backend.utils import inspect_pdf, parse_pdf, parse_text_file
+
+
+def read_input(path: str) -> str:
+    """
+    Read a resume or job description from a file or stdin.
+
+    Args:
+        path: File path ('.pdf', '.md', '.txt', ...) or '-' for stdin
+
+    Returns:
+        Document text
+    """
+    if path == "-":
+        return sys.stdin.read()
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise ValueError(f"File not found: {path}")
+    if file_path.suffix.lower() == ".pdf":
+        return parse_pdf(file_path)
+    return parse_text_file(file_path)
+
+
+def _report_progress(quiet: bool):
+    if quiet:
+        return None
+    return lambda percent, stage: print(f"[{percent:3d}%] {stage}", file=sys.stderr)
+
+
+def _write_json(data: Any, path: Optional[str] = None):
+    text = json.dumps(data, indent=2, default=str)
+    if path and path != "-":
+        Path(path).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+def _evaluate(args) -> ResumeState:
+    """Build the initial state from --resume/--jd and run the evaluation."""
+    from backend.pipeline import build_initial_state, run_evaluation
+
+    if args.resume == "-" and args.jd == "-":
+        raise ValueError("Only one of --resume and --jd can read from stdin")
+
+    resume = read_input(args.resume)
+    if args.jd_text:
+        jd, jd_source = args.jd_text, "pasted_text"
+    elif args.jd:
+        jd, jd_source = read_input(args.jd), "stdin" if args.jd == "-" else Path(args.jd).name
+    else:
+        raise ValueError("Provide a job description with --jd or --jd-text")
+
+    resume_name = "stdin" if args.resume == "-" else Path(args.resume).name
+    layout = inspect_pdf(Path(args.resume)) if resume_name.lower().endswith(".pdf") else None
+    state = build_initial_state(resume, resume_name, jd, jd_source, layout)
+    return run_evaluation(state, progress=_report_progress(args.json))
+
+
+def _print_scores(critique: Dict[str, Any]):
+    print(f"Overall score: {critique.get('overall_score', 0)}/10", file=sys.stderr)
+    for key in ("keyword_score", "experience_score", "ats_score", "formatting_score"):
+        label = key.replace("_score", "").title()
+        print(f"  {label}: {critique.get(key, 0)}/10", file=sys.stderr)
+
+
+def cmd_evaluate(args) -> int:
+    """Score a resume and print suggestions."""
+    state = _evaluate(args)
+
+    if args.save_state:
+        _write_json(state, args.save_state)
+
+    if args.json:
+        _write_json({
+            "jd_analysis": state.get("jd_analysis"),
+            "critique": state.get("critique"),
+            "keyword_coverage": state.get("keyword_coverage"),
+            "suggestions": state.get("suggestions"),
+            "error": state.get("error"),
+        })
+    else:
+        _print_scores(state.get("critique", {}))
+        coverage = state.get("keyword_coverage")
+        if coverage:
+            print(f"Keyword coverage: {coverage['coverage']:.0%}", file=sys.stderr)
+            if coverage["missing"]:
+                print(f"  Missing: {', '.join(coverage['missing'])}", file=sys.stderr)
+        for suggestion in state.get("suggestions", []):
+            print(f"- {suggestion.get('category', 'General')}: {suggestion.get('suggestion', '')}")
+
+    return 1 if state.get("error") else 0
+
+
+def cmd_generate(args) -> int:
+    """Produce the tailored resume, from a saved evaluation or from scratch."""
+    from backend.database import init_database
+    from backend.pipeline import run_generation
+
+    init_database()
+
+    if args.state:
+        state = json.loads(read_input(args.state))
+    else:
+        state = _evaluate(args)
+
+    state = run_generation(state, progress=_report_progress(args.json), mode=args.mode)
+
+    paths: Dict[str, Optional[str]] = {
+        "md": state.get("output_markdown_path"),
+        "pdf": state.get("output_pdf_path"),
+    }
+    extra_formats = [fmt for fmt in args.formats if fmt not in paths]
+    if args.output_dir or extra_formats:
+        from backend.exporters import export_document
+
+        output_dir = Path(args.output_dir) if args.output_dir else None
+        formats = args.formats if args.output_dir else extra_formats
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        name = Path(paths["md"]).stem if paths["md"] else "resume"
+        exported = export_document(state["final_resume"], name, formats, output_dir)
+        paths.update({fmt: str(path) if path else None for fmt, path in exported.items()})
+
+    if args.json:
+        _write_json({
+            "generation_id": state.get("generation_id"),
+            "final_resume": state.get("final_resume"),
+            "critique": state.get("critique"),
+            "initial_critique": state.get("initial_critique"),
+            "paths": paths,
+            "error": state.get("error"),
+        })
+    else:
+        _print_scores(state.get("critique", {}))
+        for fmt, path in paths.items():
+            if path:
+                print(f"Saved {fmt}: {path}", file=sys.stderr)
+        print(state.get("final_resume", ""))
+
+    return 1 if state.get("error") else 0
+
+
+def cmd_export(args) -> int:
+    """Render an existing Markdown resume to other formats."""
+    from backend.exporters import export_document
+
+    content = read_input(args.input)
+    name = args.name or ("resume" if args.input == "-" else Path(args.input).stem)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = export_document(content, name, args.formats, output_dir)
+    result = {fmt: str(path) if path else None for fmt, path in paths.items()}
+
+    if args.json:
+        _write_json(result)
+    else:
+        for fmt, path in result.items():
+            print(f"{fmt}: {path or 'failed'}")
+
+    return 0 if all(result.values()) else 1
+
+
+def cmd_match(args) -> int:
+    """List stored job postings that best match a resume."""
+    from backend.database import init_database
+    from backend.jd_index import find_matching_postings
+
+    init_database()
+    matches = find_matching_postings(read_input(args.resume), args.k)
+
+    if args.json:
+        _write_json(matches)
+    else:
+        for match in matches:
+            terms = ", ".join(match["matched_terms"][:8])
+            print(f"{match['score']:7.2f}  #{match['generation_id']}  "
+                  f"{match['job_title']} @ {match['company']}  ({terms})")
+
+    return 0
+
+
+def cmd_serve(args) -> int:
+    """Run the HTTP service."""
+    from backend.service import serve
+
+    serve(args.host, args.port)
+    return 0
+
+
+def _formats(value: str) -> List[str]:
+    return [fmt.strip() for fmt in value.split(",") if fmt.strip()]
+
+
+def _add_input_arguments(parser: argparse.ArgumentParser, required: bool):
+    parser.add_argument("--resume", required=required, help="Resume file (.pdf/.md/.txt) or '-' for stdin")
+    parser.add_argument("--jd", help="Job description file or '-' for stdin")
+    parser.add_argument("--jd-text", help="Job description text")
+
+
+def run_with_events(args: argparse.Namespace) -> int:
+    """Run a command's handler, writing each pipeline event as a JSON line to args.events."""
+    import threading
+    from backend.events import subscribe
+
+    output = sys.stderr if args.events == "-" else open(args.events, "w", encoding="utf-8")
+    lock = threading.Lock()
+
+    def write_event(event: Dict[str, Any]):
+        line = json.dumps(event, default=str)
+        with lock:
+            output.write(line + "\n")
+            output.flush()
+
+    try:
+        with subscribe(write_event):
+            code: int = args.handler(args)
+        return code
+    finally:
+        if output is not sys.stderr:
+            output.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="resume-optimizer",
+        description="Evaluate and tailor resumes against a job description."
+    )
+    parser.add_argument("--cassette-mode", choices=["off", "record", "replay"],
+                        help="Record LLM replies to, or replay them from, a cassette")
+    parser.add_argument("--cassette", help="Cassette file (defaults to LLM_CASSETTE_PATH)")
+    parser.add_argument("--cassette-latency",
+                        help="Replay delay: 'none', 'recorded' or seconds")
+    parser.add_argument("--events",
+                        help="Write pipeline events (node start/end, tokens) as JSON lines here ('-' for stderr)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    evaluate = subparsers.add_parser("evaluate", help="Score a resume and suggest improvements")
+    _add_input_arguments(evaluate, required=True)
+    evaluate.add_argument("--save-state", help="Write the evaluation state for 'generate --state'")
+    evaluate.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    evaluate.set_defaults(handler=cmd_evaluate)
+
+    generate = subparsers.add_parser("generate", help="Create the tailored resume")
+    generate.add_argument("--state", help="Evaluation state from 'evaluate --save-state' ('-' for stdin)")
+    _add_input_arguments(generate, required=False)
+    generate.add_argument("--mode", choices=["single", "iterative", "best_of_n"],
+                          help="Drafting mode (defaults to DRAFT_MODE)")
+    generate.add_argument("--formats", type=_formats, default=["md", "pdf"],
+                          help="Comma-separated export formats (md,pdf,docx,html)")
+    generate.add_argument("--output-dir", help="Also write the exports here")
+    generate.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    generate.set_defaults(handler=cmd_generate)
+
+    export = subparsers.add_parser("export", help="Render a Markdown resume to other formats")
+    export.add_argument("input", help="Markdown file or '-' for stdin")
+    export.add_argument("--formats", type=_formats, default=["pdf"],
+                        help="Comma-separated export formats (md,pdf,docx,html)")
+    export.add_argument("--output-dir", default=".", help="Directory for the exported files")
+    export.add_argument("--name", help="Base filename (defaults to the input's name)")
+    export.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    export.set_defaults(handler=cmd_export)
+
+    match = subparsers.add_parser("match", help="Rank past job postings against a resume")
+    match.add_argument("--resume", required=True, help="Resume file or '-' for stdin")
+    match.add_argument("--k", type=int, default=5, help="Number of postings to return")
+    match.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    match.set_defaults(handler=cmd_match)
+
+    serve = subparsers.add_parser("serve", help="Run the HTTP service")
+    serve.add_argument("--host", help="Interface to bind (defaults to SERVICE_HOST)")
+    serve.add_argument("--port", type=int, help="Port to bind (defaults to SERVICE_PORT)")
+    serve.set_defaults(handler=cmd_serve)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the resume-optimizer command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "generate" and not args.state and not args.resume:
+        parser.error("generate needs --state or --resume with --jd/--jd-text")
+
+    try:
+        if args.cassette_mode:
+            from backend.cassette import configure_cassette
+            configure_cassette(args.cassette_mode, args.cassette, args.cassette_latency)
+        if args.events:
+            return run_with_events(args)
+        code: int = args.handler(args)
+        return code
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
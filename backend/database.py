@@ -4,13 +4,25 @@ import sqlite3
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+
+from backend.metrics import timed_query
 
 # Database path
 DATA_DIR = Path(__file__).parent.parent / "data"
 DB_PATH = DATA_DIR / "career_sync.db"
 
 
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]):
+    """Add columns (name -> SQL type) that an existing table lacks."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+    for name, sql_type in columns.items():
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+
+
+@timed_query
 def init_database():
     """Initialize database schema."""
     conn = sqlite3.connect(DB_PATH)
@@ -43,11 +55,99 @@ def init_database():
         ON generations(timestamp DESC)
     """)
     
+    # Per-node traces for each generation
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS node_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            generation_id INTEGER NOT NULL REFERENCES generations(id) ON DELETE CASCADE,
+            node TEXT NOT NULL,
+            iteration INTEGER,
+            started_at TEXT,
+            wall_time REAL,
+            queue_time REAL,
+            llm_calls INTEGER,
+            failed_calls INTEGER,
+            attempts INTEGER,
+            prompt_tokens INTEGER,
+            completion_tokens INTEGER,
+            prompt_bytes INTEGER,
+            response_bytes INTEGER,
+            json_fallbacks INTEGER,
+            error TEXT
+        )
+    """)
+    
+    _add_missing_columns(cursor, "node_runs", {"failed_calls": "INTEGER"})
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_node_runs_generation 
+        ON node_runs(generation_id)
+    """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_node_runs_node_wall 
+        ON node_runs(node, wall_time DESC)
+    """)
+    
+    # Background pipeline jobs
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            status TEXT NOT NULL,
+            progress INTEGER DEFAULT 0,
+            stage TEXT,
+            input_state TEXT NOT NULL,
+            result TEXT,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT,
+            owner TEXT,
+            heartbeat_at TEXT
+        )
+    """)
+    
+    # Databases created before jobs recorded their worker
+    _add_missing_columns(cursor, "jobs", {"owner": "TEXT", "heartbeat_at": "TEXT"})
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_status 
+        ON jobs(status, created_at)
+    """)
+    
+    # UI session state, so any replica can continue a user's flow
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            token TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_updated 
+        ON sessions(updated_at)
+    """)
+    
+    # MinHash signatures of stored job descriptions (for near-duplicate reuse).
+    # Runs that failed or found nothing are signed but not reusable
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS jd_signatures (
+            generation_id INTEGER PRIMARY KEY,
+            signature BLOB NOT NULL,
+            reusable INTEGER NOT NULL DEFAULT 1,
+            FOREIGN KEY (generation_id) REFERENCES generations(id)
+        )
+    """)
+    _add_missing_columns(cursor, "jd_signatures", {"reusable": "INTEGER NOT NULL DEFAULT 1"})
+    
     conn.commit()
     conn.close()
 
 
-def save_generation(state: Dict[str, Any], output_paths: Dict[str, str]) -> int:
+@timed_query
+def save_generation(state: Mapping[str, Any], output_paths: Dict[str, str]) -> int:
     """
     Save generation to database.
     
@@ -95,17 +195,69 @@ def save_generation(state: Dict[str, Any], output_paths: Dict[str, str]) -> int:
         json.dumps(state.get("metadata", {}))
     ))
     
-    generation_id = cursor.lastrowid
+    # Always set after an INSERT; typed Optional by sqlite3
+    generation_id: int = cursor.lastrowid  # type: ignore[assignment]
+    
+    # Node traces recorded by backend.tracing
+    node_runs = state.get("metadata", {}).get("node_runs", [])
+    cursor.executemany("""
+        INSERT INTO node_runs (
+            generation_id, node, iteration, started_at, wall_time, queue_time,
+            llm_calls, failed_calls, attempts, prompt_tokens, completion_tokens,
+            prompt_bytes, response_bytes, json_fallbacks, error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (
+            generation_id,
+            run.get("node"),
+            run.get("iteration"),
+            run.get("started_at"),
+            run.get("wall_time"),
+            run.get("queue_time"),
+            run.get("llm_calls"),
+            run.get("failed_calls", 0),
+            run.get("attempts"),
+            run.get("prompt_tokens"),
+            run.get("completion_tokens"),
+            run.get("prompt_bytes"),
+            run.get("response_bytes"),
+            run.get("json_fallbacks"),
+            run.get("error"),
+        )
+        for run in node_runs
+    ])
+    
     conn.commit()
     conn.close()
     
+    # Keep the in-memory job description index current
+    from backend.jd_index import index_generation
+    index_generation(generation_id, jd_analysis, {
+        "job_title": jd_analysis.get("job_title", "Unknown"),
+        "company": jd_analysis.get("company", "Unknown"),
+        "timestamp": datetime.now().isoformat(),
+    })
+    
+    # Offer the analysis for reuse only if the run succeeded and it found something
+    from backend.minhash import index_job_description, is_reusable_analysis
+    index_job_description(
+        generation_id,
+        state.get("job_description", ""),
+        reusable=not state.get("error") and is_reusable_analysis(jd_analysis)
+    )
+    
     return generation_id
 
 
-def get_all_generations() -> List[Dict[str, Any]]:
+@timed_query
+def get_all_generations(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
     """
     Get all generations ordered by timestamp (newest first).
     
+    Args:
+        limit: Maximum number of rows (None for all)
+        offset: Rows to skip, for paging
+    
     Returns:
         List of generation dictionaries
     """
@@ -116,7 +268,8 @@ def get_all_generations() -> List[Dict[str, Any]]:
     cursor.execute("""
         SELECT * FROM generations 
         ORDER BY timestamp DESC
-    """)
+        LIMIT ? OFFSET ?
+    """, (-1 if limit is None else limit, offset))
     
     rows = cursor.fetchall()
     conn.close()
@@ -124,6 +277,7 @@ def get_all_generations() -> List[Dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+@timed_query
 def get_generation_by_id(generation_id: int) -> Optional[Dict[str, Any]]:
     """
     Get specific generation by ID.
@@ -145,10 +299,510 @@ def get_generation_by_id(generation_id: int) -> Optional[Dict[str, Any]]:
     return dict(row) if row else None
 
 
+@timed_query
+def get_jd_analyses() -> List[Dict[str, Any]]:
+    """
+    Get every generation's job description analysis, oldest first.
+    
+    Returns:
+        Dicts with id, job_title, company, timestamp and decoded jd_analysis
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT id, job_title, company, timestamp, jd_analysis
+        FROM generations
+        ORDER BY id
+    """)
+    
+    rows = []
+    for row in cursor.fetchall():
+        entry = dict(row)
+        try:
+            entry["jd_analysis"] = json.loads(entry["jd_analysis"] or "{}")
+        except json.JSONDecodeError:
+            entry["jd_analysis"] = {}
+        rows.append(entry)
+    
+    conn.close()
+    return rows
+
+
+@timed_query
+def save_jd_signature(generation_id: int, signature: bytes, reusable: bool = True):
+    """Store (or replace) the MinHash signature of a generation's job description."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "INSERT OR REPLACE INTO jd_signatures (generation_id, signature, reusable) VALUES (?, ?, ?)",
+        (generation_id, signature, int(reusable))
+    )
+    
+    conn.commit()
+    conn.close()
+
+
+@timed_query
+def get_jd_signatures() -> List[Tuple[int, bytes]]:
+    """
+    Get the stored signatures of job descriptions whose analysis is reusable.
+    
+    Returns:
+        List of (generation_id, signature bytes)
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    cursor.execute(
+        "SELECT generation_id, signature FROM jd_signatures WHERE reusable = 1 ORDER BY generation_id"
+    )
+    rows = cursor.fetchall()
+    conn.close()
+    
+    return rows
+
+
+@timed_query
+def get_unsigned_job_descriptions() -> List[Tuple[int, str, str]]:
+    """
+    Get job descriptions of generations saved without a signature.
+    
+    Returns:
+        List of (generation_id, job_description, jd_analysis JSON)
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT g.id, g.job_description, g.jd_analysis
+        FROM generations g
+        LEFT JOIN jd_signatures s ON s.generation_id = g.id
+        WHERE s.generation_id IS NULL
+        ORDER BY g.id
+    """)
+    rows = cursor.fetchall()
+    conn.close()
+    
+    return [(generation_id, text or "", analysis or "") for generation_id, text, analysis in rows]
+
+
+@timed_query
 def delete_generation(generation_id: int):
-    """Delete a generation from database."""
+    """Delete a generation from database along with its output files."""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
+    
+    cursor.execute(
+        "SELECT markdown_path, pdf_path FROM generations WHERE id = ?",
+        (generation_id,)
+    )
+    row = cursor.fetchone()
+    
+    cursor.execute("DELETE FROM node_runs WHERE generation_id = ?", (generation_id,))
+    cursor.execute("DELETE FROM jd_signatures WHERE generation_id = ?", (generation_id,))
     cursor.execute("DELETE FROM generations WHERE id = ?", (generation_id,))
     conn.commit()
-    conn.close()
\ No newline at end of file
+    conn.close()
+    
+    # Remove rendered files so they are not left orphaned
+    for path in (row or ()):
+        if path:
+            Path(path).unlink(missing_ok=True)
+    
+    from backend.jd_index import unindex_generation
+    from backend.minhash import unindex_job_description
+    unindex_generation(generation_id)
+    unindex_job_description(generation_id)
+
+
+@timed_query
+def get_artifact_references() -> List[Dict[str, Any]]:
+    """
+    Get the output file paths recorded for every generation.
+    
+    Returns:
+        List of dicts with 'id', 'markdown_path' and 'pdf_path'
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    cursor.execute("SELECT id, markdown_path, pdf_path FROM generations")
+    rows = cursor.fetchall()
+    conn.close()
+    
+    return [dict(row) for row in rows]
+
+
+@timed_query
+def update_artifact_paths(generation_id: int, markdown_path: str, pdf_path: str):
+    """Record regenerated output file paths for a generation."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE generations SET markdown_path = ?, pdf_path = ? WHERE id = ?",
+        (markdown_path, pdf_path, generation_id)
+    )
+    conn.commit()
+    conn.close()
+
+
+# ===== NODE TRACES =====
+
+
+@timed_query
+def get_node_runs(generation_id: int) -> List[Dict[str, Any]]:
+    """Get a generation's node runs in execution order."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT * FROM node_runs WHERE generation_id = ? ORDER BY id",
+        (generation_id,)
+    )
+    rows = cursor.fetchall()
+    conn.close()
+    return [dict(row) for row in rows]
+
+
+@timed_query
+def get_slowest_node_runs(limit: int = 20, node: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get the slowest node runs across all generations.
+    
+    Args:
+        limit: Maximum rows to return
+        node: Only consider this node (all nodes if None)
+        
+    Returns:
+        Node runs ordered by wall time, slowest first, with job title and company
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    query = """
+        SELECT r.*, g.job_title, g.company, g.timestamp
+        FROM node_runs r JOIN generations g ON g.id = r.generation_id
+    """
+    params: list = []
+    if node:
+        query += " WHERE r.node = ?"
+        params.append(node)
+    query += " ORDER BY r.wall_time DESC LIMIT ?"
+    params.append(limit)
+    
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    conn.close()
+    return [dict(row) for row in rows]
+
+
+@timed_query
+def get_node_latency_summary() -> List[Dict[str, Any]]:
+    """
+    Aggregate latency, token and retry statistics per node.
+    
+    Returns:
+        One row per node with count, avg/p95/max wall time, avg queue time,
+        avg tokens, total attempts and JSON fallbacks, slowest average first
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT node,
+               COUNT(*) AS runs,
+               AVG(wall_time) AS avg_wall_time,
+               MAX(wall_time) AS max_wall_time,
+               AVG(queue_time) AS avg_queue_time,
+               AVG(prompt_tokens) AS avg_prompt_tokens,
+               AVG(completion_tokens) AS avg_completion_tokens,
+               SUM(attempts) - SUM(llm_calls) AS retries,
+               SUM(json_fallbacks) AS json_fallbacks,
+               SUM(error IS NOT NULL) AS errors
+        FROM node_runs
+        GROUP BY node
+        ORDER BY avg_wall_time DESC
+    """)
+    summary = [dict(row) for row in cursor.fetchall()]
+    
+    # SQLite has no percentile aggregate; compute p95 from sorted wall times
+    for row in summary:
+        cursor.execute(
+            "SELECT wall_time FROM node_runs WHERE node = ? ORDER BY wall_time",
+            (row["node"],)
+        )
+        times = [r[0] for r in cursor.fetchall()]
+        row["p95_wall_time"] = times[min(len(times) - 1, int(len(times) * 0.95))]
+    
+    conn.close()
+    return summary
+
+
+# ===== JOBS =====
+
+
+@timed_query
+def create_job(job_id: str, kind: str, input_state: Mapping[str, Any]):
+    """Insert a queued job."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO jobs (id, kind, status, progress, input_state, created_at)
+        VALUES (?, ?, 'queued', 0, ?, ?)
+    """, (job_id, kind, json.dumps(input_state), datetime.now().isoformat()))
+    conn.commit()
+    conn.close()
+
+
+@timed_query
+def claim_job(job_id: str, owner: str) -> bool:
+    """
+    Atomically move a queued job to running.
+    
+    Args:
+        job_id: Job ID
+        owner: Worker claiming it (kept alive with heartbeat_jobs)
+    
+    Returns:
+        True if this caller claimed the job, False if someone else did
+    """
+    now = datetime.now().isoformat()
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE jobs SET status = 'running', started_at = ?, owner = ?, heartbeat_at = ?
+        WHERE id = ? AND status = 'queued'
+    """, (now, owner, now, job_id))
+    claimed = cursor.rowcount == 1
+    conn.commit()
+    conn.close()
+    return claimed
+
+
+@timed_query
+def update_job_progress(job_id: str, owner: str, progress: int, stage: str,
+                        partial: Optional[Dict[str, Any]] = None):
+    """
+    Record the current stage of a running job.
+
+    Args:
+        job_id: Job ID
+        owner: Worker running it; nothing is written once the job was requeued
+        progress: Percent complete
+        stage: Current stage
+        partial: Results so far, kept in the result column until the job finishes
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    if partial is None:
+        cursor.execute(
+            "UPDATE jobs SET progress = ?, stage = ? WHERE id = ? AND owner = ?",
+            (progress, stage, job_id, owner)
+        )
+    else:
+        cursor.execute(
+            "UPDATE jobs SET progress = ?, stage = ?, result = ? WHERE id = ? AND owner = ?",
+            (progress, stage, json.dumps(partial, default=str), job_id, owner)
+        )
+    conn.commit()
+    conn.close()
+
+
+@timed_query
+def finish_job(job_id: str, owner: str, result: Optional[Mapping[str, Any]] = None,
+               error: Optional[str] = None) -> bool:
+    """
+    Mark a job as done (with result) or failed (with error).
+    
+    Args:
+        job_id: Job ID
+        owner: Worker that ran it
+        result: Final state
+        error: Failure message
+    
+    Returns:
+        True if the job was finished, False if it was requeued and is no
+        longer this owner's
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE jobs SET status = ?, progress = ?, result = ?, error = ?, finished_at = ?
+        WHERE id = ? AND owner = ?
+    """, (
+        "failed" if error else "done",
+        100,
+        json.dumps(result) if result is not None else None,
+        error,
+        datetime.now().isoformat(),
+        job_id,
+        owner
+    ))
+    finished = cursor.rowcount == 1
+    conn.commit()
+    conn.close()
+    return finished
+
+
+@timed_query
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a job by ID with its input state and result decoded.
+    
+    Args:
+        job_id: Job ID
+        
+    Returns:
+        Job dictionary or None
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+    row = cursor.fetchone()
+    conn.close()
+    
+    if not row:
+        return None
+    
+    job = dict(row)
+    job["input_state"] = json.loads(job["input_state"])
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    return job
+
+
+@timed_query
+def get_job_ids_by_status(statuses: List[str]) -> List[str]:
+    """Get IDs of jobs in the given statuses, oldest first."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    placeholders = ", ".join("?" for _ in statuses)
+    cursor.execute(
+        f"SELECT id FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+        statuses
+    )
+    rows = cursor.fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+@timed_query
+def heartbeat_jobs(owner: str) -> int:
+    """
+    Mark an owner's running jobs as still alive.
+    
+    Returns:
+        Number of jobs touched
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running'",
+        (datetime.now().isoformat(), owner)
+    )
+    touched = cursor.rowcount
+    conn.commit()
+    conn.close()
+    return touched
+
+
+@timed_query
+def requeue_stale_jobs(cutoff: str) -> List[str]:
+    """
+    Put running jobs whose owner stopped sending heartbeats back in the queue.
+    
+    Args:
+        cutoff: ISO timestamp; jobs last seen before it are requeued
+        
+    Returns:
+        IDs of the requeued jobs
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT id FROM jobs
+        WHERE status = 'running' AND (heartbeat_at IS NULL OR heartbeat_at < ?)
+        ORDER BY created_at
+    """, (cutoff,))
+    requeued = []
+    for (job_id,) in cursor.fetchall():
+        # Re-check, in case the owner sent a heartbeat or another process got here first
+        cursor.execute("""
+            UPDATE jobs SET status = 'queued', progress = 0, stage = NULL, result = NULL,
+                owner = NULL, heartbeat_at = NULL
+            WHERE id = ? AND status = 'running' AND (heartbeat_at IS NULL OR heartbeat_at < ?)
+        """, (job_id, cutoff))
+        if cursor.rowcount == 1:
+            requeued.append(job_id)
+    conn.commit()
+    conn.close()
+    return requeued
+
+
+@timed_query
+def save_session(token: str, data: Dict[str, Any]):
+    """Store (or replace) a UI session's state."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT OR REPLACE INTO sessions (token, data, updated_at) VALUES (?, ?, ?)",
+        (token, json.dumps(data, default=str), datetime.now().isoformat())
+    )
+    conn.commit()
+    conn.close()
+
+
+@timed_query
+def get_session(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a UI session's state.
+    
+    Args:
+        token: Session token
+        
+    Returns:
+        Session data or None
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("SELECT data FROM sessions WHERE token = ?", (token,))
+    row = cursor.fetchone()
+    conn.close()
+    
+    return json.loads(row[0]) if row else None
+
+
+@timed_query
+def delete_session(token: str):
+    """Forget a UI session."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM sessions WHERE token = ?", (token,))
+    conn.commit()
+    conn.close()
+
+
+@timed_query
+def delete_sessions_before(cutoff: str) -> int:
+    """
+    Delete sessions not updated since cutoff.
+    
+    Args:
+        cutoff: ISO timestamp
+        
+    Returns:
+        Number of sessions deleted
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM sessions WHERE updated_at < ?", (cutoff,))
+    deleted = cursor.rowcount
+    conn.commit()
+    conn.close()
+    return deleted
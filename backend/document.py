@@ -0,0 +1,139 @@
+"""Parsed document model for generated resume Markdown."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from backend.metrics import register_lru_cache
+
+# Block kinds produced by the parser
+TITLE = "title"
+HEADING = "heading"
+SUBHEADING = "subheading"
+BULLET = "bullet"
+PARAGRAPH = "paragraph"
+SPACER = "spacer"
+
+# Inline markdown: **bold**, *italic*, `code`, [text](url)
+INLINE_PATTERN = re.compile(
+    r'\*\*(?P<bold>.+?)\*\*'
+    r'|\*(?P<italic>.+?)\*'
+    r'|`(?P<code>.+?)`'
+    r'|\[(?P<link>.+?)\]\((?P<href>.+?)\)'
+)
+
+# Number of parsed documents kept in memory
+DOCUMENT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Run:
+    """A span of inline text with its formatting."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    href: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Block:
+    """A single block-level element of the resume."""
+
+    kind: str
+    runs: Tuple[Run, ...] = ()
+
+    @property
+    def text(self) -> str:
+        """Plain text with all inline markdown removed."""
+        return "".join(run.text for run in self.runs)
+
+
+@dataclass(frozen=True)
+class ResumeDocument:
+    """Resume parsed once from Markdown and shared by every exporter."""
+
+    source: str
+    blocks: Tuple[Block, ...]
+
+    @property
+    def title(self) -> str:
+        """Text of the first title block, or empty string."""
+        for block in self.blocks:
+            if block.kind == TITLE:
+                return block.text
+        return ""
+
+
+def parse_inline(text: str) -> Tuple[Run, ...]:
+    """
+    Split a line into formatted runs.
+
+    Args:
+        text: Line content without block markers
+
+    Returns:
+        Tuple of runs covering the whole line
+    """
+    runs = []
+    position = 0
+
+    for match in INLINE_PATTERN.finditer(text):
+        if match.start() > position:
+            runs.append(Run(text[position:match.start()]))
+
+        if match.group("bold") is not None:
+            runs.append(Run(match.group("bold"), bold=True))
+        elif match.group("italic") is not None:
+            runs.append(Run(match.group("italic"), italic=True))
+        elif match.group("code") is not None:
+            runs.append(Run(match.group("code"), code=True))
+        else:
+            runs.append(Run(match.group("link"), href=match.group("href")))
+
+        position = match.end()
+
+    if position < len(text):
+        runs.append(Run(text[position:]))
+
+    return tuple(runs)
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def parse_resume_markdown(content: str) -> ResumeDocument:
+    """
+    Parse resume Markdown into a document model.
+
+    Results are cached by content, so exporting one generation to several
+    formats parses it only once.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        Parsed ResumeDocument
+    """
+    blocks = []
+
+    for line in content.split('\n'):
+        line = line.strip()
+
+        if not line:
+            blocks.append(Block(SPACER))
+        elif line.startswith('# '):
+            blocks.append(Block(TITLE, parse_inline(line[2:].strip())))
+        elif line.startswith('## '):
+            blocks.append(Block(HEADING, parse_inline(line[3:].strip())))
+        elif line.startswith('### '):
+            blocks.append(Block(SUBHEADING, parse_inline(line[4:].strip())))
+        elif line.startswith('- ') or line.startswith('* '):
+            blocks.append(Block(BULLET, parse_inline(line[2:].strip())))
+        else:
+            blocks.append(Block(PARAGRAPH, parse_inline(line)))
+
+    return ResumeDocument(source=content, blocks=tuple(blocks))
+
+
+register_lru_cache("resume_document", parse_resume_markdown)
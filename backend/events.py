@@ -0,0 +1,147 @@
+"""
+Event bus for pipeline runs: node start/end with timings and partial
+results, LLM token deltas, and stage progress.
+
+Listeners subscribe for the current context (and the worker threads a
+node fans out to, which copy it), so concurrent pipelines never see each
+other's events. Token events only go to listeners that asked for the
+node's tokens; free-text replies are only streamed when one did. Event
+types:
+
+    stage       {"node": stage, "progress": percent}        A pipeline step starts
+    node_start  {"node", "iteration"}                        A traced node starts
+    token       {"node", "call", "delta"}                    Streamed reply text
+    node_end    {"node", "seconds", "run", "partial",        A node finished; partial holds
+                 "error"}                                    the state keys it changed
+    result      {"state"}                                    stream_pipeline() finished
+    error       {"error"}                                    stream_pipeline() failed
+
+Every event also carries "type" and "time" (Unix seconds).
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, Generator, Iterable, Mapping, Optional, Tuple
+
+Event = Dict[str, Any]
+Listener = Callable[[Event], None]
+
+# State keys never sent as partial results (bulky or internal)
+PARTIAL_EXCLUDED_KEYS = frozenset({"metadata", "resume_profile"})
+
+# Subscribed listeners with the nodes whose token events they get (None: all)
+_listeners: ContextVar[Tuple[Tuple[Listener, Optional[FrozenSet[str]]], ...]] = ContextVar(
+    "event_listeners", default=()
+)
+
+
+def listening() -> bool:
+    """Whether anyone subscribed in this context (skip building costly events otherwise)."""
+    return bool(_listeners.get())
+
+
+def wants_tokens(node: Optional[str]) -> bool:
+    """Whether a listener in this context gets the token events of a node."""
+    return any(nodes is None or node in nodes for _, nodes in _listeners.get())
+
+
+def emit(event_type: str, node: Optional[str] = None, **data: Any):
+    """
+    Send an event to this context's listeners.
+
+    A failing listener is reported and skipped; it never fails the pipeline.
+
+    Args:
+        event_type: One of the types listed in the module docstring
+        node: Node or stage the event concerns
+        **data: Event fields
+    """
+    listeners = _listeners.get()
+    if not listeners:
+        return
+
+    event = {"type": event_type, "node": node, "time": time.time(), **data}
+    for listener, token_nodes in listeners:
+        if event_type == "token" and token_nodes is not None and node not in token_nodes:
+            continue
+        try:
+            listener(event)
+        except Exception as e:
+            print(f"Event listener failed on {event_type}: {str(e)}")
+
+
+@contextmanager
+def subscribe(listener: Listener, token_nodes: Optional[Iterable[str]] = None):
+    """
+    Receive the events emitted in this context until the block exits.
+
+    Listeners are called from whichever thread emits (parallel drafts emit
+    concurrently), so they must be thread-safe.
+
+    Args:
+        listener: Called with each event dict
+        token_nodes: Nodes whose token events to receive (default: every node)
+    """
+    nodes = frozenset(token_nodes) if token_nodes is not None else None
+    token = _listeners.set(_listeners.get() + ((listener, nodes),))
+    try:
+        yield
+    finally:
+        _listeners.reset(token)
+
+
+def changed_keys(before: Mapping[str, Any], after: Mapping[str, Any]) -> Dict[str, Any]:
+    """State keys a node added or changed, minus PARTIAL_EXCLUDED_KEYS."""
+    return {
+        key: value for key, value in after.items()
+        if key not in PARTIAL_EXCLUDED_KEYS and before.get(key) != value
+    }
+
+
+def stream_pipeline(pipeline: Callable[..., Mapping[str, Any]], state: Mapping[str, Any],
+                    on_done: Optional[Callable[[], None]] = None,
+                    **kwargs: Any) -> Generator[Event, None, None]:
+    """
+    Start a pipeline on a background thread and return its events as they happen.
+
+    The pipeline starts right away and runs to the end whether or not the
+    events are read; closing the generator only stops reading them.
+
+    Args:
+        pipeline: run_evaluation, run_generation, ...
+        state: State to run it on
+        on_done: Called on the pipeline's thread once it has finished
+        **kwargs: Passed to the pipeline
+
+    Returns:
+        Generator of events, ending with a 'result' event (the final state)
+        or an 'error' event
+    """
+    events: "queue.Queue[Any]" = queue.Queue()
+    done = object()
+
+    def run():
+        try:
+            with subscribe(events.put):
+                try:
+                    result = pipeline(state, **kwargs)
+                    emit("result", state=result)
+                except Exception as e:
+                    emit("error", error=str(e))
+        finally:
+            events.put(done)
+            if on_done:
+                on_done()
+
+    def read() -> Generator[Event, None, None]:
+        while True:
+            event = events.get()
+            if event is done:
+                return
+            yield event
+
+    threading.Thread(target=run, daemon=True, name="pipeline-events").start()
+    return read()
@@ -0,0 +1,310 @@
+"""Pluggable exporters that render a parsed resume document to files."""
+
+import html
+import io
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.document import (
+    ResumeDocument,
+    parse_resume_markdown,
+    TITLE,
+    HEADING,
+    SUBHEADING,
+    BULLET,
+    SPACER,
+)
+from backend.metrics import RENDER_DURATION
+from backend.utils import OUTPUTS_DIR
+
+# Renderer signature: (document, binary stream) -> None
+Renderer = Callable[[ResumeDocument, BinaryIO], None]
+
+# Registered exporters: format -> (file extension, renderer)
+EXPORTERS: Dict[str, Tuple[str, Renderer]] = {}
+
+
+def register_exporter(fmt: str, extension: str):
+    """
+    Register a renderer for an export format.
+
+    Args:
+        fmt: Format name used by callers (e.g. 'pdf')
+        extension: File extension including the dot
+
+    Returns:
+        Decorator registering the renderer
+    """
+    def decorator(renderer: Renderer) -> Renderer:
+        EXPORTERS[fmt] = (extension, renderer)
+        return renderer
+    return decorator
+
+
+@register_exporter("md", ".md")
+def render_markdown(document: ResumeDocument, stream: BinaryIO):
+    """Write the original Markdown source."""
+    stream.write(document.source.encode('utf-8'))
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> Dict[str, object]:
+    """Build ReportLab paragraph styles once per process."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+
+    styles = getSampleStyleSheet()
+
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor='#34495e',
+        spaceAfter=6,
+        spaceBefore=12,
+    )
+
+    return {
+        TITLE: ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor='#2c3e50',
+            spaceAfter=12,
+            alignment=TA_CENTER,
+        ),
+        HEADING: heading_style,
+        SUBHEADING: ParagraphStyle(
+            'Heading3',
+            parent=heading_style,
+            fontSize=12,
+        ),
+        "normal": ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14,
+            textColor='#333333',
+        ),
+    }
+
+
+@register_exporter("pdf", ".pdf")
+def render_pdf(document: ResumeDocument, stream: BinaryIO):
+    """Render the document to PDF with ReportLab."""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+    except ImportError:
+        raise ImportError(
+            "ReportLab not installed. Install with:\n"
+            "pip install reportlab\n"
+            "Or skip PDF generation and use Markdown download only."
+        )
+
+    doc = SimpleDocTemplate(
+        stream,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+    )
+
+    styles = _pdf_styles()
+    story = []
+
+    for block in document.blocks:
+        if block.kind == SPACER:
+            story.append(Spacer(1, 0.2 * inch))
+            continue
+
+        # Escape text so ReportLab's markup parser never sees raw '<' or '&'
+        text = html.escape(block.text, quote=False)
+
+        if block.kind == BULLET:
+            story.append(Paragraph('• ' + text, styles["normal"]))
+        else:
+            story.append(Paragraph(text, styles.get(block.kind, styles["normal"])))
+
+    doc.build(story)
+
+
+@register_exporter("docx", ".docx")
+def render_docx(document: ResumeDocument, stream: BinaryIO):
+    """Render the document to Word format with python-docx."""
+    import docx
+
+    word_doc = docx.Document()
+    heading_levels = {TITLE: 0, HEADING: 1, SUBHEADING: 2}
+
+    for block in document.blocks:
+        if block.kind == SPACER:
+            continue
+
+        if block.kind in heading_levels:
+            word_doc.add_heading(block.text, level=heading_levels[block.kind])
+            continue
+
+        style = 'List Bullet' if block.kind == BULLET else None
+        paragraph = word_doc.add_paragraph(style=style)
+        for run in block.runs:
+            word_run = paragraph.add_run(run.text)
+            word_run.bold = run.bold
+            word_run.italic = run.italic
+            if run.code:
+                word_run.font.name = 'Courier New'
+
+    word_doc.save(stream)
+
+
+def _runs_to_html(block) -> str:
+    """Render a block's inline runs as HTML."""
+    parts = []
+    for run in block.runs:
+        text = html.escape(run.text)
+        if run.bold:
+            text = f"<strong>{text}</strong>"
+        elif run.italic:
+            text = f"<em>{text}</em>"
+        elif run.code:
+            text = f"<code>{text}</code>"
+        elif run.href:
+            text = f'<a href="{html.escape(run.href)}">{text}</a>'
+        parts.append(text)
+    return "".join(parts)
+
+
+@register_exporter("html", ".html")
+def render_html(document: ResumeDocument, stream: BinaryIO):
+    """Render the document to a standalone HTML page."""
+    tags = {TITLE: "h1", HEADING: "h2", SUBHEADING: "h3"}
+    body = []
+    in_list = False
+
+    for block in document.blocks:
+        if block.kind == BULLET:
+            if not in_list:
+                body.append("<ul>")
+                in_list = True
+            body.append(f"<li>{_runs_to_html(block)}</li>")
+            continue
+
+        if in_list:
+            body.append("</ul>")
+            in_list = False
+
+        if block.kind == SPACER:
+            continue
+
+        tag = tags.get(block.kind, "p")
+        body.append(f"<{tag}>{_runs_to_html(block)}</{tag}>")
+
+    if in_list:
+        body.append("</ul>")
+
+    page = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(document.title or 'Resume')}</title>\n"
+        "</head>\n<body>\n" + "\n".join(body) + "\n</body>\n</html>\n"
+    )
+    stream.write(page.encode('utf-8'))
+
+
+def render_to_bytes(content: str, fmt: str) -> bytes:
+    """
+    Render resume Markdown to an in-memory file.
+
+    Args:
+        content: Markdown text
+        fmt: Registered format name
+
+    Returns:
+        Rendered file contents
+    """
+    if fmt not in EXPORTERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    _, renderer = EXPORTERS[fmt]
+    document = parse_resume_markdown(content)
+    buffer = io.BytesIO()
+    
+    start = time.perf_counter()
+    renderer(document, buffer)
+    RENDER_DURATION.observe(time.perf_counter() - start, format=fmt)
+    
+    return buffer.getvalue()
+
+
+def export_document(
+    content: str,
+    filename: str,
+    formats: Iterable[str] = ("md", "pdf"),
+    output_dir: Optional[Path] = None
+) -> Dict[str, Optional[Path]]:
+    """
+    Parse resume Markdown once and write it in several formats.
+
+    Args:
+        content: Markdown text
+        filename: Base filename (without extension)
+        formats: Registered format names to export
+        output_dir: Target directory (defaults to data/outputs)
+
+    Returns:
+        Dict mapping format to written path, or None if that format failed
+    """
+    output_dir = output_dir or OUTPUTS_DIR
+    document = parse_resume_markdown(content)
+    paths: Dict[str, Optional[Path]] = {}
+
+    for fmt in formats:
+        if fmt not in EXPORTERS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        extension, renderer = EXPORTERS[fmt]
+        output_path = output_dir / f"{filename}{extension}"
+
+        try:
+            start = time.perf_counter()
+            with open(output_path, 'wb') as f:
+                renderer(document, f)
+            RENDER_DURATION.observe(time.perf_counter() - start, format=fmt)
+            paths[fmt] = output_path
+        except ImportError:
+            raise
+        except Exception as e:
+            # A failed format should not block the others
+            print(f"{fmt.upper()} generation failed: {str(e)}")
+            if output_path.exists():
+                output_path.unlink()
+            paths[fmt] = None
+
+    return paths
+
+
+def export_batch(
+    items: Iterable[Tuple[str, str]],
+    formats: Iterable[str] = ("md", "pdf"),
+    output_dir: Optional[Path] = None
+) -> List[Dict[str, Optional[Path]]]:
+    """
+    Export many resumes, reusing parsed documents and renderer setup.
+
+    Args:
+        items: Iterable of (markdown content, base filename) pairs
+        formats: Registered format names to export
+        output_dir: Target directory (defaults to data/outputs)
+
+    Returns:
+        One path dict per item, in input order
+    """
+    formats = tuple(formats)
+    return [
+        export_document(content, filename, formats, output_dir)
+        for content, filename in items
+    ]
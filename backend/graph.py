@@ -7,7 +7,10 @@ from backend.nodes import (
     critique_resume,
     draft_suggestions_only,
     draft_tailored_resume,
-    finalize_resume
+    draft_best_of_n,
+    finalize_resume,
+    DRAFT_MODE,
+    MAX_DRAFT_ITERATIONS
 )
 
 
@@ -21,7 +24,7 @@ def should_continue_iterating(state: ResumeState) -> str:
     iteration = state.get("iteration", 0)
     
     # Stop if max iterations reached
-    if iteration >= 3:
+    if iteration >= MAX_DRAFT_ITERATIONS:
         return "finalize"
     
     # Stop if approved
@@ -41,6 +44,9 @@ def create_resume_workflow():
     
     After user approval:
     draft → critique_draft → (iterate if needed) → finalize → END
+    
+    With DRAFT_MODE=best_of_n the loop is replaced by a single parallel step:
+    draft (N candidates, each critiqued) → finalize → END
     """
     graph = StateGraph(ResumeState)
     
@@ -48,8 +54,6 @@ def create_resume_workflow():
     graph.add_node("analyze_jd", analyze_job_description)
     graph.add_node("critique_original", critique_resume)
     graph.add_node("suggest", draft_suggestions_only)
-    graph.add_node("draft", draft_tailored_resume)
-    graph.add_node("critique_draft", critique_resume)
     graph.add_node("finalize", finalize_resume)
     
     # First half: evaluation
@@ -59,17 +63,23 @@ def create_resume_workflow():
     graph.add_edge("suggest", END)  # Pause for user approval
     
     # Second half: generation (after user clicks "Generate")
-    graph.add_edge("draft", "critique_draft")
-    
-    # Conditional: iterate or finalize?
-    graph.add_conditional_edges(
-        "critique_draft",
-        should_continue_iterating,
-        {
-            "finalize": "finalize",
-            "draft": "draft"
-        }
-    )
+    if DRAFT_MODE == "best_of_n":
+        graph.add_node("draft", draft_best_of_n)
+        graph.add_edge("draft", "finalize")
+    else:
+        graph.add_node("draft", draft_tailored_resume)
+        graph.add_node("critique_draft", critique_resume)
+        graph.add_edge("draft", "critique_draft")
+        
+        # Conditional: iterate or finalize?
+        graph.add_conditional_edges(
+            "critique_draft",
+            should_continue_iterating,
+            {
+                "finalize": "finalize",
+                "draft": "draft"
+            }
+        )
     
     graph.add_edge("finalize", END)
     
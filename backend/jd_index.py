@@ -0,0 +1,281 @@
+"""In-memory inverted index ranking stored job descriptions against a resume."""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Weight of each jd_analysis field in a posting's term frequencies
+FIELD_WEIGHTS = {
+    "ats_keywords": 2.0,
+    "required_skills": 2.0,
+    "job_title": 1.5,
+    "key_responsibilities": 0.5,
+}
+
+# Longest keyword phrase matched as a single term
+MAX_PHRASE_WORDS = 3
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*')
+
+# Words never indexed on their own (phrases containing them still are)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the to we with you your "
+    "will who work working years year team strong ability using use".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words, keeping tech spellings like 'c++', 'c#' and 'node.js'."""
+    return [token.rstrip('.') for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+def phrase_terms(words: List[str]) -> Set[str]:
+    """All 1..MAX_PHRASE_WORDS word n-grams of a token list."""
+    terms = {word for word in words if word not in STOPWORDS}
+    for size in range(2, MAX_PHRASE_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            terms.add(" ".join(words[i:i + size]))
+    return terms
+
+
+def analysis_terms(jd_analysis: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Weighted terms of one job description analysis.
+
+    Each keyword or skill contributes its full phrase and its single words,
+    so 'machine learning' matches both the phrase and 'learning'.
+
+    Returns:
+        Dict of term -> weighted frequency
+    """
+    weights: Dict[str, float] = {}
+
+    for field, weight in FIELD_WEIGHTS.items():
+        values = jd_analysis.get(field) or []
+        if isinstance(values, str):
+            values = [values]
+
+        for value in values:
+            words = tokenize(str(value))
+            terms = {word for word in words if word not in STOPWORDS}
+            if 1 < len(words) <= MAX_PHRASE_WORDS:
+                terms.add(" ".join(words))
+            for term in terms:
+                weights[term] = weights.get(term, 0.0) + weight
+
+    return weights
+
+
+class JDIndex:
+    """
+    BM25 inverted index over stored job description analyses.
+
+    Postings are appended as generations are saved; queries score only the
+    postings of terms present in the resume, with numpy doing the per-term
+    arithmetic, so cost grows with matches rather than index size.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generation_ids: List[int] = []
+        self.summaries: List[Dict[str, Any]] = []
+        self.doc_terms: List[Set[str]] = []
+        self.lengths: List[float] = []
+        self.alive: List[bool] = []
+        self.live_count: int = 0
+        self.total_length = 0.0
+        self.row_of: Dict[int, int] = {}
+        # term -> ([rows], [weights]) plus a numpy copy rebuilt when it grows
+        self.postings: Dict[str, tuple] = {}
+        self.arrays: Dict[str, tuple] = {}
+        # numpy copies of lengths/alive, rebuilt after adds and removes
+        self.row_arrays: Optional[tuple] = None
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def add(self, generation_id: int, jd_analysis: Dict[str, Any], summary: Optional[Dict[str, Any]] = None):
+        """
+        Index one generation's job description analysis.
+
+        Args:
+            generation_id: Database ID
+            jd_analysis: Parsed jd_analysis
+            summary: Fields returned with search results (title, company, ...)
+        """
+        terms = analysis_terms(jd_analysis)
+
+        with self.lock:
+            if generation_id in self.row_of:
+                self._remove_locked(generation_id)
+
+            row = len(self.generation_ids)
+            self.generation_ids.append(generation_id)
+            self.summaries.append(summary or {})
+            self.doc_terms.append(set(terms))
+            length = sum(terms.values())
+            self.lengths.append(length)
+            self.alive.append(True)
+            self.row_of[generation_id] = row
+            self.live_count += 1
+            self.total_length += length
+            self.row_arrays = None
+
+            for term, weight in terms.items():
+                rows, weights = self.postings.setdefault(term, ([], []))
+                rows.append(row)
+                weights.append(weight)
+                self.arrays.pop(term, None)
+
+    def remove(self, generation_id: int):
+        """Drop a generation from search results."""
+        with self.lock:
+            self._remove_locked(generation_id)
+
+    def _remove_locked(self, generation_id: int):
+        row = self.row_of.pop(generation_id, None)
+        if row is None or not self.alive[row]:
+            return
+        # Postings stay; dead rows are skipped at query time
+        self.alive[row] = False
+        self.live_count -= 1
+        self.total_length -= self.lengths[row]
+        self.row_arrays = None
+
+    def _posting_arrays(self, term: str):
+        arrays = self.arrays.get(term)
+        if arrays is None:
+            rows, weights = self.postings[term]
+            arrays = (np.array(rows, dtype=np.int64), np.array(weights, dtype=np.float64))
+            self.arrays[term] = arrays
+        return arrays
+
+    def search(self, text: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Rank indexed job descriptions against a resume.
+
+        Args:
+            text: Resume text
+            k: Number of results
+
+        Returns:
+            Up to k dicts with generation_id, score, matched_terms and the
+            stored summary fields, best first
+        """
+        query_terms = phrase_terms(tokenize(text))
+
+        with self.lock:
+            if not self.live_count:
+                return []
+
+            if self.row_arrays is None:
+                self.row_arrays = (
+                    np.array(self.lengths, dtype=np.float64),
+                    np.array(self.alive, dtype=bool),
+                )
+            lengths, alive = self.row_arrays
+            n_rows = len(lengths)
+            average_length = self.total_length / self.live_count or 1.0
+            length_norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length)
+            scores = np.zeros(n_rows, dtype=np.float64)
+
+            # N and document frequencies count live postings only, so
+            # scores don't drift as generations are removed
+            for term in query_terms & self.postings.keys():
+                rows, weights = self._posting_arrays(term)
+                live = alive[rows]
+                df = int(live.sum())
+                if not df:
+                    continue
+                rows, weights = rows[live], weights[live]
+                idf = np.log(1 + (self.live_count - df + 0.5) / (df + 0.5))
+                scores[rows] += idf * weights * (BM25_K1 + 1) / (weights + length_norm[rows])
+
+            k = min(k, n_rows)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [
+                {
+                    "generation_id": self.generation_ids[row],
+                    "score": round(float(scores[row]), 4),
+                    "matched_terms": sorted(self.doc_terms[row] & query_terms),
+                    **self.summaries[row],
+                }
+                for row in top if scores[row] > 0
+            ]
+
+
+_index: Optional[JDIndex] = None
+_index_lock = threading.Lock()
+
+
+def _summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "job_title": row.get("job_title"),
+        "company": row.get("company"),
+        "timestamp": row.get("timestamp"),
+    }
+
+
+def build_index(rows: Iterable[Dict[str, Any]]) -> JDIndex:
+    """
+    Build an index from generation rows.
+
+    Args:
+        rows: Dicts with 'id', 'jd_analysis' (dict) and summary fields
+
+    Returns:
+        Populated JDIndex
+    """
+    index = JDIndex()
+    for row in rows:
+        index.add(row["id"], row.get("jd_analysis") or {}, _summary(row))
+    return index
+
+
+def get_jd_index() -> JDIndex:
+    """Process-wide index, loaded from the generations table on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            from backend.database import get_jd_analyses
+            _index = build_index(get_jd_analyses())
+        return _index
+
+
+def index_generation(generation_id: int, jd_analysis: Dict[str, Any], summary: Dict[str, Any]):
+    """Add a newly saved generation (no-op until the index is first used)."""
+    # Waits for an in-progress build, which may or may not have seen this row
+    with _index_lock:
+        index = _index
+    if index is not None:
+        index.add(generation_id, jd_analysis, summary)
+
+
+def unindex_generation(generation_id: int):
+    """Remove a deleted generation from the index, if it is loaded."""
+    with _index_lock:
+        index = _index
+    if index is not None:
+        index.remove(generation_id)
+
+
+def find_matching_postings(resume_text: str, k: int = 5) -> List[Dict[str, Any]]:
+    """
+    Top-k stored job postings that best match a resume, without any LLM call.
+
+    Args:
+        resume_text: Resume text
+        k: Number of results
+
+    Returns:
+        Ranked matches (see JDIndex.search)
+    """
+    return get_jd_index().search(resume_text, k)
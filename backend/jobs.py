@@ -0,0 +1,229 @@
+"""Background job queue and bounded worker pool for pipeline runs."""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+from backend.database import (
+    init_database,
+    create_job,
+    claim_job,
+    update_job_progress,
+    finish_job,
+    get_job,
+    get_job_ids_by_status,
+    heartbeat_jobs,
+    requeue_stale_jobs,
+)
+from backend.events import subscribe
+from backend.metrics import JOB_QUEUE_DEPTH, JOBS_RUNNING
+from backend.pipeline import run_evaluation, run_generation
+
+# Number of pipelines executed concurrently per process
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+
+# Seconds between heartbeats on this process's running jobs
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "15"))
+# Running jobs without a heartbeat for this long are taken over by another process
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "90"))
+
+# This worker pool, as recorded on the jobs it claims (the suffix tells
+# apart restarts that reuse a PID, e.g. PID 1 in containers)
+JOB_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# Minimum seconds between partial-result writes while text streams in
+PARTIAL_WRITE_INTERVAL = float(os.getenv("PARTIAL_WRITE_INTERVAL", "0.5"))
+
+# Nodes whose streamed reply text is shown while they run
+LIVE_TEXT_NODES = frozenset({"draft", "draft_best_of_n", "finalize"})
+
+# Job kinds and the pipeline each one runs
+JOB_PIPELINES = {
+    "evaluate": run_evaluation,
+    "generate": run_generation,
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the worker pool on first use and pick up interrupted jobs."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            init_database()
+            _executor = ThreadPoolExecutor(
+                max_workers=JOB_WORKERS,
+                thread_name_prefix="resume-job"
+            )
+            _resume_interrupted_jobs(_executor)
+            threading.Thread(
+                target=_heartbeat_loop, args=(_executor,), daemon=True, name="resume-job-heartbeat"
+            ).start()
+        return _executor
+
+
+def _requeue_stale_jobs() -> List[str]:
+    """Requeue running jobs whose owner stopped sending heartbeats."""
+    cutoff = datetime.now() - timedelta(seconds=JOB_STALE_SECONDS)
+    return requeue_stale_jobs(cutoff.isoformat())
+
+
+def _resume_interrupted_jobs(executor: ThreadPoolExecutor):
+    """
+    Re-run queued jobs, and running jobs whose process died.
+
+    Jobs other live processes are running keep sending heartbeats, so
+    they are left alone.
+    """
+    _requeue_stale_jobs()
+    for job_id in get_job_ids_by_status(["queued"]):
+        JOB_QUEUE_DEPTH.inc()
+        executor.submit(_run_job, job_id)
+
+
+def _heartbeat_loop(executor: ThreadPoolExecutor):
+    """Keep this process's jobs alive and take over those of dead processes."""
+    while True:
+        time.sleep(JOB_HEARTBEAT_SECONDS)
+        try:
+            heartbeat_jobs(JOB_OWNER)
+            for job_id in _requeue_stale_jobs():
+                JOB_QUEUE_DEPTH.inc()
+                executor.submit(_run_job, job_id)
+        except Exception as e:
+            print(f"Job heartbeat failed: {str(e)}")
+
+
+class PartialResults:
+    """
+    Collects a running job's results from pipeline events and writes them
+    to the job's result column, so pollers can show them before it ends.
+
+    The state keys each node changed are merged in as the node finishes;
+    text streamed by LIVE_TEXT_NODES is kept under 'live_text' (one entry
+    per LLM call) and written at most every PARTIAL_WRITE_INTERVAL seconds.
+    """
+
+    def __init__(self, job_id: str, owner: str):
+        self.job_id = job_id
+        self.owner = owner
+        self.progress = 0
+        self.stage = "running"
+        self.partial: Dict[str, Any] = {}
+        self.live_text: Dict[str, str] = {}
+        self.last_write = 0.0
+        self.lock = threading.Lock()
+
+    def report(self, progress: int, stage: str):
+        """Progress callback for the pipeline."""
+        with self.lock:
+            self.progress, self.stage = progress, stage
+            self._write()
+
+    def on_event(self, event: Dict[str, Any]):
+        """Event listener for the pipeline."""
+        with self.lock:
+            if event["type"] == "node_end":
+                self.partial.update(event["partial"])
+                self.live_text = {}
+                self._write()
+            elif event["type"] == "token":
+                self.live_text[event["call"]] = self.live_text.get(event["call"], "") + event["delta"]
+                if time.monotonic() - self.last_write >= PARTIAL_WRITE_INTERVAL:
+                    self._write()
+
+    def _write(self):
+        partial = dict(self.partial)
+        if self.live_text:
+            partial["live_text"] = dict(self.live_text)
+        update_job_progress(self.job_id, self.owner, self.progress, self.stage, partial=partial)
+        self.last_write = time.monotonic()
+
+
+def _run_job(job_id: str):
+    """Execute one job on a worker thread."""
+    JOB_QUEUE_DEPTH.dec()
+    
+    # Another worker may already have picked it up
+    if not claim_job(job_id, JOB_OWNER):
+        return
+
+    job = get_job(job_id)
+    if job is None:
+        return
+    pipeline = JOB_PIPELINES[job["kind"]]
+    partials = PartialResults(job_id, JOB_OWNER)
+
+    JOBS_RUNNING.inc()
+    try:
+        with subscribe(partials.on_event, token_nodes=LIVE_TEXT_NODES):
+            result = pipeline(job["input_state"], progress=partials.report)
+        finished = finish_job(job_id, JOB_OWNER, result=result)
+    except Exception as e:
+        finished = finish_job(job_id, JOB_OWNER, error=str(e))
+    finally:
+        JOBS_RUNNING.dec()
+
+    if not finished:
+        # Requeued after missed heartbeats; the new owner records the outcome
+        print(f"Job {job_id} was taken over by another worker; dropped this run's result")
+
+
+def submit_job(kind: str, state: Mapping[str, Any]) -> str:
+    """
+    Persist a job and queue it on the worker pool.
+
+    Args:
+        kind: 'evaluate' or 'generate'
+        state: ResumeState to run the pipeline on
+
+    Returns:
+        Job ID to poll with get_job_status
+    """
+    if kind not in JOB_PIPELINES:
+        raise ValueError(f"Unknown job kind: {kind}")
+
+    executor = _get_executor()
+    job_id = uuid.uuid4().hex
+    create_job(job_id, kind, state)
+    JOB_QUEUE_DEPTH.inc()
+    executor.submit(_run_job, job_id)
+    return job_id
+
+
+def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a job's status, progress and result.
+
+    While the job runs, 'result' holds the partial results so far: the
+    state keys of the nodes that finished, plus 'live_text' (LLM call ->
+    text so far) while a draft or the final resume is being written.
+
+    Returns:
+        Dict with 'status', 'progress', 'stage', 'result' and 'error', or None
+    """
+    job = get_job(job_id)
+    if not job:
+        return None
+
+    return {
+        "id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "stage": job["stage"],
+        "result": job["result"],
+        "error": job["error"],
+    }
+
+
+def get_queue_depth() -> int:
+    """Number of jobs waiting for a worker."""
+    return len(get_job_ids_by_status(["queued"]))
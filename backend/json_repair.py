@@ -0,0 +1,179 @@
+"""Local repair of malformed JSON replies (no model call needed)."""
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.structured import is_valid_object
+
+# Smart quotes models sometimes emit as string delimiters -> the quote they stand for
+SMART_QUOTES = {
+    '“': '"', '”': '"', '„': '"', '«': '"', '»': '"',
+    '‘': "'", '’': "'",
+}
+
+# What follows a closing quote: a separator, a closer or the end of the text
+STRING_END = re.compile(r'\s*(?:[,:}\]]|$)')
+
+# Python literals that json.loads rejects
+PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+CODE_FENCE = re.compile(r'```(?:json)?\s*(.*?)(?:```|$)', re.DOTALL)
+
+# Longest fragment sent back to the model for fixing
+MAX_FRAGMENT_CHARS = 6000
+
+
+def _strip_fence(text: str) -> str:
+    """Return the contents of the first ```json block, or text unchanged."""
+    match = CODE_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _closes_string(text: str, i: int, quote: str) -> bool:
+    """Whether text[i] ends a string opened with quote."""
+    if quote not in SMART_QUOTES:
+        return text[i] == quote
+    # Smart quotes also appear inside values ('Led “Project X” rollout');
+    # one only ends the string where a delimiter would
+    return SMART_QUOTES.get(text[i]) == SMART_QUOTES[quote] and STRING_END.match(text, i + 1) is not None
+
+
+def _normalize(text: str) -> Tuple[str, List[str], List[Tuple[int, List[str]]]]:
+    """
+    Rewrite the first object in text as strict JSON, as far as it goes.
+
+    Converts single- and smart-quoted strings, Python literals and trailing
+    commas in one pass, stopping once the outermost object closes. Smart
+    quotes inside a string are kept as they are.
+
+    Returns:
+        (rewritten text, closers still open at the end, cut points)
+        where each cut point is (length before a comma, closers open there)
+    """
+    start = text.find('{')
+    if start == -1:
+        return "", [], []
+
+    out: List[str] = []
+    closers: List[str] = []
+    cuts: List[Tuple[int, List[str]]] = []
+    quote: Optional[str] = None
+    escape = False
+    i = start
+
+    while i < len(text):
+        char = text[i]
+
+        if quote is not None:
+            if escape:
+                escape = False
+                # \' is not a valid JSON escape
+                out.append("'" if char == "'" else '\\' + char)
+            elif char == '\\':
+                escape = True
+            elif _closes_string(text, i, quote):
+                quote = None
+                out.append('"')
+            elif char == '"':
+                # Inside a single- or smart-quoted string
+                out.append('\\"')
+            elif char == '\n':
+                out.append('\\n')
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char in '"\'' or char in SMART_QUOTES:
+            quote = char
+            out.append('"')
+        elif char in '{[':
+            closers.append('}' if char == '{' else ']')
+            out.append(char)
+        elif char in '}]':
+            # Drop a trailing comma before the closer
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ',':
+                out.pop()
+            if closers:
+                closers.pop()
+            out.append(char)
+            if not closers:
+                break
+        elif char == ',':
+            cuts.append((len(out), list(closers)))
+            out.append(char)
+        elif char.isalpha():
+            # Non-ASCII letters are copied through as a one-letter word
+            match = re.match(r'[A-Za-z]+', text[i:])
+            word = match.group(0) if match else char
+            out.append(PYTHON_LITERALS.get(word, word))
+            i += len(word)
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    if quote is not None:
+        if escape:
+            out.append('\\\\')
+        out.append('"')
+
+    return "".join(out), closers, cuts
+
+
+def _close(body: str, closers: List[str]) -> str:
+    """Append the closers still open, dropping a dangling comma or colon."""
+    body = body.rstrip()
+    while body and body[-1] in ',:':
+        body = body[:-1].rstrip()
+    return body + "".join(reversed(closers))
+
+
+def repair_json(text: str, required_keys: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Fix common defects in a JSON reply without asking the model again.
+
+    Handles code fences, smart quotes, single quotes, Python literals,
+    trailing commas and replies truncated mid-string or mid-array. A
+    truncated reply loses only its incomplete last element.
+
+    Args:
+        text: Malformed model reply
+        required_keys: Keys the repaired object must contain
+
+    Returns:
+        Repaired object, or None if it can't be repaired
+    """
+    body, closers, cuts = _normalize(_strip_fence(text))
+    if not body:
+        return None
+
+    # Try the whole text first, then back off one element at a time
+    candidates = [(body, closers)] + [
+        (body[:length], open_closers) for length, open_closers in reversed(cuts)
+    ]
+
+    for candidate, open_closers in candidates:
+        try:
+            obj = json.loads(_close(candidate, open_closers))
+        except json.JSONDecodeError:
+            continue
+        if is_valid_object(obj, required_keys):
+            return dict(obj)
+
+    return None
+
+
+def broken_fragment(text: str) -> str:
+    """
+    Cut a reply down to the part worth sending back for fixing.
+
+    Returns:
+        Text from the first '{' onward, capped at MAX_FRAGMENT_CHARS
+    """
+    start = text.find('{')
+    fragment = text[start:] if start != -1 else text
+    return fragment[:MAX_FRAGMENT_CHARS]
@@ -0,0 +1,275 @@
+"""
+Keyword coverage: which JD keywords and skills a resume mentions, and where.
+
+A word-level Aho-Corasick automaton is built once per job description
+analysis from its ats_keywords and required_skills (plus their synonyms),
+then scans any resume or draft in one pass over its words. Words are
+lightly stemmed first, so 'APIs' matches 'API' and 'managed' matches
+'managing'. No LLM call is involved, so the gap analysis is available as
+soon as the JD has been analyzed and can be re-run on every edit.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+from backend.metrics import register_lru_cache
+
+# Words of a resume, keeping tech spellings like 'C++', 'C#' and 'Node.js'
+WORD_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*', re.IGNORECASE)
+
+# Phrases treated as the same keyword (compared after normalization)
+SYNONYM_GROUPS = (
+    ("javascript", "JS", "ecmascript"),
+    ("typescript", "TS"),
+    ("kubernetes", "k8s"),
+    ("postgresql", "postgres", "psql"),
+    ("amazon web services", "aws"),
+    ("google cloud platform", "google cloud", "gcp"),
+    ("microsoft azure", "azure"),
+    ("machine learning", "ML"),
+    ("artificial intelligence", "AI"),
+    ("natural language processing", "nlp"),
+    ("large language models", "llms", "llm"),
+    ("continuous integration", "ci"),
+    ("continuous delivery", "continuous deployment", "CD"),
+    ("ci/cd", "ci cd", "cicd"),
+    ("user experience", "ux"),
+    ("user interface", "UI"),
+    ("frontend", "front end"),
+    ("backend", "back end"),
+    ("full stack", "fullstack"),
+    ("node.js", "nodejs", "Node"),
+    ("react", "react.js", "reactjs"),
+    ("golang", "Go"),
+    ("object oriented programming", "oop"),
+    ("structured query language", "sql"),
+    ("rest api", "restful api"),
+    ("project management", "project manager"),
+)
+
+# Aliases that are also everyday words or units in lowercase ('go', 'node',
+# 'cd', 'ml'); as synonyms they only match when spelled exactly like this
+CASED_ALIASES = frozenset({"JS", "TS", "ML", "AI", "CD", "UI", "Node", "Go"})
+
+# Number of per-JD automatons kept in memory
+MATCHER_CACHE_SIZE = 128
+# Distinct words whose stems are kept (resumes reuse a small vocabulary)
+STEM_CACHE_SIZE = 65536
+
+# Doubled consonants left by stripping -ing/-ed ('running' -> 'runn')
+_DOUBLED = re.compile(r'([b-df-hj-np-tv-z])\1$')
+
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem(word: str) -> str:
+    """
+    Light suffix stripping so inflected forms compare equal.
+
+    Only plain alphabetic words longer than three letters are stemmed;
+    tech spellings ('c++', 'node.js') are kept as they are.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Stemmed word
+    """
+    if len(word) <= 3 or not word.isalpha():
+        return word
+
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith("ss") and not word.endswith("us"):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if _DOUBLED.search(word) and not word.endswith(("ll", "ss", "zz")):
+                word = word[:-1]
+            break
+
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def tokenize_spans(text: str) -> List[Tuple[str, int, int]]:
+    """
+    Normalized words of a text with their character offsets.
+
+    Returns:
+        List of (stemmed word, start, end)
+    """
+    tokens = []
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group(0)
+        stripped = word.rstrip('.')
+        tokens.append((stem(stripped.lower()), match.start(), match.start() + len(stripped)))
+    return tokens
+
+
+def normalize_phrase(phrase: str) -> Tuple[str, ...]:
+    """Normalized words of a keyword phrase."""
+    return tuple(token for token, _, _ in tokenize_spans(phrase.replace("/", " ")))
+
+
+# Normalized phrase -> (normalized variant, exact spelling or "" for any case) of its group
+_SYNONYMS: Dict[Tuple[str, ...], Tuple[Tuple[Tuple[str, ...], str], ...]] = {}
+for _group in SYNONYM_GROUPS:
+    _variants = tuple(
+        (normalize_phrase(phrase), phrase if phrase in CASED_ALIASES else "") for phrase in _group
+    )
+    for _variant, _ in _variants:
+        _SYNONYMS[_variant] = _variants
+
+
+def jd_keywords(jd_analysis: Dict[str, Any]) -> List[str]:
+    """
+    Keywords a resume is checked for: ats_keywords then required_skills.
+
+    Duplicates (after normalization) are dropped, first spelling kept.
+
+    Args:
+        jd_analysis: Parsed JD analysis
+
+    Returns:
+        Keyword phrases in JD order
+    """
+    keywords = []
+    seen = set()
+    for field in ("ats_keywords", "required_skills"):
+        values = jd_analysis.get(field) or []
+        if isinstance(values, str):
+            values = [values]
+        for value in values:
+            value = str(value).strip()
+            normalized = normalize_phrase(value)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                keywords.append(value)
+    return keywords
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over normalized words of a set of keywords."""
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(keywords)
+        # Trie: state -> {word: next state}
+        # outputs: state -> [(keyword index, word count, exact spelling or "")]
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[Tuple[int, int, str]]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            normalized = normalize_phrase(keyword)
+            if not normalized:
+                continue
+            # A keyword with synonyms matches any phrase of its group; its
+            # own spelling matches in any case
+            for variant, spelling in _SYNONYMS.get(normalized, ((normalized, ""),)):
+                self._add(variant, index, "" if variant == normalized else spelling)
+
+        self._build_failure_links()
+
+    def _add(self, words: Tuple[str, ...], index: int, spelling: str = ""):
+        state = 0
+        for word in words:
+            next_state = self.goto[state].get(word)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][word] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        if (index, len(words), spelling) not in self.outputs[state]:
+            self.outputs[state].append((index, len(words), spelling))
+
+    def _build_failure_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and word not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(word, 0)
+                # Inherit the matches of the longest proper suffix
+                self.outputs[next_state] = self.outputs[next_state] + [
+                    output for output in self.outputs[self.fail[next_state]]
+                    if output not in self.outputs[next_state]
+                ]
+
+    def scan(self, text: str) -> Dict[str, List[List[int]]]:
+        """
+        Find every keyword occurrence in one pass over the text.
+
+        Args:
+            text: Resume or draft
+
+        Returns:
+            Dict of keyword -> [[start, end], ...] character spans (all keywords present)
+        """
+        hits: Dict[str, List[List[int]]] = {keyword: [] for keyword in self.keywords}
+        tokens = tokenize_spans(text)
+        state = 0
+        for position, (word, _, end) in enumerate(tokens):
+            while state and word not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(word, 0)
+            for index, length, spelling in self.outputs[state]:
+                start = tokens[position - length + 1][1]
+                if spelling and text[start:end] != spelling:
+                    continue
+                hits[self.keywords[index]].append([start, end])
+        return hits
+
+    def coverage(self, text: str) -> Dict[str, Any]:
+        """
+        Keyword coverage of a text.
+
+        Returns:
+            Dict with 'coverage' (0-1), 'matched' and 'missing' keyword
+            lists, and 'hits' (keyword -> character spans)
+        """
+        hits = self.scan(text)
+        matched = [keyword for keyword in self.keywords if hits[keyword]]
+        missing = [keyword for keyword in self.keywords if not hits[keyword]]
+        return {
+            "coverage": round(len(matched) / len(self.keywords), 3) if self.keywords else 1.0,
+            "matched": matched,
+            "missing": missing,
+            "hits": {keyword: spans for keyword, spans in hits.items() if spans},
+        }
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _build_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+register_lru_cache("keyword_matcher", _build_matcher)
+
+
+def get_matcher(jd_analysis: Dict[str, Any]) -> KeywordMatcher:
+    """Matcher for a JD analysis, built once and cached by its keywords."""
+    return _build_matcher(tuple(jd_keywords(jd_analysis)))
+
+
+def keyword_coverage(jd_analysis: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """
+    Which of a JD's keywords a resume mentions, and where.
+
+    Args:
+        jd_analysis: Parsed JD analysis
+        text: Resume or draft
+
+    Returns:
+        See KeywordMatcher.coverage
+    """
+    return get_matcher(jd_analysis).coverage(text)
@@ -0,0 +1,378 @@
+"""Prometheus text-format metrics for the optimization pipeline (stdlib only)."""
+
+import functools
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+# Exporter configuration (both optional)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_DUMP_INTERVAL = float(os.getenv("METRICS_DUMP_INTERVAL", "15"))
+
+# Sessions seen within this window count as active
+ACTIVE_SESSION_WINDOW = 5 * 60
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Sample value at full precision (large counters must not be rounded)."""
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class _Metric(ABC):
+    """Base class for labelled metrics."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    @abstractmethod
+    def samples(self) -> List[Sample]:
+        """Current (suffix, labels, value) samples of this metric."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+        self.collectors: List[Callable[[], Iterable[Tuple[Dict[str, str], float]]]] = []
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[Dict[str, str], float]]]):
+        """Add a callback yielding (labels, total) pairs read at scrape time."""
+        self.collectors.append(collector)
+
+    def samples(self) -> List[Sample]:
+        with self.lock:
+            samples = [(self.name + "_total", self._labels(k), v) for k, v in self.values.items()]
+        for collector in self.collectors:
+            samples.extend((self.name + "_total", labels, value) for labels, value in collector())
+        return samples
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, *args, callback: Optional[Callable[[], float]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values: Dict[LabelValues, float] = {}
+        self.callback = callback
+        # Unlabelled gauges report 0 before their first update
+        if not self.labelnames:
+            self.values[()] = 0.0
+
+    def set(self, value: float, **labels):
+        with self.lock:
+            self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self) -> List[Sample]:
+        if self.callback:
+            try:
+                return [(self.name, {}, float(self.callback()))]
+            except Exception:
+                return []
+        with self.lock:
+            return [(self.name, self._labels(k), v) for k, v in self.values.items()]
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        self.values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self.lock:
+            # Per-bucket counts, then sum, then count
+            state = self.values.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def samples(self) -> List[Sample]:
+        samples = []
+        with self.lock:
+            for key, state in self.values.items():
+                labels = self._labels(key)
+                for bound, count in zip(self.buckets, state):
+                    samples.append((self.name + "_bucket", {**labels, "le": repr(float(bound))}, count))
+                samples.append((self.name + "_bucket", {**labels, "le": "+Inf"}, state[-1]))
+                samples.append((self.name + "_sum", labels, state[-2]))
+                samples.append((self.name + "_count", labels, state[-1]))
+        return samples
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, _Metric] = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric: M) -> M:
+        """Add a metric, or return the one already registered under its name."""
+        with self.lock:
+            registered = self.metrics.setdefault(metric.name, metric)
+        if not isinstance(registered, type(metric)):
+            raise ValueError(f"Metric {metric.name} is already registered as a {registered.kind}")
+        return registered
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines = []
+        with self.lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help_text, labelnames))
+
+
+def gauge(name: str, help_text: str, labelnames: Iterable[str] = (), callback=None) -> Gauge:
+    return REGISTRY.register(Gauge(name, help_text, labelnames, callback=callback))
+
+
+def histogram(name: str, help_text: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help_text, labelnames, buckets=buckets))
+
+
+# ===== PIPELINE METRICS =====
+
+NODE_DURATION = histogram(
+    "resume_node_duration_seconds", "Wall time of workflow nodes", ["node"]
+)
+LLM_CALLS = counter(
+    "resume_llm_calls", "LLM requests by node and outcome", ["node", "outcome"]
+)
+STRUCTURED_REPLIES = counter(
+    "resume_structured_replies", "Streamed JSON replies by how they ended", ["outcome"]
+)
+JSON_REPAIRS = counter(
+    "resume_json_repairs", "Malformed JSON replies by how they were recovered", ["node", "outcome"]
+)
+CACHE_REQUESTS = counter(
+    "resume_cache_requests", "Cache lookups by cache and result (hit/miss)", ["cache", "result"]
+)
+JOB_QUEUE_DEPTH = gauge(
+    "resume_job_queue_depth", "Jobs waiting for a worker in this process"
+)
+JOBS_RUNNING = gauge(
+    "resume_jobs_running", "Jobs currently executing in this process"
+)
+DB_QUERY_DURATION = histogram(
+    "resume_db_query_duration_seconds", "SQLite operation latency", ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+)
+RENDER_DURATION = histogram(
+    "resume_render_duration_seconds", "Export render time by format (pdf, docx, ...)", ["format"]
+)
+
+_sessions: Dict[str, float] = {}
+_sessions_lock = threading.Lock()
+
+
+def _count_active_sessions() -> int:
+    cutoff = time.time() - ACTIVE_SESSION_WINDOW
+    with _sessions_lock:
+        for session_id in [s for s, seen in _sessions.items() if seen < cutoff]:
+            del _sessions[session_id]
+        return len(_sessions)
+
+
+ACTIVE_SESSIONS = gauge(
+    "resume_active_sessions", "UI sessions seen in the last five minutes",
+    callback=_count_active_sessions
+)
+
+
+def mark_session_active(session_id: str):
+    """Record activity from a UI session."""
+    with _sessions_lock:
+        _sessions[session_id] = time.time()
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count a cache hit or miss."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def register_lru_cache(cache: str, cached_fn: Callable):
+    """Report a functools.lru_cache's hits and misses without touching its hot path."""
+    def collect():
+        info = cached_fn.cache_info()
+        return [
+            ({"cache": cache, "result": "hit"}, info.hits),
+            ({"cache": cache, "result": "miss"}, info.misses),
+        ]
+    CACHE_REQUESTS.add_collector(collect)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def timed_query(fn: F) -> F:
+    """Decorate a database function to record its latency."""
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            DB_QUERY_DURATION.observe(time.perf_counter() - start, operation=fn.__name__)
+    return wrapper  # type: ignore[return-value]
+
+
+# ===== EXPORT =====
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def render_metrics() -> str:
+    """Current metrics in Prometheus text exposition format."""
+    return REGISTRY.render()
+
+
+def dump_metrics(path: Path):
+    """Write current metrics to a file atomically (for node_exporter's textfile collector)."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(render_metrics(), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Serve /metrics from a daemon thread.
+
+    Args:
+        port: Port to bind
+        host: Interface to bind
+
+    Returns:
+        The running server
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_metrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-server").start()
+    return server
+
+
+def _dump_loop(path: Path, interval: float):
+    while True:
+        try:
+            dump_metrics(path)
+        except OSError as e:
+            print(f"Metrics dump failed: {str(e)}")
+        time.sleep(interval)
+
+
+def init_metrics():
+    """Start the configured exporters (METRICS_PORT / METRICS_FILE) once per process."""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+
+        if METRICS_PORT:
+            try:
+                start_metrics_server(METRICS_PORT)
+            except OSError as e:
+                # Another process (e.g. a second Streamlit worker) owns the port
+                print(f"Metrics server not started: {str(e)}")
+
+        if METRICS_FILE:
+            threading.Thread(
+                target=_dump_loop,
+                args=(Path(METRICS_FILE), METRICS_DUMP_INTERVAL),
+                daemon=True,
+                name="metrics-dump"
+            ).start()
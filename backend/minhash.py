@@ -0,0 +1,278 @@
+"""MinHash signatures and LSH index for finding near-duplicate job descriptions."""
+
+import json
+import os
+import re
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from backend.metrics import record_cache_lookup
+
+# Signature size and banding: 16 bands x 8 rows puts the LSH threshold near
+# 0.7 Jaccard, below the reuse threshold, so true matches are rarely missed
+NUM_PERM = 128
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Reuse a stored analysis when a new JD is at least this similar
+JD_REUSE = os.getenv("JD_REUSE", "true").lower() in ("1", "true", "yes")
+JD_REUSE_THRESHOLD = float(os.getenv("JD_REUSE_THRESHOLD", "0.85"))
+
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Multiply-shift hash functions ((a * x + b) mod 2^64) >> 32, a odd. Fixed
+# seed: signatures are stored in the database and must stay comparable
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(0, 1 << 63, size=NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.randint(0, 1 << 63, size=NUM_PERM, dtype=np.uint64)
+
+WORD_PATTERN = re.compile(r'[a-z0-9+#]+')
+
+# Token -> crc32, shared across documents (postings reuse most words)
+_token_hashes: Dict[str, int] = {}
+
+
+def _token_hash(token: str) -> int:
+    value = _token_hashes.get(token)
+    if value is None:
+        value = zlib.crc32(token.encode("utf-8"))
+        if len(_token_hashes) < 1_000_000:
+            _token_hashes[token] = value
+    return value
+
+
+def shingle_hashes(text: str) -> np.ndarray:
+    """
+    32-bit hashes of the text's word shingles.
+
+    Args:
+        text: Job description text
+
+    Returns:
+        Unique shingle hashes as uint64
+    """
+    tokens = WORD_PATTERN.findall(text.lower())
+    if not tokens:
+        return np.zeros(1, dtype=np.uint64)
+
+    hashes = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    if len(hashes) < SHINGLE_SIZE:
+        return np.unique(hashes)
+
+    # Mix consecutive token hashes into one hash per shingle
+    mixed = hashes[:len(hashes) - SHINGLE_SIZE + 1].copy()
+    for offset in range(1, SHINGLE_SIZE):
+        mixed = mixed * np.uint64(0x9E3779B1) + hashes[offset:len(hashes) - SHINGLE_SIZE + 1 + offset]
+    return np.unique(mixed & _MAX_HASH)
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """
+    MinHash signature of a text.
+
+    Returns:
+        NUM_PERM uint32 values; the fraction of equal positions between two
+        signatures estimates the texts' shingle Jaccard similarity
+    """
+    shingles = shingle_hashes(text)
+    permuted = (_PERM_A[:, None] * shingles[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+    signature: np.ndarray = permuted.min(axis=1).astype(np.uint32)
+    return signature
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(a == b))
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive hash index over MinHash signatures.
+
+    Each signature is split into LSH_BANDS bands; texts sharing any whole
+    band become candidates, which are then checked against the threshold.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(LSH_BANDS)]
+        # Signatures live in rows of one matrix so candidates are checked
+        # in a single numpy comparison; removed rows are left unused
+        self.matrix = np.zeros((1024, NUM_PERM), dtype=np.uint32)
+        self.row_of: Dict[int, int] = {}
+        self.keys: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    @staticmethod
+    def _band_keys(signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+            for band in range(LSH_BANDS)
+        ]
+
+    def add(self, key: int, signature: np.ndarray):
+        """Index a signature under key (e.g. a generation ID)."""
+        with self.lock:
+            if key in self.row_of:
+                self._remove_locked(key)
+
+            row = len(self.keys)
+            if row == len(self.matrix):
+                self.matrix = np.concatenate([self.matrix, np.zeros_like(self.matrix)])
+            self.matrix[row] = signature
+            self.keys.append(key)
+            self.row_of[key] = row
+
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self.buckets[band].setdefault(band_key, []).append(row)
+
+    def remove(self, key: int):
+        with self.lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: int):
+        row = self.row_of.pop(key, None)
+        if row is None:
+            return
+        for band, band_key in enumerate(self._band_keys(self.matrix[row])):
+            bucket = self.buckets[band].get(band_key, [])
+            if row in bucket:
+                bucket.remove(row)
+            if not bucket:
+                self.buckets[band].pop(band_key, None)
+
+    def query(self, signature: np.ndarray, threshold: float) -> Optional[Tuple[int, float]]:
+        """
+        Find the most similar indexed signature at or above threshold.
+
+        Returns:
+            (key, estimated similarity), or None
+        """
+        with self.lock:
+            candidates: Set[int] = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self.buckets[band].get(band_key, ()))
+            if not candidates:
+                return None
+
+            rows = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            scores = (self.matrix[rows] == signature).mean(axis=1)
+            best = int(scores.argmax())
+            if scores[best] < threshold:
+                return None
+            return self.keys[rows[best]], float(scores[best])
+
+
+_lsh: Optional[MinHashLSH] = None
+_lsh_lock = threading.Lock()
+
+
+def get_jd_lsh() -> MinHashLSH:
+    """
+    Process-wide LSH index of stored job descriptions.
+
+    Loaded from the jd_signatures table on first use; generations saved
+    before signatures existed are signed and stored then.
+    """
+    global _lsh
+    with _lsh_lock:
+        if _lsh is None:
+            from backend.database import (
+                init_database,
+                get_jd_signatures,
+                get_unsigned_job_descriptions,
+                save_jd_signature,
+            )
+
+            # Callers like the CLI and benchmarks may not have created the tables
+            init_database()
+            lsh = MinHashLSH()
+            for generation_id, blob in get_jd_signatures():
+                lsh.add(generation_id, np.frombuffer(blob, dtype=np.uint32))
+            for generation_id, text, analysis in get_unsigned_job_descriptions():
+                try:
+                    reusable = is_reusable_analysis(json.loads(analysis or "{}"))
+                except json.JSONDecodeError:
+                    reusable = False
+                signature = minhash_signature(text)
+                save_jd_signature(generation_id, signature.tobytes(), reusable)
+                if reusable:
+                    lsh.add(generation_id, signature)
+            _lsh = lsh
+        return _lsh
+
+
+def is_reusable_analysis(jd_analysis: Dict[str, Any]) -> bool:
+    """Whether an analysis found enough to stand in for a new one."""
+    return bool(jd_analysis.get("required_skills")) and bool(jd_analysis.get("ats_keywords"))
+
+
+def index_job_description(generation_id: int, job_description: str, reusable: bool = True):
+    """
+    Store a saved generation's signature and add it to the loaded index.
+
+    Args:
+        generation_id: Saved generation
+        job_description: Its job description text
+        reusable: False for runs that failed or whose analysis found
+            nothing; their signature is stored but never matched
+    """
+    from backend.database import save_jd_signature
+
+    signature = minhash_signature(job_description)
+    save_jd_signature(generation_id, signature.tobytes(), reusable)
+
+    with _lsh_lock:
+        lsh = _lsh
+    if lsh is not None and reusable:
+        lsh.add(generation_id, signature)
+
+
+def unindex_job_description(generation_id: int):
+    """Remove a deleted generation from the loaded index."""
+    with _lsh_lock:
+        lsh = _lsh
+    if lsh is not None:
+        lsh.remove(generation_id)
+
+
+def find_similar_analysis(job_description: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a stored analysis of a near-duplicate job description.
+
+    Args:
+        job_description: New job description text
+
+    Returns:
+        Dict with generation_id, similarity and jd_analysis, or None
+    """
+    from backend.database import get_generation_by_id
+
+    match = get_jd_lsh().query(minhash_signature(job_description), JD_REUSE_THRESHOLD)
+    generation = get_generation_by_id(match[0]) if match else None
+
+    jd_analysis: Dict[str, Any] = {}
+    if generation is not None:
+        try:
+            jd_analysis = json.loads(generation["jd_analysis"] or "{}")
+        except json.JSONDecodeError:
+            pass
+
+    reusable = match is not None and is_reusable_analysis(jd_analysis)
+    record_cache_lookup("jd_reuse", reusable)
+    if match is None or not reusable:
+        return None
+
+    return {
+        "generation_id": match[0],
+        "similarity": round(match[1], 3),
+        "jd_analysis": jd_analysis,
+    }
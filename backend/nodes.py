@@ -1,112 +1,698 @@
 """AI processing nodes for resume optimization workflow."""
 
+import hashlib
 import json
-import re
 import time
 import os
-from typing import Dict, Any, List
-from openai import OpenAI
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 from backend.state import ResumeState
+from backend.ratelimit import (
+    get_rate_limiter,
+    classify_error,
+    backoff_delay,
+    estimate_tokens
+)
+from backend.metrics import LLM_CALLS, STRUCTURED_REPLIES, JSON_REPAIRS, record_cache_lookup
+from backend.resilience import (
+    CircuitOpenError,
+    LLM_HEDGING,
+    get_breaker,
+    get_latency_tracker,
+    hedged_call
+)
+from backend.tracing import traced_node, record_llm_call, record_json_fallback, current_run
+from backend.events import emit, wants_tokens
+from backend.structured import (
+    JSONObjectScanner,
+    find_json_object,
+    JD_ANALYSIS_KEYS,
+    CRITIQUE_KEYS,
+    SUGGESTIONS_KEYS
+)
+from backend.json_repair import repair_json, broken_fragment
+from backend.routing import ModelRoute, get_routes
+from backend.cassette import Cassette, get_cassette, request_key
+from backend.resume_profile import get_profile, resume_view
+from backend.keywords import keyword_coverage
+from backend.ats_lint import apply_lint, lint_resume
+from backend.sections import HEADER, Section, split_sections, join_sections, assign_feedback
 from backend.prompts import (
     JD_ANALYSIS_PROMPT,
     CRITIQUE_PROMPT,
+    SECTION_CRITIQUE_PROMPT,
     SUGGESTIONS_PROMPT,
     TAILORING_PROMPT,
-    FINALIZATION_PROMPT
+    SECTION_REWRITE_PROMPT,
+    FINALIZATION_PROMPT,
+    FIX_JSON_PROMPT
 )
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 # Load environment variables
 load_dotenv()
 
 # API Configuration
 QUBRID_API_KEY = os.getenv("QUBRID_API_KEY", "")
 QUBRID_BASE_URL = os.getenv("QUBRID_BASE_URL", "https://platform.qubrid.com/v1")
-MODEL_NAME = "mistralai/Mistral-7B-Instruct-v0.3"
-MAX_TOKENS = 8192
+
+# Structured output: stream JSON replies and stop once the object is complete
+LLM_STRUCTURED_OUTPUT = os.getenv("LLM_STRUCTURED_OUTPUT", "true").lower() in ("1", "true", "yes")
+
+# JSON response_format: "auto" (use until the endpoint rejects it), "on" or "off"
+LLM_JSON_MODE = os.getenv("LLM_JSON_MODE", "auto").lower()
+
+# Ask streamed replies to end with a usage chunk (stream_options.include_usage)
+LLM_STREAM_USAGE = os.getenv("LLM_STREAM_USAGE", "true").lower() in ("1", "true", "yes")
+
+# Drafting: "single" (one draft + critique), "iterative" (redraft until
+# approved, up to MAX_DRAFT_ITERATIONS) or "best_of_n" (DRAFT_CANDIDATES
+# drafts written and critiqued concurrently, best one kept)
+DRAFT_MODE = os.getenv("DRAFT_MODE", "single").lower()
+MAX_DRAFT_ITERATIONS = 3
+DRAFT_CANDIDATES = int(os.getenv("DRAFT_CANDIDATES", "3"))
+# Candidate drafts in flight across the whole process
+DRAFT_CONCURRENCY = int(os.getenv("DRAFT_CONCURRENCY", "3"))
+# Sampling temperature per candidate (cycled if fewer than DRAFT_CANDIDATES)
+DRAFT_TEMPERATURES = [
+    float(t) for t in os.getenv("DRAFT_TEMPERATURES", "0.5,0.7,0.9").split(",") if t.strip()
+]
+APPROVAL_SCORE = 8.5
+
+# Later iterations rewrite only the sections the critique flagged, in parallel.
+# Only DRAFT_MODE=iterative has later iterations; single drafts once.
+SECTION_REDRAFT = os.getenv("SECTION_REDRAFT", "true").lower() in ("1", "true", "yes")
+SECTION_CONCURRENCY = int(os.getenv("SECTION_CONCURRENCY", "4"))
+
+# Iterative-mode drafts are critiqued per section; unchanged sections reuse cached scores
+SECTION_CRITIQUE = os.getenv("SECTION_CRITIQUE", "true").lower() in ("1", "true", "yes")
+SECTION_SCORE_CACHE_SIZE = int(os.getenv("SECTION_SCORE_CACHE_SIZE", "1024"))
+# formatting_score (and most of ats_score) come from the local linter
+SCORE_KEYS = ("overall_score", "keyword_score", "experience_score", "ats_score")
+
+# Per-node tail-latency settings (hedging also requires LLM_HEDGING=true).
+# Hedges fire after the node's observed p<hedge_percentile> latency, never
+# sooner than hedge_min_delay. Long drafting calls aren't hedged by default
+# because a duplicate doubles their token cost.
+NODE_RESILIENCE = {
+    "default": {"timeout": 60, "hedge": False, "hedge_percentile": 95, "hedge_min_delay": 2.0, "breaker": True},
+    "analyze_jd": {"timeout": 30, "hedge": True, "hedge_percentile": 95, "hedge_min_delay": 2.0, "breaker": True},
+    "critique": {"timeout": 30, "hedge": True, "hedge_percentile": 95, "hedge_min_delay": 2.0, "breaker": True},
+    "suggest": {"timeout": 45, "hedge": True, "hedge_percentile": 95, "hedge_min_delay": 3.0, "breaker": True},
+    "draft": {"timeout": 60, "hedge": False, "hedge_percentile": 95, "hedge_min_delay": 5.0, "breaker": True},
+    "finalize": {"timeout": 60, "hedge": False, "hedge_percentile": 95, "hedge_min_delay": 5.0, "breaker": True},
+}
+
+
+# Endpoints that rejected response_format (JSON mode "auto")
+_json_mode_rejected: Set[str] = set()
+
+# (endpoint, model) pairs that answered 404 -> monotonic time until which
+# fallback chains skip them; retried afterwards in case the model was deployed
+MISSING_MODEL_TTL = float(os.getenv("LLM_MISSING_MODEL_TTL", "600"))
+_missing_models: Dict[Tuple[str, str], float] = {}
+
+# Section score cache: hash of (job requirements, section text) -> critique
+_section_scores: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_section_scores_lock = threading.Lock()
+
+_draft_executor = None
+_section_executor = None
+_executor_lock = threading.Lock()
 
 
 # ===== HELPER FUNCTIONS =====
 
 
+@lru_cache(maxsize=16)
+def _client_for(base_url: str, api_key: str) -> "OpenAI":
+    # openai is slow to import; defer it until the first LLM call
+    from openai import OpenAI
+    
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        # Retries are handled below, with shared rate limiting
+        max_retries=0
+    )
+
+
+def get_client(route: Optional[ModelRoute] = None) -> "OpenAI":
+    """
+    Shared API client per endpoint (keeps HTTP connection pools warm across calls).
+    
+    Args:
+        route: Route whose endpoint to use (defaults to QUBRID_BASE_URL)
+    """
+    if route is None:
+        return _client_for(QUBRID_BASE_URL, QUBRID_API_KEY)
+    return _client_for(route.base_url, route.api_key)
+
+
+def _json_mode_enabled(base_url: str) -> bool:
+    """Whether to request response_format=json_object from the endpoint."""
+    if LLM_JSON_MODE == "on":
+        return True
+    return LLM_JSON_MODE == "auto" and base_url not in _json_mode_rejected
+
+
+@dataclass(frozen=True)
+class EstimatedUsage:
+    """Stand-in for response.usage when a stream ended before reporting it."""
+    
+    prompt_tokens: int
+    completion_tokens: int
+    
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class _ReplyTokens:
+    """
+    Token events of one LLM request.
+    
+    A hedged request streams two replies at once; only the first attempt
+    to send a token emits, so listeners see one text per request.
+    """
+    
+    def __init__(self):
+        self.node = (current_run() or {}).get("node")
+        self.call = uuid.uuid4().hex[:8]
+        # Whether to stream free-text replies for this request
+        self.wanted = wants_tokens(self.node)
+        self._owner: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def emit(self, delta: str):
+        with self._lock:
+            if self._owner is None:
+                self._owner = threading.get_ident()
+            elif self._owner != threading.get_ident():
+                return
+        emit("token", self.node, call=self.call, delta=delta)
+
+
+def _open_stream(client: "OpenAI", request_kwargs: Dict[str, Any]) -> Any:
+    """Start a streamed completion, asking for a final usage chunk."""
+    if LLM_STREAM_USAGE:
+        request_kwargs = {**request_kwargs, "stream_options": {"include_usage": True}}
+    return client.chat.completions.create(**request_kwargs, stream=True)
+
+
+def _estimate_usage(request_kwargs: Dict[str, Any], reply: str) -> EstimatedUsage:
+    """Token counts estimated from the prompt and the reply text."""
+    return EstimatedUsage(
+        prompt_tokens=sum(estimate_tokens(m["content"]) for m in request_kwargs["messages"]),
+        completion_tokens=estimate_tokens(reply)
+    )
+
+
+def _stream_json_completion(
+    client: "OpenAI",
+    request_kwargs: Dict[str, Any],
+    required_keys: Tuple[str, ...],
+    tokens: _ReplyTokens
+) -> Tuple[str, Any]:
+    """
+    Stream a JSON reply and stop as soon as a complete valid object arrives.
+    
+    The usage chunk comes last, so a stream stopped early never gets it;
+    its usage is then estimated from the prompt and the reply.
+    
+    Returns:
+        (reply text, usage reported or estimated)
+    """
+    scanner = JSONObjectScanner(required_keys)
+    parts: List[str] = []
+    usage = None
+    
+    stream = _open_stream(client, request_kwargs)
+    try:
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            parts.append(delta)
+            if delta:
+                tokens.emit(delta)
+            if scanner.feed(delta) is not None:
+                STRUCTURED_REPLIES.inc(outcome="object_complete")
+                text = scanner.result_text or ""
+                return text, usage or _estimate_usage(request_kwargs, text)
+    finally:
+        # Closing the connection stops the server generating tokens we don't need
+        stream.close()
+    
+    # No valid object; hand the whole reply to the JSON fallbacks
+    STRUCTURED_REPLIES.inc(outcome="stream_end")
+    text = "".join(parts)
+    return text, usage or _estimate_usage(request_kwargs, text)
+
+
+def _rejects_json_mode(error: Exception) -> bool:
+    """Whether a 400 is the endpoint refusing response_format (not e.g. a too-long prompt)."""
+    message = str(error).lower()
+    return any(hint in message for hint in ("response_format", "json_object", "json mode"))
+
+
+def _stream_text_completion(
+    client: "OpenAI",
+    request_kwargs: Dict[str, Any],
+    tokens: _ReplyTokens
+) -> Tuple[str, Any]:
+    """
+    Stream a free-text reply, emitting each delta as a 'token' event.
+    
+    Returns:
+        (reply text, usage reported or estimated)
+    """
+    parts: List[str] = []
+    usage = None
+    
+    stream = _open_stream(client, request_kwargs)
+    try:
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if delta:
+                parts.append(delta)
+                tokens.emit(delta)
+    finally:
+        stream.close()
+    
+    text = "".join(parts)
+    return text, usage or _estimate_usage(request_kwargs, text)
+
+
+def _create_completion(
+    route: ModelRoute,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    timeout: float,
+    estimated_tokens: int,
+    required_keys: Optional[Tuple[str, ...]] = None,
+    waits: Optional[List[float]] = None,
+    tokens: Optional[_ReplyTokens] = None
+) -> Tuple[str, Any, float]:
+    """
+    Send one rate-limited chat completion request.
+    
+    Args:
+        route: Model and endpoint to call
+        required_keys: If set, stream a JSON reply and stop once an object
+            with these keys is complete
+        waits: Rate limiter waits are appended here, so they are known
+            even if the request then fails
+        tokens: Token events of the request, shared by its hedged attempts
+    
+    Returns:
+        (reply text, usage or None, seconds spent waiting for the rate limiter)
+    """
+    limiter = get_rate_limiter()
+    waited = limiter.acquire(estimated_tokens)
+    if waits is not None:
+        waits.append(waited)
+    
+    client = get_client(route)
+    if tokens is None:
+        tokens = _ReplyTokens()
+    request_kwargs: Dict[str, Any] = {
+        "model": route.model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": route.max_tokens,
+        "timeout": timeout,
+    }
+    
+    if required_keys is None and tokens.wanted:
+        # Someone is watching the node's text; stream so they see it as it's written
+        content, usage = _stream_text_completion(client, request_kwargs, tokens)
+    elif required_keys is None:
+        response = client.chat.completions.create(**request_kwargs)
+        content = response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+    else:
+        if _json_mode_enabled(route.base_url):
+            request_kwargs["response_format"] = {"type": "json_object"}
+        from openai import BadRequestError
+        
+        try:
+            content, usage = _stream_json_completion(client, request_kwargs, required_keys, tokens)
+        except BadRequestError as e:
+            if "response_format" not in request_kwargs or LLM_JSON_MODE == "on" or not _rejects_json_mode(e):
+                raise
+            # Endpoint doesn't support JSON mode; remember and retry without it
+            _json_mode_rejected.add(route.base_url)
+            request_kwargs.pop("response_format")
+            content, usage = _stream_json_completion(client, request_kwargs, required_keys, tokens)
+    
+    actual_tokens = (
+        usage.total_tokens if usage
+        else estimated_tokens + estimate_tokens(content or "")
+    )
+    limiter.record_usage(estimated_tokens, actual_tokens)
+    return content, usage, waited
+
+
 def call_llm_with_retry(
     messages: List[Dict[str, str]],
     temperature: float = 0.7,
-    max_retries: int = 3
+    max_retries: int = 3,
+    node: str = "default",
+    required_keys: Optional[Tuple[str, ...]] = None
 ) -> str:
     """
-    Call Qubrid API with retry logic.
+    Call the node's routed model with rate limiting, hedging, circuit breaking and retries.
+    
+    Only transient failures (timeouts, connection errors, 429 and 5xx) are
+    retried. A 429's Retry-After pauses every caller in the process. If a
+    model still fails (or its endpoint's breaker is open), the next model
+    in the node's fallback chain (see backend.routing) is tried. With a
+    cassette active (see backend.cassette), replies are recorded to it or
+    replayed from it instead of calling the API.
     
     Args:
         messages: List of message dicts with 'role' and 'content'
-        temperature: Sampling temperature (0=deterministic, 1=creative)
-        max_retries: Maximum number of retry attempts
+        temperature: Sampling temperature (0=deterministic, 1=creative);
+            a route's own temperature takes precedence
+        max_retries: Maximum number of retry attempts per model
+        node: Routing and NODE_RESILIENCE key for the calling node
+        required_keys: Stream a structured JSON reply, stopping generation
+            once an object with these keys is complete
         
     Returns:
         Response text from the model
+        
+    Raises:
+        CircuitOpenError: If the last model's endpoint breaker is open
+        CassetteMissError: If replaying and the request wasn't recorded
     """
-    client = OpenAI(
-        api_key=QUBRID_API_KEY,
-        base_url=QUBRID_BASE_URL
+    cassette = get_cassette()
+    if cassette is not None:
+        key = request_key(node, messages, required_keys, temperature)
+        if cassette.replaying:
+            return _replay(cassette, key, messages, node)
+    
+    routes = get_routes(node)
+    now = time.monotonic()
+    available = [r for r in routes if _missing_models.get((r.base_url, r.model), 0.0) <= now]
+    routes = available or routes
+    
+    for index, route in enumerate(routes):
+        try:
+            start = time.monotonic()
+            content = _call_route(route, messages, temperature, max_retries, node, required_keys)
+        except Exception:
+            if index == len(routes) - 1:
+                raise
+            # Counted here; the failed attempts are already in the node trace
+            LLM_CALLS.inc(node=node, outcome="fallback")
+            continue
+        
+        # Outside the try: a failed cassette write must not trigger a fallback call
+        if cassette is not None:
+            cassette.record(key, node, route.model, content, time.monotonic() - start)
+        return content
+    
+    raise ValueError(f"No model routes configured for node '{node}'")
+
+
+def _replay(cassette: Cassette, key: str, messages: List[Dict[str, str]], node: str) -> str:
+    """Serve a call from the cassette, traced like a live one."""
+    entry = cassette.replay(key)
+    content: str = entry["response"]
+    
+    LLM_CALLS.inc(node=node, outcome="replayed")
+    record_llm_call(
+        attempts=1,
+        queue_time=0.0,
+        prompt_bytes=sum(len(m["content"].encode("utf-8")) for m in messages),
+        response_bytes=len((content or "").encode("utf-8")),
+        model=entry.get("model")
     )
+    return content
+
+
+def _call_route(
+    route: ModelRoute,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_retries: int,
+    node: str,
+    required_keys: Optional[Tuple[str, ...]]
+) -> str:
+    """Call one model, retrying transient failures (see call_llm_with_retry)."""
+    config = NODE_RESILIENCE.get(node, NODE_RESILIENCE["default"])
+    breaker = get_breaker(route.base_url) if config["breaker"] else None
+    latency = get_latency_tracker(node)
+    estimated_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+    prompt_bytes = sum(len(m["content"].encode("utf-8")) for m in messages)
+    backoff_time = 0.0
+    waits: List[float] = []
+    if route.temperature is not None:
+        temperature = route.temperature
+    
+    def request(tokens: _ReplyTokens) -> Tuple[str, Any, float]:
+        return _create_completion(
+            route, messages, temperature, config["timeout"], estimated_tokens, required_keys,
+            waits, tokens
+        )
     
     for attempt in range(max_retries):
+        # One token stream per attempt, shared by its hedge
+        attempt_request = partial(request, _ReplyTokens())
+        
+        if breaker:
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                LLM_CALLS.inc(node=node, outcome="circuit_open")
+                raise
+        
         try:
-            response = client.chat.completions.create(
-                model=MODEL_NAME,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=MAX_TOKENS,
-                timeout=60
+            start = time.monotonic()
+            
+            hedge_delay = None
+            if LLM_HEDGING and config["hedge"]:
+                observed = latency.percentile(config["hedge_percentile"])
+                hedge_delay = max(config["hedge_min_delay"], observed or config["timeout"] / 2)
+            
+            content, usage, waited = (
+                hedged_call(attempt_request, hedge_delay) if hedge_delay else attempt_request()
             )
-            return response.choices[0].message.content
+            
+            latency.record(time.monotonic() - start - waited)
+            if breaker:
+                breaker.record_success()
+            
+            LLM_CALLS.inc(node=node, outcome="success")
+            record_llm_call(
+                attempts=attempt + 1,
+                queue_time=waited + backoff_time,
+                prompt_bytes=prompt_bytes,
+                response_bytes=len((content or "").encode("utf-8")),
+                usage=usage,
+                model=route.model
+            )
+            return content
             
         except Exception as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                time.sleep(wait_time)
-                continue
-            else:
+            retryable, retry_after = classify_error(e)
+            
+            if breaker:
+                # Only endpoint health problems count against the breaker
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.release_trial()
+            
+            if getattr(e, "status_code", None) == 429:
+                LLM_CALLS.inc(node=node, outcome="rate_limited")
+            elif getattr(e, "status_code", None) == 404:
+                # Model not served here; later calls go straight to the fallback
+                _missing_models[(route.base_url, route.model)] = time.monotonic() + MISSING_MODEL_TTL
+            
+            if not retryable or attempt >= max_retries - 1:
+                LLM_CALLS.inc(node=node, outcome="failure")
+                record_llm_call(
+                    attempts=attempt + 1,
+                    queue_time=sum(waits) + backoff_time,
+                    prompt_bytes=prompt_bytes,
+                    response_bytes=0,
+                    model=route.model,
+                    failed=True
+                )
                 raise Exception(f"API call failed: {str(e)}")
+            
+            LLM_CALLS.inc(node=node, outcome="retry")
+            
+            if retry_after is not None:
+                # Next acquire() waits out the pause for everyone
+                get_rate_limiter().pause(retry_after)
+            else:
+                delay = backoff_delay(attempt)
+                backoff_time += delay
+                time.sleep(delay)
+    
+    raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+
+
+def extract_json_from_text(text: str, required_keys: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Extract the first complete JSON object with required_keys from text (code blocks, prose around it)."""
+    obj = find_json_object(text, required_keys)
+    if obj is None:
+        raise ValueError("No valid JSON found in response")
+    return obj
+
+
+def parse_json_response(
+    response: str,
+    required_keys: Tuple[str, ...] = (),
+    node: str = "default"
+) -> Dict[str, Any]:
+    """
+    Parse a JSON reply, recovering locally from common defects.
+    
+    Falls back to extracting the object from surrounding text, then to
+    repair_json (trailing commas, smart quotes, truncation, ...). A
+    recovered object must contain every required key, so a reply cut off
+    before one of them goes to the re-ask instead.
+    
+    Raises:
+        ValueError: If no object with the required keys can be recovered
+    """
+    try:
+        parsed = json.loads(response)
+    except json.JSONDecodeError:
+        record_json_fallback()
+    else:
+        if isinstance(parsed, dict):
+            return parsed
+    
+    try:
+        obj = extract_json_from_text(response, required_keys)
+        JSON_REPAIRS.inc(node=node, outcome="extracted")
+        return obj
+    except ValueError:
+        pass
+    
+    repaired = repair_json(response, required_keys)
+    if repaired is None:
+        raise ValueError("No valid JSON found in response")
+    
+    JSON_REPAIRS.inc(node=node, outcome="repaired")
+    return repaired
 
 
-def extract_json_from_text(text: str) -> Dict[str, Any]:
-    """Extract JSON from text that might have markdown code blocks."""
-    # Try to find JSON in code blocks
-    match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
-    if match:
-        return json.loads(match.group(1))
+def call_llm_json(
+    messages: List[Dict[str, str]],
+    temperature: float,
+    node: str,
+    required_keys: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """
+    Call the model for a JSON object.
+    
+    With LLM_STRUCTURED_OUTPUT on, the reply is streamed in JSON mode and
+    generation stops as soon as a complete object with required_keys arrives.
+    A reply that can't be repaired locally is sent back once with a short
+    fix-this-JSON prompt instead of re-running the whole request.
+    
+    Returns:
+        Parsed JSON object
+    
+    Raises:
+        ValueError: If the reply is still malformed after the re-ask
+    """
+    structured_keys = required_keys if LLM_STRUCTURED_OUTPUT else None
+    response = call_llm_with_retry(
+        messages,
+        temperature=temperature,
+        node=node,
+        required_keys=structured_keys
+    )
     
-    # Try to find raw JSON
-    match = re.search(r'\{.*\}', text, re.DOTALL)
-    if match:
-        return json.loads(match.group(0))
+    try:
+        return parse_json_response(response, required_keys, node)
+    except ValueError:
+        pass
+    
+    fix_prompt = FIX_JSON_PROMPT.format(
+        fragment=broken_fragment(response),
+        required_keys=", ".join(required_keys)
+    )
+    fixed = call_llm_with_retry(
+        [{"role": "user", "content": fix_prompt}],
+        temperature=0.0,
+        node=node,
+        required_keys=structured_keys
+    )
+    
+    try:
+        obj = parse_json_response(fixed, required_keys, node)
+    except ValueError:
+        JSON_REPAIRS.inc(node=node, outcome="failed")
+        raise
+    
+    JSON_REPAIRS.inc(node=node, outcome="reasked")
+    return obj
+
+
+def _find_reusable_analysis(job_description: str) -> Optional[Dict[str, Any]]:
+    # numpy-backed; imported on first analysis
+    from backend.minhash import JD_REUSE, find_similar_analysis
     
-    raise ValueError("No valid JSON found in response")
+    if not JD_REUSE:
+        return None
+    return find_similar_analysis(job_description)
 
 
+@traced_node("analyze_jd")
 def analyze_job_description(state: ResumeState) -> ResumeState:
     """
     Extract structured information from job description.
     
+    Reuses the stored analysis of a near-duplicate posting (see
+    backend.minhash) instead of calling the LLM when JD_REUSE is on.
+    
     Returns: Updated state with jd_analysis
     """
+    metadata = dict(state.get("metadata") or {})
+    try:
+        reused = _find_reusable_analysis(state["job_description"])
+    except Exception as e:
+        # A missing or unreadable history never blocks analysis
+        reused = None
+        metadata["jd_reuse_error"] = f"JD reuse lookup failed: {str(e)}"
+    
+    if reused:
+        metadata["jd_reused_from"] = reused["generation_id"]
+        metadata["jd_similarity"] = reused["similarity"]
+        return {**state, "jd_analysis": reused["jd_analysis"], "metadata": metadata}
+    
     try:
         prompt = JD_ANALYSIS_PROMPT.format(
             job_description=state["job_description"]
         )
         
         messages = [{"role": "user", "content": prompt}]
-        response = call_llm_with_retry(messages, temperature=0.3)
+        jd_analysis = call_llm_json(messages, 0.3, "analyze_jd", JD_ANALYSIS_KEYS)
         
-        # Parse JSON response
-        try:
-            jd_analysis = json.loads(response)
-        except json.JSONDecodeError:
-            jd_analysis = extract_json_from_text(response)
-        
-        return {**state, "jd_analysis": jd_analysis}
+        return {**state, "jd_analysis": jd_analysis, "metadata": metadata}
         
     except Exception as e:
         # Return state with error and fallback values
@@ -119,10 +705,170 @@ def analyze_job_description(state: ResumeState) -> ResumeState:
                 "key_responsibilities": [],
                 "ats_keywords": []
             },
+            "metadata": metadata,
             "error": f"JD Analysis failed: {str(e)}"
         }
 
 
+def _section_score_key(section: Section, job_requirements: str) -> str:
+    text = f"{job_requirements}\0{section.heading}\0{section.body.strip()}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _cached_section_score(key: str) -> Optional[Dict[str, Any]]:
+    with _section_scores_lock:
+        critique = _section_scores.get(key)
+        if critique is not None:
+            _section_scores.move_to_end(key)
+    record_cache_lookup("section_scores", critique is not None)
+    return critique
+
+
+def _store_section_score(key: str, critique: Dict[str, Any]):
+    with _section_scores_lock:
+        _section_scores[key] = critique
+        _section_scores.move_to_end(key)
+        while len(_section_scores) > SECTION_SCORE_CACHE_SIZE:
+            _section_scores.popitem(last=False)
+
+
+def score_section(section: Section, job_requirements: str) -> Dict[str, Any]:
+    """
+    Score one resume section, reusing the cached score if its text is unchanged.
+    
+    Args:
+        section: Section from split_sections
+        job_requirements: JD analysis as JSON text
+    
+    Returns:
+        Critique dict for the section
+    """
+    key = _section_score_key(section, job_requirements)
+    cached = _cached_section_score(key)
+    if cached is not None:
+        return cached
+    
+    prompt = SECTION_CRITIQUE_PROMPT.format(
+        section=section.text,
+        job_requirements=job_requirements
+    )
+    messages = [{"role": "user", "content": prompt}]
+    critique = call_llm_json(messages, 0.1, "critique", CRITIQUE_KEYS)
+    
+    _store_section_score(key, critique)
+    return critique
+
+
+def _as_score(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def combine_section_scores(scored: List[Tuple[Section, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Build a whole-resume critique from per-section critiques.
+    
+    Scores are averaged weighted by section length. Feedback and
+    improvements are prefixed with their section title so the next
+    redraft can route them back to the right section.
+    """
+    total = sum(len(section.text) for section, _ in scored) or 1
+    critique: Dict[str, Any] = {
+        key: round(sum(
+            _as_score(part.get(key)) * len(section.text) for section, part in scored
+        ) / total, 1)
+        for key in SCORE_KEYS
+    }
+    
+    feedback = []
+    improvements: List[str] = []
+    for section, part in scored:
+        title = section.heading.lstrip('#').strip() or "Header"
+        if part.get("feedback"):
+            feedback.append(f"{title}: {part['feedback']}")
+        improvements.extend(f"{title}: {item}" for item in part.get("improvements_needed", []))
+    
+    critique["feedback"] = " ".join(feedback)
+    critique["improvements_needed"] = improvements
+    critique["section_scores"] = {
+        section.key: _as_score(part.get("overall_score")) for section, part in scored
+    }
+    return critique
+
+
+def score_resume_by_section(resume: str, jd_analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Score a resume section by section, only calling the model for sections
+    whose text changed since they were last scored.
+    
+    The header (name, contact line) is scored too, so the combined score
+    covers the same text as a whole-resume critique.
+    
+    Returns:
+        Combined critique, or None if the resume has fewer than two sections
+    """
+    sections = [
+        section for section in split_sections(resume)
+        if section.key != HEADER or section.body.strip()
+    ]
+    if sum(section.key != HEADER for section in sections) < 2:
+        return None
+    
+    job_requirements = json.dumps(jd_analysis, indent=2)
+    executor = _get_section_executor()
+    futures = [
+        executor.submit(copy_context().run, score_section, section, job_requirements)
+        for section in sections
+    ]
+    
+    return combine_section_scores([
+        (section, future.result()) for section, future in zip(sections, futures)
+    ])
+
+
+def score_resume(
+    resume: str,
+    jd_analysis: Dict[str, Any],
+    by_section: bool = False,
+    layout: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Score one resume against the job requirements.
+    
+    The model scores content; formatting and most of the ATS score come
+    from the local linter.
+    
+    Args:
+        resume: Resume Markdown
+        jd_analysis: Output of analyze_job_description
+        by_section: Score per section with cached scores for unchanged ones
+        layout: PDF layout of the original upload (utils.inspect_pdf)
+    
+    Returns:
+        Critique dict with scores, feedback and an 'approved' flag
+    """
+    critique = score_resume_by_section(resume, jd_analysis) if by_section else None
+    
+    if critique is None:
+        prompt = CRITIQUE_PROMPT.format(
+            resume=resume,
+            job_requirements=json.dumps(jd_analysis, indent=2)
+        )
+        
+        messages = [{"role": "user", "content": prompt}]
+        critique = call_llm_json(messages, 0.1, "critique", CRITIQUE_KEYS)
+    
+    critique = apply_lint(critique, lint_resume(resume, layout))
+    
+    # Add approval flag
+    overall_score = critique.get("overall_score", 0)
+    critique["approved"] = overall_score >= APPROVAL_SCORE
+    return critique
+
+
+@traced_node("critique")
 def critique_resume(state: ResumeState) -> ResumeState:
     """
     Score resume against job requirements.
@@ -131,30 +877,25 @@ def critique_resume(state: ResumeState) -> ResumeState:
     """
     try:
         # Determine which resume to score
+        profile = get_profile(state)
         resume_to_score = state.get("draft_resume") or state["original_resume"]
+        layout = None
+        if resume_to_score == state["original_resume"]:
+            resume_to_score = resume_view(profile, "critique")
+            layout = state.get("resume_layout")
         
-        # Get JD analysis
-        jd_analysis = state.get("jd_analysis", {})
-        
-        prompt = CRITIQUE_PROMPT.format(
-            resume=resume_to_score,
-            job_requirements=json.dumps(jd_analysis, indent=2)
+        # Iterative redrafts change a few sections per round; scoring by
+        # section lets later rounds reuse the cached scores of the rest.
+        # Other modes score one draft, with nothing cached to reuse.
+        by_section = (
+            SECTION_CRITIQUE
+            and state.get("iteration", 0) > 0
+            and state.get("draft_mode", DRAFT_MODE) == "iterative"
         )
+        critique = score_resume(resume_to_score, state.get("jd_analysis", {}), by_section, layout)
+        coverage = keyword_coverage(state.get("jd_analysis", {}), resume_to_score)
         
-        messages = [{"role": "user", "content": prompt}]
-        response = call_llm_with_retry(messages, temperature=0.1)
-        
-        # Parse JSON response
-        try:
-            critique = json.loads(response)
-        except json.JSONDecodeError:
-            critique = extract_json_from_text(response)
-        
-        # Add approval flag
-        overall_score = critique.get("overall_score", 0)
-        critique["approved"] = overall_score >= 8.5
-        
-        return {**state, "critique": critique}
+        return {**state, "critique": critique, "keyword_coverage": coverage, "resume_profile": profile}
         
     except Exception as e:
         # Return state with error and fallback critique
@@ -174,6 +915,7 @@ def critique_resume(state: ResumeState) -> ResumeState:
         }
 
 
+@traced_node("suggest")
 def draft_suggestions_only(state: ResumeState) -> ResumeState:
     """
     Generate improvement suggestions without rewriting resume.
@@ -184,27 +926,26 @@ def draft_suggestions_only(state: ResumeState) -> ResumeState:
         jd_analysis = state.get("jd_analysis", {})
         critique = state.get("critique", {})
         
+        profile = get_profile(state)
+        resume = resume_view(profile, "suggest")
+        missing = keyword_coverage(jd_analysis, resume)["missing"]
+        
         prompt = SUGGESTIONS_PROMPT.format(
-            original_resume=state["original_resume"],
+            original_resume=resume,
             job_requirements=json.dumps(jd_analysis, indent=2),
-            critique_scores=json.dumps(critique, indent=2)
+            critique_scores=json.dumps(critique, indent=2),
+            missing_keywords=", ".join(missing) or "None"
         )
         
         messages = [{"role": "user", "content": prompt}]
-        response = call_llm_with_retry(messages, temperature=0.6)
-        
-        # Parse JSON response
-        try:
-            suggestions_data = json.loads(response)
-            suggestions = suggestions_data.get("suggestions", [])
-        except json.JSONDecodeError:
-            suggestions_data = extract_json_from_text(response)
-            suggestions = suggestions_data.get("suggestions", [])
+        suggestions_data = call_llm_json(messages, 0.6, "suggest", SUGGESTIONS_KEYS)
+        suggestions = suggestions_data.get("suggestions", [])
         
         return {
             **state,
             "suggestions": suggestions,
-            "awaiting_approval": True
+            "awaiting_approval": True,
+            "resume_profile": profile
         }
         
     except Exception as e:
@@ -216,6 +957,154 @@ def draft_suggestions_only(state: ResumeState) -> ResumeState:
         }
 
 
+def write_draft(state: ResumeState, profile: Dict[str, Any], temperature: float) -> str:
+    """
+    Rewrite the original resume using the approved suggestions.
+    
+    Args:
+        state: Pipeline state
+        profile: Profile of the original resume (see get_profile)
+        temperature: Sampling temperature
+    
+    Returns:
+        Draft resume Markdown
+    """
+    jd_analysis = state.get("jd_analysis", {})
+    suggestions = state.get("suggestions", [])
+    
+    # Format suggestions as text
+    suggestions_text = "\n".join([
+        f"- {s.get('category', 'General')}: {s.get('suggestion', '')}"
+        for s in suggestions
+    ])
+    
+    prompt = TAILORING_PROMPT.format(
+        original_resume=resume_view(profile, "draft"),
+        job_requirements=json.dumps(jd_analysis, indent=2),
+        suggestions=suggestions_text,
+        iteration=state.get("iteration", 0)
+    )
+    
+    messages = [
+        {"role": "system", "content": "You are an expert resume writer."},
+        {"role": "user", "content": prompt}
+    ]
+    
+    return call_llm_with_retry(messages, temperature=temperature, node="draft")
+
+
+def _get_draft_executor() -> ThreadPoolExecutor:
+    """Process-wide pool bounding concurrent candidate drafts."""
+    global _draft_executor
+    with _executor_lock:
+        if _draft_executor is None:
+            _draft_executor = ThreadPoolExecutor(
+                max_workers=DRAFT_CONCURRENCY,
+                thread_name_prefix="resume-draft"
+            )
+        return _draft_executor
+
+
+def _get_section_executor() -> ThreadPoolExecutor:
+    """Process-wide pool bounding concurrent section rewrites."""
+    global _section_executor
+    with _executor_lock:
+        if _section_executor is None:
+            _section_executor = ThreadPoolExecutor(
+                max_workers=SECTION_CONCURRENCY,
+                thread_name_prefix="resume-section"
+            )
+        return _section_executor
+
+
+def rewrite_section(section: Section, feedback: List[str], jd_analysis: Dict[str, Any]) -> Section:
+    """
+    Rewrite one section with a small, section-only prompt.
+    
+    Returns:
+        Section with the same key and heading and a new body
+    """
+    prompt = SECTION_REWRITE_PROMPT.format(
+        section=section.text,
+        job_requirements=json.dumps(jd_analysis, indent=2),
+        feedback="\n".join(f"- {item}" for item in feedback)
+    )
+    
+    messages = [
+        {"role": "system", "content": "You are an expert resume writer."},
+        {"role": "user", "content": prompt}
+    ]
+    
+    body = call_llm_with_retry(messages, temperature=0.7, node="draft").strip()
+    
+    # Drop code fences and any heading the model repeated; ours is kept
+    body = body.removeprefix("```markdown").removeprefix("```").removesuffix("```").strip()
+    lines = body.split('\n')
+    if lines and lines[0].startswith('#'):
+        body = '\n'.join(lines[1:]).strip()
+    
+    return replace(section, body=body + "\n")
+
+
+def redraft_weak_sections(state: ResumeState) -> Optional[Tuple[str, List[str], Dict[str, str]]]:
+    """
+    Rewrite only the sections the latest critique flagged, in parallel.
+    
+    A section whose rewrite fails keeps its previous text.
+    
+    Returns:
+        (spliced resume, keys of rewritten sections, key -> error for
+        sections that failed), or None when a full redraft is needed (no
+        sections, nothing matched, all flagged, or every rewrite failed)
+    """
+    draft = state.get("draft_resume") or state["original_resume"]
+    sections = split_sections(draft)
+    feedback = assign_feedback(sections, state.get("critique", {}).get("improvements_needed", []))
+    general = feedback.pop("", [])
+    
+    body_sections = [section for section in sections if section.key != HEADER]
+    if not feedback or len(feedback) >= len(body_sections):
+        return None
+    
+    jd_analysis = state.get("jd_analysis", {})
+    executor = _get_section_executor()
+    futures = {
+        section.key: executor.submit(
+            copy_context().run, rewrite_section, section, feedback[section.key] + general, jd_analysis
+        )
+        for section in sections if section.key in feedback
+    }
+    
+    rewritten = []
+    failed = {}
+    spliced = []
+    for section in sections:
+        future = futures.get(section.key)
+        if future is None:
+            spliced.append(section)
+            continue
+        try:
+            spliced.append(future.result())
+            rewritten.append(section.key)
+        except Exception as e:
+            failed[section.key] = str(e)
+            spliced.append(section)
+    
+    if not rewritten:
+        return None
+    
+    return join_sections(spliced), rewritten, failed
+
+
+def _draft_candidate(state: ResumeState, profile: Dict[str, Any], temperature: float) -> Dict[str, Any]:
+    """Write and score one candidate draft."""
+    draft = write_draft(state, profile, temperature)
+    critique = score_resume(draft, state.get("jd_analysis", {}))
+    coverage = keyword_coverage(state.get("jd_analysis", {}), draft)
+    return {"draft": draft, "critique": critique, "coverage": coverage, "temperature": temperature}
+
+
+@traced_node("draft")
 def draft_tailored_resume(state: ResumeState) -> ResumeState:
     """
     Rewrite resume to match job requirements.
@@ -223,28 +1112,23 @@ def draft_tailored_resume(state: ResumeState) -> ResumeState:
     Returns: Updated state with draft_resume
     """
     try:
-        jd_analysis = state.get("jd_analysis", {})
-        suggestions = state.get("suggestions", [])
-        
-        # Format suggestions as text
-        suggestions_text = "\n".join([
-            f"- {s.get('category', 'General')}: {s.get('suggestion', '')}"
-            for s in suggestions
-        ])
-        
-        prompt = TAILORING_PROMPT.format(
-            original_resume=state["original_resume"],
-            job_requirements=json.dumps(jd_analysis, indent=2),
-            suggestions=suggestions_text,
-            iteration=state.get("iteration", 0)
-        )
-        
-        messages = [
-            {"role": "system", "content": "You are an expert resume writer."},
-            {"role": "user", "content": prompt}
-        ]
+        # The first draft applies the suggestions everywhere; later ones
+        # (DRAFT_MODE=iterative only) touch just the sections the critique
+        # still flags
+        profile = get_profile(state)
+        redraft = None
+        if SECTION_REDRAFT and state.get("iteration", 0) > 0:
+            redraft = redraft_weak_sections(state)
         
-        response = call_llm_with_retry(messages, temperature=0.7)
+        metadata = dict(state.get("metadata") or {})
+        metadata.pop("redrafted_sections", None)
+        metadata.pop("section_rewrite_errors", None)
+        if redraft:
+            response, metadata["redrafted_sections"], failed = redraft
+            if failed:
+                metadata["section_rewrite_errors"] = failed
+        else:
+            response = write_draft(state, profile, temperature=0.7)
         
         # Increment iteration
         iteration = state.get("iteration", 0) + 1
@@ -252,7 +1136,9 @@ def draft_tailored_resume(state: ResumeState) -> ResumeState:
         return {
             **state,
             "draft_resume": response,
-            "iteration": iteration
+            "iteration": iteration,
+            "metadata": metadata,
+            "resume_profile": profile
         }
         
     except Exception as e:
@@ -263,6 +1149,68 @@ def draft_tailored_resume(state: ResumeState) -> ResumeState:
         }
 
 
+@traced_node("draft_best_of_n")
+def draft_best_of_n(state: ResumeState) -> ResumeState:
+    """
+    Write DRAFT_CANDIDATES drafts concurrently, score each, keep the best.
+    
+    Replaces the draft → critique loop: one round of parallel calls instead
+    of up to MAX_DRAFT_ITERATIONS sequential rounds.
+    
+    Returns: Updated state with draft_resume, its critique and draft_candidates
+    """
+    executor = _get_draft_executor()
+    profile = get_profile(state)
+    temperatures = [
+        DRAFT_TEMPERATURES[i % len(DRAFT_TEMPERATURES)] if DRAFT_TEMPERATURES else 0.7
+        for i in range(max(1, DRAFT_CANDIDATES))
+    ]
+    
+    # copy_context keeps LLM calls recorded against this node's trace
+    futures = [
+        executor.submit(copy_context().run, _draft_candidate, state, profile, temperature)
+        for temperature in temperatures
+    ]
+    
+    candidates = []
+    errors = []
+    for future in futures:
+        try:
+            candidates.append(future.result())
+        except Exception as e:
+            errors.append(str(e))
+    
+    if not candidates:
+        return {
+            **state,
+            "draft_resume": state["original_resume"],
+            "error": f"Resume drafting failed: {errors[0]}"
+        }
+    
+    best = max(candidates, key=lambda c: c["critique"].get("overall_score", 0))
+    metadata = dict(state.get("metadata") or {})
+    metadata["draft_candidates"] = [
+        {
+            "temperature": c["temperature"],
+            "overall_score": c["critique"].get("overall_score", 0),
+            "keyword_coverage": c["coverage"]["coverage"],
+            "selected": c is best,
+        }
+        for c in candidates
+    ]
+    
+    return {
+        **state,
+        "draft_resume": best["draft"],
+        "critique": best["critique"],
+        "keyword_coverage": best["coverage"],
+        "resume_profile": profile,
+        "iteration": state.get("iteration", 0) + 1,
+        "metadata": metadata
+    }
+
+
+@traced_node("finalize")
 def finalize_resume(state: ResumeState) -> ResumeState:
     """
     Polish and finalize the resume.
@@ -275,7 +1223,7 @@ def finalize_resume(state: ResumeState) -> ResumeState:
         prompt = FINALIZATION_PROMPT.format(resume=draft)
         
         messages = [{"role": "user", "content": prompt}]
-        response = call_llm_with_retry(messages, temperature=0.5)
+        response = call_llm_with_retry(messages, temperature=0.5, node="finalize")
         
         return {
             **state,
@@ -0,0 +1,190 @@
+"""End-to-end evaluation and generation pipelines built from the workflow nodes."""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from backend.state import ResumeState
+from backend.events import emit
+from backend.resume_profile import parse_resume_profile
+from backend.nodes import (
+    analyze_job_description,
+    critique_resume,
+    draft_suggestions_only,
+    draft_tailored_resume,
+    draft_best_of_n,
+    finalize_resume,
+    DRAFT_MODE,
+    MAX_DRAFT_ITERATIONS
+)
+
+# Progress callback: (percent complete, stage name)
+ProgressCallback = Callable[[int, str], None]
+
+# (stage name, node, percent reported when the stage starts)
+EVALUATION_STEPS = [
+    ("analyze_jd", analyze_job_description, 25),
+    ("critique_original", critique_resume, 50),
+    ("suggest", draft_suggestions_only, 75),
+]
+
+GENERATION_STEPS = [
+    ("draft", draft_tailored_resume, 33),
+    ("critique_draft", critique_resume, 66),
+    ("finalize", finalize_resume, 90),
+]
+
+# Candidates are critiqued inside the drafting step
+BEST_OF_N_STEPS = [
+    ("draft", draft_best_of_n, 33),
+    ("finalize", finalize_resume, 90),
+]
+
+
+def build_initial_state(
+    resume_content: str,
+    resume_filename: str,
+    jd_content: str,
+    jd_source: str,
+    resume_layout: Optional[Dict[str, Any]] = None
+) -> ResumeState:
+    """
+    Create the starting state for an evaluation.
+
+    Args:
+        resume_content: Resume text
+        resume_filename: Original resume filename
+        jd_content: Job description text
+        jd_source: Where the job description came from
+        resume_layout: utils.inspect_pdf result for a PDF upload
+
+    Returns:
+        Initial ResumeState
+    """
+    state: ResumeState = {
+        "original_resume": resume_content,
+        "job_description": jd_content,
+        "resume_filename": resume_filename,
+        "jd_source": jd_source,
+        "resume_profile": parse_resume_profile(resume_content),
+        "draft_resume": resume_content,
+        "iteration": 0,
+        "metadata": {
+            "start_time": datetime.now().isoformat()
+        }
+    }
+    if resume_layout:
+        state["resume_layout"] = resume_layout
+    return state
+
+
+def _run_steps(state: ResumeState, steps, progress: Optional[ProgressCallback]) -> ResumeState:
+    """Run nodes in order, reporting progress before each one."""
+    for stage, node, percent in steps:
+        if progress:
+            progress(percent, stage)
+        emit("stage", stage, progress=percent)
+        state.update(node(state))
+    return state
+
+
+def run_drafting(
+    state: ResumeState,
+    progress: Optional[ProgressCallback] = None,
+    mode: Optional[str] = None
+) -> ResumeState:
+    """
+    Produce a scored, finalized draft without saving anything.
+
+    Args:
+        state: State returned by run_evaluation
+        progress: Optional progress callback
+        mode: 'single', 'iterative' or 'best_of_n' (defaults to the state's
+            draft_mode, then DRAFT_MODE)
+
+    Returns:
+        State with draft_resume, critique and final_resume
+    """
+    mode = mode or state.get("draft_mode") or DRAFT_MODE
+    state["draft_mode"] = mode
+
+    if mode == "best_of_n":
+        return _run_steps(state, BEST_OF_N_STEPS, progress)
+
+    if mode != "iterative":
+        return _run_steps(state, GENERATION_STEPS, progress)
+
+    # Redraft until the critique approves, the iteration limit is hit or
+    # drafting fails (a failed draft doesn't count as an iteration)
+    span = 60 // MAX_DRAFT_ITERATIONS
+    for round_number in range(MAX_DRAFT_ITERATIONS):
+        base = 30 + span * round_number
+        previous_error = state.get("error")
+        _run_steps(state, [("draft", draft_tailored_resume, base)], progress)
+        # Nodes carry earlier errors forward as the same object
+        if state.get("error") is not previous_error:
+            break
+        _run_steps(state, [("critique_draft", critique_resume, base + span // 2)], progress)
+        if (state.get("critique") or {}).get("approved") or state["iteration"] >= MAX_DRAFT_ITERATIONS:
+            break
+
+    return _run_steps(state, GENERATION_STEPS[-1:], progress)
+
+
+def run_evaluation(state: ResumeState, progress: Optional[ProgressCallback] = None) -> ResumeState:
+    """
+    STEP 1: Analyze the JD, score the resume and generate suggestions.
+
+    Args:
+        state: Initial state from build_initial_state
+        progress: Optional progress callback
+
+    Returns:
+        State with jd_analysis, critique, initial_critique and suggestions
+    """
+    state = _run_steps(state, EVALUATION_STEPS, progress)
+    state["initial_critique"] = state.get("critique")
+    return state
+
+
+def run_generation(
+    state: ResumeState,
+    progress: Optional[ProgressCallback] = None,
+    mode: Optional[str] = None
+) -> ResumeState:
+    """
+    STEP 2: Draft, score and finalize the resume, then save outputs and history.
+
+    Args:
+        state: State returned by run_evaluation
+        progress: Optional progress callback
+        mode: 'single', 'iterative' or 'best_of_n' (defaults to DRAFT_MODE)
+
+    Returns:
+        State with final_resume, output paths and generation_id
+    """
+    from backend.exporters import export_document
+    from backend.database import save_generation
+    from backend.storage import maybe_run_maintenance
+
+    state = run_drafting(state, progress, mode)
+
+    if progress:
+        progress(95, "save")
+    emit("stage", "save", progress=95)
+
+    # Parse once, render Markdown and PDF (PDF is optional - None if it fails)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    paths = export_document(state["final_resume"], f"resume_{timestamp}", ("md", "pdf"))
+
+    state["output_markdown_path"] = str(paths["md"])
+    state["output_pdf_path"] = str(paths["pdf"]) if paths["pdf"] else None
+
+    state["generation_id"] = save_generation(state, {
+        "markdown": str(paths["md"]),
+        "pdf": str(paths["pdf"]) if paths["pdf"] else ""
+    })
+
+    # Prune old and orphaned output files (throttled)
+    maybe_run_maintenance()
+
+    return state
@@ -31,12 +31,31 @@ Return ONLY a JSON object:
     "keyword_score": 9,
     "experience_score": 8,
     "ats_score": 9,
-    "formatting_score": 8,
     "feedback": "detailed feedback here",
     "improvements_needed": ["improvement1", "improvement2"]
 }}
 """
 
+SECTION_CRITIQUE_PROMPT = """
+Score this section of a resume against the job requirements.
+
+Section:
+{section}
+
+Job Requirements:
+{job_requirements}
+
+Return ONLY a JSON object:
+{{
+    "overall_score": 8.5,
+    "keyword_score": 9,
+    "experience_score": 8,
+    "ats_score": 9,
+    "feedback": "feedback on this section",
+    "improvements_needed": ["improvement1"]
+}}
+"""
+
 SUGGESTIONS_PROMPT = """
 Generate specific improvement suggestions for this resume.
 
@@ -49,6 +68,9 @@ Job Requirements:
 Current Scores:
 {critique_scores}
 
+Job Keywords Missing From The Resume:
+{missing_keywords}
+
 Return ONLY a JSON object:
 {{
     "suggestions": [
@@ -73,6 +95,21 @@ Apply These Suggestions:
 Return the improved resume in Markdown format.
 """
 
+SECTION_REWRITE_PROMPT = """
+Rewrite this one section of a resume to address the feedback. Keep all information factual.
+
+Section:
+{section}
+
+Job Requirements:
+{job_requirements}
+
+Feedback For This Section:
+{feedback}
+
+Return ONLY the rewritten section body in Markdown, without the section heading.
+"""
+
 FINALIZATION_PROMPT = """
 Polish and finalize this resume. Fix any formatting issues.
 
@@ -80,4 +117,15 @@ Resume:
 {resume}
 
 Return the final version in clean Markdown format.
-"""
\ No newline at end of file
+"""
+
+FIX_JSON_PROMPT = """
+This JSON is malformed. Fix it without changing its content.
+
+Broken JSON:
+{fragment}
+
+It must be an object with these keys: {required_keys}
+
+Return ONLY the corrected JSON object.
+"""
@@ -0,0 +1,193 @@
+"""Process-wide rate limiting, error classification and backoff for LLM calls."""
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+# Rate limit configuration (0 disables a limit)
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+
+# Seconds of traffic a full bucket may release at once, so parallel
+# drafts, section rewrites and hedges aren't serialized
+BURST_SECONDS = float(os.getenv("LLM_BURST_SECONDS", "10"))
+
+# Backoff configuration (seconds)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRY_AFTER_JITTER = 1.0
+
+# HTTP statuses worth retrying: timeout, conflict, rate limit, server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate * BURST_SECONDS)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take tokens now, going into debt if needed.
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Requests larger than the bucket would otherwise wait forever
+            self.tokens -= min(amount, self.capacity)
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def adjust(self, amount: float):
+        """Return (positive) or charge (negative) tokens after the fact."""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """Shared requests-per-minute and tokens-per-minute limiter."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """
+        Block until a request of the estimated size may be sent.
+
+        Args:
+            estimated_tokens: Expected prompt tokens for the request
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+
+        # Honor a provider-wide pause first, desynchronizing waiting callers
+        with self.lock:
+            pause = self.paused_until - start
+        if pause > 0:
+            time.sleep(pause + random.uniform(0, RETRY_AFTER_JITTER))
+
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.reserve(1))
+        if self.tokens:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+        return time.monotonic() - start
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Correct the token bucket with the usage the provider reported."""
+        if self.tokens and actual_tokens is not None:
+            self.tokens.adjust(estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float):
+        """Stop all callers from sending for the given number of seconds."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+RATE_LIMITER = RateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
+
+
+def configure_rate_limiter(requests_per_minute: float, tokens_per_minute: float) -> RateLimiter:
+    """Replace the process-wide limiter (0 disables a limit)."""
+    global RATE_LIMITER
+    RATE_LIMITER = RateLimiter(requests_per_minute, tokens_per_minute)
+    return RATE_LIMITER
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the current process-wide limiter."""
+    return RATE_LIMITER
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def parse_retry_after(exc: Exception) -> Optional[float]:
+    """
+    Read the server's requested delay from an API error.
+
+    Args:
+        exc: Exception raised by the OpenAI client
+
+    Returns:
+        Delay in seconds, or None if the response did not specify one
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(exc: Exception) -> Tuple[bool, Optional[float]]:
+    """
+    Decide whether an API error is transient.
+
+    Args:
+        exc: Exception raised by the OpenAI client
+
+    Returns:
+        (retryable, retry-after seconds or None)
+    """
+    import openai
+
+    if isinstance(exc, (openai.APITimeoutError, openai.APIConnectionError)):
+        return True, None
+
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in RETRYABLE_STATUS_CODES, parse_retry_after(exc)
+
+    # Bad requests, auth failures and local bugs won't fix themselves
+    return False, None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given zero-based attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
@@ -0,0 +1,179 @@
+"""Request hedging and circuit breaking for tail-latency control."""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextvars import copy_context
+from typing import Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Hedging configuration
+LLM_HEDGING = os.getenv("LLM_HEDGING", "false").lower() in ("1", "true", "yes")
+HEDGE_WORKERS = int(os.getenv("HEDGE_WORKERS", "8"))
+LATENCY_WINDOW = 200
+LATENCY_MIN_SAMPLES = 20
+
+# Circuit breaker configuration
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "30"))
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+
+class LatencyTracker:
+    """Rolling window of call latencies used to pick hedge delays."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self.lock:
+            self.samples.append(seconds)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Latency at the given percentile.
+
+        Returns:
+            Seconds, or None until enough samples have been collected
+        """
+        with self.lock:
+            if len(self.samples) < LATENCY_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100.0))
+        return ordered[index]
+
+
+class CircuitBreaker:
+    """
+    Closed → open after consecutive failures; half-open after a cool-down.
+
+    While open, calls fail immediately with CircuitOpenError. After the
+    reset timeout a single trial call is let through; success closes the
+    circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self.lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if now - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call should not be attempted."""
+        with self.lock:
+            state = self._state(time.monotonic())
+            if state == "closed":
+                return
+            if state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return
+        raise CircuitOpenError("Circuit open: LLM endpoint is unhealthy, failing fast")
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+    def release_trial(self):
+        """End a half-open trial that neither succeeded nor failed transiently."""
+        with self.lock:
+            self.trial_in_flight = False
+
+
+_latency: Dict[str, LatencyTracker] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_latency_tracker(node: str) -> LatencyTracker:
+    """Per-node latency tracker."""
+    with _registry_lock:
+        return _latency.setdefault(node, LatencyTracker())
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """Per-endpoint circuit breaker shared by every node calling it."""
+    with _registry_lock:
+        return _breakers.setdefault(endpoint, CircuitBreaker())
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _registry_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS,
+                thread_name_prefix="llm-hedge"
+            )
+        return _hedge_executor
+
+
+def hedged_call(fn: Callable[[], T], delay: float) -> T:
+    """
+    Run fn, firing a duplicate if it hasn't finished after delay seconds.
+
+    The first successful result wins; the loser is left to finish in the
+    background. If both attempts fail, the primary's error is raised. Both
+    run in a copy of the caller's context (its traced node and event
+    listeners).
+
+    Args:
+        fn: Zero-argument callable performing the request
+        delay: Seconds to wait before sending the hedge
+
+    Returns:
+        Result of whichever attempt succeeded first
+    """
+    executor = _get_hedge_executor()
+    primary = executor.submit(copy_context().run, fn)
+
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    hedge = executor.submit(copy_context().run, fn)
+    pending = {primary, hedge}
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+
+    # Both failed
+    return primary.result()
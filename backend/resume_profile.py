@@ -0,0 +1,183 @@
+"""
+Structured resume profile, parsed once at ingestion and kept in ResumeState.
+
+The profile holds the name, contact details and sections (with their
+bullets) of the original resume as plain JSON-safe dicts, so it survives
+the job queue and the session store. Nodes build their prompts from a
+compacted view of it instead of re-inserting the raw upload, and the ATS
+linter reads contact details and bullets from it.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from backend.document import BULLET, HEADING, TITLE, parse_resume_markdown
+from backend.sections import HEADER, section_key, split_sections
+
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+PHONE_PATTERN = re.compile(r'\+?\d[\d\s().-]{7,}\d')
+LINK_PATTERN = re.compile(r'(?:https?://|www\.)[^\s)\]|,]+|(?:linkedin|github)\.com/[^\s)\]|,]+', re.IGNORECASE)
+
+HORIZONTAL_RULE = re.compile(r'^\s*(?:-{3,}|\*{3,}|_{3,})\s*$')
+HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Per-node view settings (see render_view); nodes not listed get the full
+# resume. Critique and drafting need every section, contact details
+# included; suggestions only need the name.
+NODE_VIEWS: Dict[str, Dict[str, Any]] = {
+    "suggest": {"contact": False},
+}
+
+
+def compact_markdown(markdown: str) -> str:
+    """
+    Markdown without comments, rules, trailing spaces or repeated blank lines.
+
+    Args:
+        markdown: Resume Markdown
+
+    Returns:
+        Equivalent, shorter Markdown
+    """
+    lines: List[str] = []
+    for line in HTML_COMMENT.sub("", markdown).split('\n'):
+        line = line.rstrip()
+        if HORIZONTAL_RULE.match(line):
+            continue
+        if not line and (not lines or not lines[-1]):
+            continue
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def _unique(items: Iterable[str]) -> List[str]:
+    seen = set()
+    unique = []
+    for item in items:
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            unique.append(item)
+    return unique
+
+
+def parse_resume_profile(markdown: str) -> Dict[str, Any]:
+    """
+    Parse a resume into its structured profile.
+
+    Block parsing is shared with the exporters (parse_resume_markdown is
+    cached by content) and section boundaries with section rewriting.
+
+    Args:
+        markdown: Resume Markdown or extracted text
+
+    Returns:
+        Dict with 'name', 'contact' and 'sections'
+    """
+    document = parse_resume_markdown(markdown)
+
+    # Plain-text lines of each section, in the same keys split_sections uses
+    lines_by_key: Dict[str, List[str]] = {HEADER: []}
+    bullets_by_key: Dict[str, List[str]] = {HEADER: []}
+    seen: Dict[str, int] = {}
+    key = HEADER
+    for block in document.blocks:
+        if block.kind == HEADING:
+            key = section_key(block.text)
+            seen[key] = seen.get(key, 0) + 1
+            if seen[key] > 1:
+                key = f"{key}_{seen[key]}"
+            lines_by_key[key], bullets_by_key[key] = [], []
+        elif block.kind != TITLE and block.text:
+            lines_by_key.setdefault(key, []).append(block.text)
+            if block.kind == BULLET:
+                bullets_by_key.setdefault(key, []).append(block.text)
+
+    sections = [
+        {
+            "key": section.key,
+            "base_key": section.base_key,
+            "title": section.heading.lstrip('#').strip(),
+            "markdown": compact_markdown(section.text),
+            "bullets": bullets_by_key.get(section.key, []),
+        }
+        for section in split_sections(markdown)
+    ]
+
+    header_text = "\n".join(lines_by_key[HEADER])
+    contact = {
+        "email": _unique(EMAIL_PATTERN.findall(header_text)),
+        # Ten digits at least, so year ranges aren't taken for phone numbers
+        "phone": _unique(
+            match.strip() for match in PHONE_PATTERN.findall(header_text)
+            if sum(char.isdigit() for char in match) >= 10
+        ),
+        "links": _unique(LINK_PATTERN.findall(header_text)),
+    }
+
+    return {
+        "name": document.title,
+        "contact": contact,
+        "sections": sections,
+    }
+
+
+def get_profile(state: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Profile of the state's original resume.
+
+    States built by build_initial_state carry it already; older ones
+    (e.g. posted to the service) are parsed here. Nodes put the result in
+    the state they return so later nodes don't parse it again.
+
+    Args:
+        state: Pipeline state
+
+    Returns:
+        The resume profile
+    """
+    profile: Optional[Dict[str, Any]] = state.get("resume_profile")
+    if not profile:
+        profile = parse_resume_profile(state.get("original_resume", ""))
+    return profile
+
+
+def render_view(profile: Dict[str, Any], sections: Optional[Sequence[str]] = None,
+                contact: bool = True) -> str:
+    """
+    Compact Markdown of selected parts of a profile.
+
+    Args:
+        profile: Resume profile
+        sections: Section keys to include (None = all)
+        contact: Keep the header with contact details; otherwise only the name
+
+    Returns:
+        Markdown for a prompt
+    """
+    parts = []
+    body_sections = [section for section in profile.get("sections", []) if section["key"] != HEADER]
+    for section in profile.get("sections", []):
+        if section["key"] == HEADER:
+            # Without headings (e.g. text from a PDF) the header is the whole resume
+            if contact or not body_sections:
+                parts.append(section["markdown"])
+            elif profile.get("name"):
+                parts.append(f"# {profile['name']}")
+        elif sections is None or section["key"] in sections:
+            parts.append(section["markdown"])
+    return "\n\n".join(part for part in parts if part)
+
+
+def resume_view(profile: Dict[str, Any], node: str) -> str:
+    """
+    The original resume as the given node's prompt should carry it.
+
+    Args:
+        profile: Resume profile (see get_profile)
+        node: Node name (a NODE_VIEWS key; others get the full view)
+
+    Returns:
+        Compact resume Markdown
+    """
+    view = NODE_VIEWS.get(node, {})
+    return render_view(profile, view.get("sections"), view.get("contact", True))
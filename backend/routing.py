@@ -0,0 +1,171 @@
+"""
+Per-node model routing: the model, endpoint, temperature and token budget
+each node's LLM calls use, with a fallback chain.
+
+Routes start from DEFAULT_ROUTES, then LLM_ROUTING_FILE (JSON, same shape)
+is merged over them, then per-node environment variables:
+
+    LLM_MODEL_<NODE>        Comma-separated model chain, first tried first
+    LLM_BASE_URL_<NODE>     Endpoint for the node's models
+    LLM_TEMPERATURE_<NODE>  Overrides the node's own sampling temperature
+    LLM_MAX_TOKENS_<NODE>   Completion token budget
+
+<NODE> is the node name upper-cased (ANALYZE_JD, CRITIQUE, SUGGEST, DRAFT,
+FINALIZE) or DEFAULT. A chain entry is a model name, or an object with
+"model" and optionally "base_url" and "api_key_env" to fall back to a
+different endpoint, e.g.:
+
+    {"critique": {"models": ["small-fast-model",
+                             {"model": "mistralai/Mistral-7B-Instruct-v0.3"}],
+                  "max_tokens": 2048}}
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Model and token budget of every node unless routed elsewhere (overridden
+# by MODEL_NAME / MAX_TOKENS, read when routes are first loaded)
+DEFAULT_MODEL = "mistralai/Mistral-7B-Instruct-v0.3"
+DEFAULT_MAX_TOKENS = 8192
+
+# Nodes that call the LLM (and so accept LLM_*_<NODE> overrides)
+ROUTED_NODES = ("analyze_jd", "critique", "suggest", "draft", "finalize")
+
+# Node -> route settings; nodes inherit anything they don't set from "default".
+# JSON replies (analysis, critique, suggestions) are short, so their budgets
+# are smaller than drafting's.
+DEFAULT_ROUTES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "analyze_jd": {"max_tokens": 2048},
+    "critique": {"max_tokens": 2048},
+    "suggest": {"max_tokens": 3072},
+}
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """One model to try for a node."""
+
+    model: str
+    base_url: str
+    api_key_env: str = "QUBRID_API_KEY"
+    # None keeps the temperature the node asked for
+    temperature: Optional[float] = None
+    max_tokens: int = DEFAULT_MAX_TOKENS
+
+    @property
+    def api_key(self) -> str:
+        return os.getenv(self.api_key_env, "")
+
+
+_routes: Optional[Dict[str, Dict[str, Any]]] = None
+_routes_lock = threading.Lock()
+
+
+def _env_overrides(node: str) -> Dict[str, Any]:
+    suffix = node.upper()
+    overrides: Dict[str, Any] = {}
+
+    models = os.getenv(f"LLM_MODEL_{suffix}")
+    if models:
+        overrides["models"] = [model.strip() for model in models.split(",") if model.strip()]
+    base_url = os.getenv(f"LLM_BASE_URL_{suffix}")
+    if base_url:
+        overrides["base_url"] = base_url
+    temperature = os.getenv(f"LLM_TEMPERATURE_{suffix}")
+    if temperature:
+        overrides["temperature"] = float(temperature)
+    max_tokens = os.getenv(f"LLM_MAX_TOKENS_{suffix}")
+    if max_tokens:
+        overrides["max_tokens"] = int(max_tokens)
+
+    return overrides
+
+
+def load_routes(config: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge the routing layers into one node -> settings dict.
+
+    Args:
+        config: Used instead of LLM_ROUTING_FILE if given
+
+    Returns:
+        Dict of node -> settings ("default" fully populated)
+    """
+    routes = {node: dict(settings) for node, settings in DEFAULT_ROUTES.items()}
+    routes["default"] = {
+        "models": [os.getenv("MODEL_NAME", DEFAULT_MODEL)],
+        "base_url": os.getenv("QUBRID_BASE_URL", "https://platform.qubrid.com/v1"),
+        "api_key_env": "QUBRID_API_KEY",
+        "max_tokens": int(os.getenv("MAX_TOKENS", str(DEFAULT_MAX_TOKENS))),
+        **routes["default"],
+    }
+
+    routing_file = os.getenv("LLM_ROUTING_FILE", "")
+    if config is None and routing_file:
+        try:
+            config = json.loads(Path(routing_file).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Ignoring routing file {routing_file}: {str(e)}")
+
+    for node, settings in (config or {}).items():
+        routes.setdefault(node, {}).update(settings)
+
+    for node in set(routes) | set(ROUTED_NODES):
+        overrides = _env_overrides(node)
+        if overrides:
+            routes.setdefault(node, {}).update(overrides)
+
+    return routes
+
+
+def configure_routes(config: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Replace the process-wide routes (e.g. from benchmarks); None reloads the defaults."""
+    global _routes
+    with _routes_lock:
+        _routes = load_routes(config)
+
+
+def get_routes(node: str) -> List[ModelRoute]:
+    """
+    Fallback chain for a node, first choice first.
+
+    Args:
+        node: Node name passed to call_llm_with_retry
+
+    Returns:
+        One ModelRoute per model in the chain
+    """
+    global _routes
+    with _routes_lock:
+        if _routes is None:
+            # Loaded on first use so .env has been read by then
+            _routes = load_routes()
+        settings = {**_routes["default"], **_routes.get(node, {})}
+
+    chain = []
+    for entry in settings["models"]:
+        if isinstance(entry, str):
+            entry = {"model": entry}
+        chain.append(ModelRoute(
+            model=entry["model"],
+            base_url=entry.get("base_url", settings["base_url"]),
+            api_key_env=entry.get("api_key_env", settings["api_key_env"]),
+            temperature=entry.get("temperature", settings.get("temperature")),
+            max_tokens=int(entry.get("max_tokens", settings["max_tokens"])),
+        ))
+    return chain
+
+
+def get_all_routes() -> List[ModelRoute]:
+    """Every distinct route any node may use (e.g. to warm up endpoints)."""
+    routes: List[ModelRoute] = []
+    for node in ("default",) + ROUTED_NODES:
+        for route in get_routes(node):
+            if route not in routes:
+                routes.append(route)
+    return routes
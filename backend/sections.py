@@ -0,0 +1,155 @@
+"""Split resume Markdown into sections and map critique feedback onto them."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+# Key of the text before the first section heading (name, contact line)
+HEADER = "header"
+
+# Canonical section key -> words that identify it in headings and feedback
+SECTION_KEYWORDS = {
+    "summary": ("summary", "profile", "objective", "about"),
+    "experience": (
+        "experience", "employment", "work history", "role", "achievement",
+        "accomplishment", "impact", "quantif", "metric", "responsibilit", "bullet",
+    ),
+    "skills": ("skill", "keyword", "technolog", "tool", "stack"),
+    "education": ("education", "degree", "university", "college", "gpa", "coursework"),
+    "projects": ("project", "portfolio"),
+    "certifications": ("certif", "license"),
+}
+
+SECTION_HEADING = re.compile(r'^##\s+(.+?)\s*$')
+
+# Prefix of feedback about the whole document (ATS lint issues), which is
+# never routed to a section however many section names it mentions
+GENERAL_FEEDBACK_PREFIX = "Formatting"
+
+
+@dataclass(frozen=True)
+class Section:
+    """One top-level (##) section of a resume."""
+
+    key: str
+    heading: str
+    body: str
+    # SECTION_KEYWORDS key; differs from key when a heading repeats ("skills_2")
+    base_key: str = ""
+
+    @property
+    def text(self) -> str:
+        """Section Markdown including its heading line."""
+        if not self.heading:
+            return self.body
+        return f"{self.heading}\n{self.body}" if self.body else self.heading
+
+
+def section_key(title: str) -> str:
+    """
+    Canonical key for a section title.
+
+    Args:
+        title: Heading text without the leading '##'
+
+    Returns:
+        'summary', 'experience', ... or a slug of the title
+    """
+    lowered = title.lower()
+    for key, words in SECTION_KEYWORDS.items():
+        if any(lowered.startswith(word) or f" {word}" in lowered for word in words[:3]):
+            return key
+    return re.sub(r'[^a-z0-9]+', '_', lowered).strip('_') or "section"
+
+
+def split_sections(markdown: str) -> List[Section]:
+    """
+    Split resume Markdown at its '## ' headings.
+
+    Joining the sections' text with newlines gives back the original.
+
+    Args:
+        markdown: Resume Markdown
+
+    Returns:
+        Sections in document order, starting with the HEADER preamble
+    """
+    sections: List[Section] = []
+    key, base_key, heading = HEADER, HEADER, ""
+    lines: List[str] = []
+    seen: Dict[str, int] = {}
+
+    def close():
+        sections.append(Section(key, heading, "\n".join(lines), base_key))
+
+    for line in markdown.split('\n'):
+        match = SECTION_HEADING.match(line)
+        if not match:
+            lines.append(line)
+            continue
+
+        close()
+        key = base_key = section_key(match.group(1))
+        # Keep keys unique when a heading repeats
+        seen[base_key] = seen.get(base_key, 0) + 1
+        if seen[base_key] > 1:
+            key = f"{base_key}_{seen[base_key]}"
+        heading, lines = line, []
+
+    close()
+    return sections
+
+
+def join_sections(sections: Sequence[Section]) -> str:
+    """Reassemble sections into one Markdown document."""
+    return "\n".join(section.text for section in sections)
+
+
+def assign_feedback(sections: Sequence[Section], feedback: Sequence[str]) -> Dict[str, List[str]]:
+    """
+    Map critique improvement items to the sections they concern.
+
+    An item prefixed with a section title ("Skills: ...", as produced by
+    per-section critique) goes to that section only; one prefixed with
+    GENERAL_FEEDBACK_PREFIX goes to ''. Otherwise it matches every section
+    whose heading or SECTION_KEYWORDS it mentions. Items matching nothing
+    are returned under ''.
+
+    Args:
+        sections: Resume sections from split_sections
+        feedback: Items from critique['improvements_needed']
+
+    Returns:
+        Dict of section key -> feedback items, plus '' -> unmatched items
+    """
+    assigned: Dict[str, List[str]] = {}
+    titles = {
+        section.heading.lstrip('#').strip().lower(): section.key
+        for section in sections if section.heading
+    }
+
+    for item in feedback:
+        lowered = str(item).lower()
+        prefix = lowered.split(':', 1)[0].strip()
+        if ':' in lowered and prefix in titles:
+            assigned.setdefault(titles[prefix], []).append(str(item))
+            continue
+        if ':' in lowered and prefix == GENERAL_FEEDBACK_PREFIX.lower():
+            assigned.setdefault("", []).append(str(item))
+            continue
+
+        matched = False
+
+        for section in sections:
+            if section.key == HEADER:
+                continue
+            words = SECTION_KEYWORDS.get(section.base_key, ())
+            title = section.heading.lstrip('#').strip().lower()
+            if (title and title in lowered) or any(word in lowered for word in words):
+                assigned.setdefault(section.key, []).append(str(item))
+                matched = True
+
+        if not matched:
+            assigned.setdefault("", []).append(str(item))
+
+    return assigned
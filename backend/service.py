@@ -0,0 +1,404 @@
+"""
+HTTP service exposing the optimizer to other applications.
+
+Endpoints (JSON in, JSON out):
+    POST /evaluate          {"resume", "job_description", ["resume_filename", "jd_source", "async", "stream"]}
+    POST /generate          {"state" | "job_id", ["mode", "async", "stream"]}
+    GET  /jobs/<id>         Job status, progress and result
+    GET  /history           Saved generations (?limit=&offset=)
+    GET  /history/<id>      One generation with its node runs
+    POST /match             {"resume", ["k"]} -> best-matching stored postings
+    GET  /health            Liveness and load
+    GET  /metrics           Prometheus metrics
+
+Synchronous requests run on the request thread, at most
+SERVICE_MAX_IN_FLIGHT at a time. Async requests ("async": true) go
+through the job queue, capped at SERVICE_MAX_QUEUED waiting jobs. When
+either limit is reached the service answers 429 with Retry-After instead
+of queueing unboundedly.
+
+Streaming requests ("stream": true) run like synchronous ones but answer
+with Server-Sent Events as the pipeline runs (see backend.events for the
+event types): "event: <type>" lines followed by "data: <json>". The last
+event is "result", holding the same fields as the synchronous response,
+or "error".
+"""
+
+import hmac
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Generator, Mapping, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+from backend.database import (
+    init_database,
+    get_all_generations,
+    get_generation_by_id,
+    get_node_runs,
+)
+from backend.events import stream_pipeline
+from backend.jobs import submit_job, get_job_status, get_queue_depth
+from backend.metrics import render_metrics
+from backend.pipeline import build_initial_state, run_evaluation, run_generation
+
+# Service configuration
+SERVICE_HOST = os.getenv("SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.getenv("SERVICE_PORT", "8080"))
+SERVICE_MAX_IN_FLIGHT = int(os.getenv("SERVICE_MAX_IN_FLIGHT", "8"))
+SERVICE_MAX_QUEUED = int(os.getenv("SERVICE_MAX_QUEUED", "32"))
+SERVICE_MAX_BODY_BYTES = int(os.getenv("SERVICE_MAX_BODY_BYTES", str(5 * 1024 * 1024)))
+# Optional shared secret, sent as "Authorization: Bearer <key>"
+SERVICE_API_KEY = os.getenv("SERVICE_API_KEY", "")
+# Retry-After sent with 429 responses
+SERVICE_RETRY_AFTER = int(os.getenv("SERVICE_RETRY_AFTER", "5"))
+
+# Fields of the pipeline state returned to clients
+EVALUATION_FIELDS = ("jd_analysis", "critique", "suggestions", "error")
+GENERATION_FIELDS = (
+    "generation_id", "final_resume", "critique", "initial_critique",
+    "output_markdown_path", "output_pdf_path", "error",
+)
+
+
+class ServiceError(Exception):
+    """Request failure carrying the HTTP status to answer with."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+_in_flight = threading.BoundedSemaphore(SERVICE_MAX_IN_FLIGHT)
+
+
+def _pick(state: Mapping[str, Any], fields) -> Dict[str, Any]:
+    return {field: state.get(field) for field in fields}
+
+
+def _require_capacity(is_async: bool) -> bool:
+    """
+    Reserve capacity for a request or raise 429.
+
+    Returns:
+        True if an in-flight slot was taken (release it when done)
+    """
+    if is_async:
+        if get_queue_depth() >= SERVICE_MAX_QUEUED:
+            raise ServiceError(429, "Job queue is full, retry later")
+        return False
+
+    if not _in_flight.acquire(blocking=False):
+        raise ServiceError(429, "Too many requests in flight, retry later")
+    return True
+
+
+def _request_mode(body: Dict[str, Any]) -> Tuple[bool, bool]:
+    """Read the "async" and "stream" flags of a pipeline request."""
+    is_async, is_stream = bool(body.get("async")), bool(body.get("stream"))
+    if is_async and is_stream:
+        raise ServiceError(400, "'async' and 'stream' can't be combined")
+    return is_async, is_stream
+
+
+def _stream_events(pipeline: Callable[..., Mapping[str, Any]], state: Mapping[str, Any],
+                   respond: Callable[[Mapping[str, Any]], Dict[str, Any]],
+                   holding_slot: bool) -> Generator[Dict[str, Any], None, None]:
+    """
+    Start a pipeline and return its events for an SSE response.
+
+    The in-flight slot is released when the pipeline finishes, which may be
+    after the client has gone away, not when the response ends.
+
+    Args:
+        pipeline: run_evaluation or run_generation
+        state: State to run it on
+        respond: Builds the 'result' event's fields from the final state
+        holding_slot: Whether an in-flight slot was taken for the request
+    """
+    events = stream_pipeline(pipeline, state, on_done=_in_flight.release if holding_slot else None)
+
+    def respond_events() -> Generator[Dict[str, Any], None, None]:
+        for event in events:
+            if event["type"] == "result":
+                event = {"type": "result", "time": event["time"], **respond(event["state"])}
+            yield event
+
+    return respond_events()
+
+
+def handle_evaluate(body: Dict[str, Any]) -> Tuple[int, Any]:
+    """Score a resume (synchronously, as a job with "async": true, or streamed with "stream": true)."""
+    resume = body.get("resume")
+    job_description = body.get("job_description")
+    if not resume or not job_description:
+        raise ServiceError(400, "'resume' and 'job_description' are required")
+
+    state = build_initial_state(
+        resume,
+        body.get("resume_filename", "resume.md"),
+        job_description,
+        body.get("jd_source", "api")
+    )
+
+    is_async, is_stream = _request_mode(body)
+    holding_slot = _require_capacity(is_async)
+
+    if is_async:
+        return 202, {"job_id": submit_job("evaluate", state)}
+    if is_stream:
+        return 200, _stream_events(
+            run_evaluation, state,
+            lambda result: {"state": result, **_pick(result, EVALUATION_FIELDS)},
+            holding_slot
+        )
+
+    try:
+        state = run_evaluation(state)
+    finally:
+        if holding_slot:
+            _in_flight.release()
+
+    return 200, {"state": state, **_pick(state, EVALUATION_FIELDS)}
+
+
+def handle_generate(body: Dict[str, Any]) -> Tuple[int, Any]:
+    """Create the tailored resume from an evaluation state or finished evaluate job."""
+    # Client-supplied JSON, checked below before it is used as a ResumeState
+    state: Any = body.get("state")
+    if state is None and body.get("job_id"):
+        job = get_job_status(body["job_id"])
+        if not job or job["kind"] != "evaluate":
+            raise ServiceError(404, "Evaluation job not found")
+        if job["status"] != "done":
+            raise ServiceError(409, f"Evaluation job is {job['status']}")
+        state = job["result"]
+
+    if not isinstance(state, dict) or "original_resume" not in state:
+        raise ServiceError(400, "Provide an evaluation 'state' or an evaluate 'job_id'")
+
+    mode = body.get("mode")
+    if mode not in (None, "single", "iterative", "best_of_n"):
+        raise ServiceError(400, f"Unknown mode: {mode}")
+    if mode:
+        # Carried in the state so queued jobs draft the same way
+        state = {**state, "draft_mode": mode}
+
+    is_async, is_stream = _request_mode(body)
+    holding_slot = _require_capacity(is_async)
+
+    if is_async:
+        return 202, {"job_id": submit_job("generate", state)}
+    if is_stream:
+        return 200, _stream_events(
+            run_generation, state,
+            lambda result: _pick(result, GENERATION_FIELDS),
+            holding_slot
+        )
+
+    try:
+        state = run_generation(state)
+    finally:
+        if holding_slot:
+            _in_flight.release()
+
+    return 200, _pick(state, GENERATION_FIELDS)
+
+
+def handle_job(job_id: str) -> Tuple[int, Dict[str, Any]]:
+    job = get_job_status(job_id)
+    if not job:
+        raise ServiceError(404, "Job not found")
+    return 200, job
+
+
+def handle_history(query: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+    try:
+        limit = max(1, min(int(query.get("limit", "50")), 500))
+        offset = int(query.get("offset", "0"))
+    except ValueError:
+        raise ServiceError(400, "'limit' and 'offset' must be integers")
+    if offset < 0:
+        raise ServiceError(400, "'offset' must not be negative")
+
+    return 200, {"generations": get_all_generations(limit=limit, offset=offset)}
+
+
+def handle_generation(generation_id: str) -> Tuple[int, Dict[str, Any]]:
+    if not generation_id.isdigit():
+        raise ServiceError(404, "Generation not found")
+
+    generation = get_generation_by_id(int(generation_id))
+    if not generation:
+        raise ServiceError(404, "Generation not found")
+    return 200, {**generation, "node_runs": get_node_runs(int(generation_id))}
+
+
+def handle_match(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Rank stored job postings against a resume (no LLM call)."""
+    from backend.jd_index import find_matching_postings
+    
+    resume = body.get("resume")
+    if not resume:
+        raise ServiceError(400, "'resume' is required")
+    try:
+        k = min(int(body.get("k", 5)), 100)
+    except (TypeError, ValueError):
+        raise ServiceError(400, "'k' must be an integer")
+    if k < 1:
+        raise ServiceError(400, "'k' must be at least 1")
+
+    return 200, {"matches": find_matching_postings(resume, k)}
+
+
+def handle_health() -> Tuple[int, Dict[str, Any]]:
+    return 200, {
+        "status": "ok",
+        "queued_jobs": get_queue_depth(),
+        "max_queued": SERVICE_MAX_QUEUED,
+        "max_in_flight": SERVICE_MAX_IN_FLIGHT,
+    }
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """Routes requests to the handle_* functions."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload: Any, content_type: str = "application/json"):
+        if content_type == "application/json":
+            data = json.dumps(payload, default=str).encode("utf-8")
+        else:
+            data = payload.encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", str(SERVICE_RETRY_AFTER))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_events(self, events: Generator[Dict[str, Any], None, None]):
+        """Write events as a Server-Sent Events stream until they run out."""
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            for event in events:
+                data = json.dumps(event, default=str)
+                self.wfile.write(f"event: {event['type']}\ndata: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; the pipeline finishes on its own thread
+            pass
+        finally:
+            events.close()
+
+    def _authorized(self) -> bool:
+        if not SERVICE_API_KEY:
+            return True
+        return hmac.compare_digest(
+            self.headers.get("Authorization", ""), f"Bearer {SERVICE_API_KEY}"
+        )
+
+    def _read_body(self) -> Dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            raise ServiceError(400, "Content-Length must be an integer")
+        if length < 0:
+            raise ServiceError(400, "Content-Length must not be negative")
+        if length > SERVICE_MAX_BODY_BYTES:
+            raise ServiceError(413, "Request body too large")
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            raise ServiceError(400, "Request body must be JSON")
+        if not isinstance(body, dict):
+            raise ServiceError(400, "Request body must be a JSON object")
+        return body
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        query = dict(parse_qsl(url.query))
+
+        try:
+            if parts == ["health"] and method == "GET":
+                status, payload = handle_health()
+            elif parts == ["metrics"] and method == "GET":
+                self._send(200, render_metrics(), "text/plain; version=0.0.4; charset=utf-8")
+                return
+            elif not self._authorized():
+                raise ServiceError(401, "Missing or invalid API key")
+            elif parts == ["evaluate"] and method == "POST":
+                status, payload = handle_evaluate(self._read_body())
+            elif parts == ["generate"] and method == "POST":
+                status, payload = handle_generate(self._read_body())
+            elif parts == ["match"] and method == "POST":
+                status, payload = handle_match(self._read_body())
+            elif len(parts) == 2 and parts[0] == "jobs" and method == "GET":
+                status, payload = handle_job(parts[1])
+            elif parts == ["history"] and method == "GET":
+                status, payload = handle_history(query)
+            elif len(parts) == 2 and parts[0] == "history" and method == "GET":
+                status, payload = handle_generation(parts[1])
+            else:
+                raise ServiceError(404, "Not found")
+        except ServiceError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            print(f"Service request failed: {str(e)}")
+            status, payload = 500, {"error": "Internal server error"}
+
+        if not isinstance(payload, dict):
+            self._send_events(payload)
+            return
+        self._send(status, payload)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+def create_server(host: Optional[str] = None, port: Optional[int] = None) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server (call serve_forever() to run it).
+
+    Args:
+        host: Interface to bind (defaults to SERVICE_HOST)
+        port: Port to bind (defaults to SERVICE_PORT, 0 picks a free one)
+
+    Returns:
+        Configured server
+    """
+    init_database()
+    server = ThreadingHTTPServer(
+        (host or SERVICE_HOST, SERVICE_PORT if port is None else port),
+        ServiceHandler
+    )
+    server.daemon_threads = True
+    return server
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None):
+    """Run the service until interrupted."""
+    from backend.warmup import warm_up_on_start
+    
+    server = create_server(host, port)
+    # Before accepting traffic, so the first requests aren't cold
+    warm_up_on_start(background=False)
+    bound_host, bound_port = server.socket.getsockname()[:2]
+    print(f"Resume optimizer service listening on http://{bound_host}:{bound_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
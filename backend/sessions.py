@@ -0,0 +1,189 @@
+"""
+Shared UI session state, so any replica can continue a user's flow.
+
+The Streamlit app keeps the in-progress ResumeState, critique and
+suggestions between steps. Saving them here under a session token (kept in
+the page URL) lets a reload land on any replica, and lets a draining
+replica go away without losing the LLM work already done.
+
+SESSION_STORE picks the backend: "sqlite" (the app database, default) or
+"file" (one JSON file per session under SESSION_DIR, e.g. a shared volume).
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Type
+
+SESSION_STORE = os.getenv("SESSION_STORE", "sqlite").lower()
+SESSION_DIR = os.getenv("SESSION_DIR", str(Path(__file__).parent.parent / "data" / "sessions"))
+# Sessions untouched for this long are purged
+SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "72"))
+
+# Tokens are generated hex ids; anything else is rejected (they name files)
+TOKEN_PATTERN = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+
+
+def valid_token(token: Optional[str]) -> bool:
+    """Whether a session token is well formed."""
+    return token is not None and bool(TOKEN_PATTERN.match(token))
+
+
+class SessionStore(ABC):
+    """Where session state is kept between requests."""
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Saved state for a session, or None."""
+
+    @abstractmethod
+    def put(self, token: str, data: Dict[str, Any]):
+        """Save (replace) a session's state."""
+
+    @abstractmethod
+    def delete(self, token: str):
+        """Forget a session."""
+
+    @abstractmethod
+    def purge_expired(self, ttl_hours: float = SESSION_TTL_HOURS) -> int:
+        """Delete sessions untouched for ttl_hours; returns how many."""
+
+
+# Registered stores: name -> class
+SESSION_STORES: Dict[str, Type[SessionStore]] = {}
+
+
+def register_session_store(name: str) -> Callable[[Type[SessionStore]], Type[SessionStore]]:
+    """
+    Register a session store backend.
+
+    Args:
+        name: Value of SESSION_STORE selecting it
+
+    Returns:
+        Decorator registering the class
+    """
+    def decorator(cls: Type[SessionStore]) -> Type[SessionStore]:
+        SESSION_STORES[name] = cls
+        return cls
+    return decorator
+
+
+@register_session_store("sqlite")
+class SQLiteSessionStore(SessionStore):
+    """Sessions in the app's SQLite database."""
+
+    def __init__(self):
+        from backend.database import init_database
+
+        init_database()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        from backend.database import get_session
+
+        return get_session(token)
+
+    def put(self, token: str, data: Dict[str, Any]):
+        from backend.database import save_session
+
+        save_session(token, data)
+
+    def delete(self, token: str):
+        from backend.database import delete_session
+
+        delete_session(token)
+
+    def purge_expired(self, ttl_hours: float = SESSION_TTL_HOURS) -> int:
+        from backend.database import delete_sessions_before
+
+        cutoff = datetime.now() - timedelta(hours=ttl_hours)
+        return delete_sessions_before(cutoff.isoformat())
+
+
+@register_session_store("file")
+class FileSessionStore(SessionStore):
+    """One JSON file per session in a (possibly shared) directory."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or SESSION_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, token: str) -> Path:
+        return self.directory / f"{token}.json"
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        try:
+            data: Dict[str, Any] = json.loads(self._path(token).read_text(encoding="utf-8"))
+            return data
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Ignoring unreadable session {token}: {str(e)}")
+            return None
+
+    def put(self, token: str, data: Dict[str, Any]):
+        path = self._path(token)
+        # Write then rename, so readers on other replicas never see half a file
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(json.dumps(data, default=str), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def delete(self, token: str):
+        self._path(token).unlink(missing_ok=True)
+
+    def purge_expired(self, ttl_hours: float = SESSION_TTL_HOURS) -> int:
+        cutoff = time.time() - ttl_hours * 3600
+        deleted = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def configure_session_store(name: str, **kwargs) -> SessionStore:
+    """
+    Replace the process-wide session store.
+
+    Args:
+        name: Registered store name ("sqlite" or "file")
+        **kwargs: Passed to the store's constructor
+
+    Returns:
+        The new store
+    """
+    global _store
+    if name not in SESSION_STORES:
+        raise ValueError(f"Unknown session store: {name}")
+    store = SESSION_STORES[name](**kwargs)
+    with _store_lock:
+        _store = store
+    return store
+
+
+def get_session_store() -> SessionStore:
+    """Active session store, created from SESSION_STORE on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if SESSION_STORE not in SESSION_STORES:
+                raise ValueError(f"Unknown session store: {SESSION_STORE}")
+            _store = SESSION_STORES[SESSION_STORE]()
+            # Expired sessions are cleared once per process
+            try:
+                _store.purge_expired()
+            except Exception as e:
+                print(f"Could not purge expired sessions: {str(e)}")
+        return _store
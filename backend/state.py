@@ -12,6 +12,11 @@ class ResumeState(TypedDict, total=False):
     resume_filename: str
     jd_source: str
 
+    # Structured original resume, parsed once (see backend.resume_profile)
+    resume_profile: Dict[str, Any]
+    # Images/tables/pages of a PDF upload, for the ATS linter
+    resume_layout: Dict[str, Any]
+
     # Analysis outputs
     jd_analysis: Dict[str, Any]
 
@@ -22,14 +27,20 @@ class ResumeState(TypedDict, total=False):
     # Generation outputs
     draft_resume: str
     critique: Dict[str, Any]
+    initial_critique: Optional[Dict[str, Any]]
+    # JD keywords found in / missing from the last scored resume
+    keyword_coverage: Dict[str, Any]
 
     # Loop control
     iteration: int
+    draft_mode: str
 
     # Final outputs
     final_resume: str
     output_markdown: str
-    output_pdf_path: str
+    output_markdown_path: str
+    output_pdf_path: Optional[str]
+    generation_id: int
 
     # Metadata
     metadata: Dict[str, Any]
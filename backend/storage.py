@@ -0,0 +1,226 @@
+"""Retention and size-capped garbage collection for generated output files."""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from backend.utils import OUTPUTS_DIR
+from backend.database import (
+    get_artifact_references,
+    get_generation_by_id,
+    update_artifact_paths,
+)
+
+# Storage configuration
+OUTPUTS_MAX_BYTES = int(os.getenv("OUTPUTS_MAX_BYTES", str(500 * 1024 * 1024)))
+OUTPUTS_RETENTION_DAYS = float(os.getenv("OUTPUTS_RETENTION_DAYS", "30"))
+
+# Files younger than this are never swept, so a generation being saved
+# (files written, DB row not yet inserted) is not mistaken for an orphan
+ORPHAN_GRACE_SECONDS = 10 * 60
+
+# Minimum seconds between automatic maintenance passes
+MAINTENANCE_INTERVAL_SECONDS = 5 * 60
+
+# Files managed by the storage manager (everything else, e.g. .gitkeep, is left alone)
+ARTIFACT_EXTENSIONS = {".md", ".pdf", ".docx", ".html"}
+
+_last_maintenance = 0.0
+
+
+def _list_artifacts(outputs_dir: Path) -> List[os.DirEntry]:
+    """List artifact files in the outputs directory with cached stat results."""
+    if not outputs_dir.exists():
+        return []
+
+    with os.scandir(outputs_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.is_file() and Path(entry.name).suffix in ARTIFACT_EXTENSIONS
+        ]
+
+
+def _last_used(entry: os.DirEntry) -> float:
+    """Most recent of access and modification time."""
+    stat = entry.stat()
+    return max(stat.st_atime, stat.st_mtime)
+
+
+def _referenced_paths() -> Set[str]:
+    """Resolved paths of all files referenced by the generations table."""
+    referenced = set()
+    for row in get_artifact_references():
+        for path in (row.get("markdown_path"), row.get("pdf_path")):
+            if path:
+                referenced.add(str(Path(path).resolve()))
+    return referenced
+
+
+def touch_artifact(path: Path):
+    """Mark an artifact as recently used for LRU eviction."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def sweep_orphans(
+    outputs_dir: Path = OUTPUTS_DIR,
+    grace_seconds: float = ORPHAN_GRACE_SECONDS
+) -> List[Path]:
+    """
+    Delete output files that no generation references.
+
+    Args:
+        outputs_dir: Directory to reconcile with the generations table
+        grace_seconds: Skip files modified more recently than this
+
+    Returns:
+        Paths of deleted files
+    """
+    referenced = _referenced_paths()
+    cutoff = time.time() - grace_seconds
+    removed = []
+
+    for entry in _list_artifacts(outputs_dir):
+        path = Path(entry.path)
+        if str(path.resolve()) in referenced:
+            continue
+        if entry.stat().st_mtime > cutoff:
+            continue
+        path.unlink(missing_ok=True)
+        removed.append(path)
+
+    return removed
+
+
+def enforce_retention(
+    outputs_dir: Path = OUTPUTS_DIR,
+    max_age_days: float = OUTPUTS_RETENTION_DAYS
+) -> List[Path]:
+    """
+    Delete artifacts not used within the retention window.
+
+    Referenced files are only removed from disk; the generation keeps its
+    final_resume, so they can be regenerated with ensure_artifact.
+
+    Args:
+        outputs_dir: Directory to prune
+        max_age_days: Retention window in days (0 or less disables)
+
+    Returns:
+        Paths of deleted files
+    """
+    if max_age_days <= 0:
+        return []
+
+    cutoff = time.time() - max_age_days * 86400
+    removed = []
+
+    for entry in _list_artifacts(outputs_dir):
+        if _last_used(entry) < cutoff:
+            path = Path(entry.path)
+            path.unlink(missing_ok=True)
+            removed.append(path)
+
+    return removed
+
+
+def evict_to_size_cap(
+    outputs_dir: Path = OUTPUTS_DIR,
+    max_bytes: int = OUTPUTS_MAX_BYTES
+) -> List[Path]:
+    """
+    Evict least recently used regenerable artifacts until under the size cap.
+
+    Args:
+        outputs_dir: Directory to shrink
+        max_bytes: Total size cap in bytes (0 or less disables)
+
+    Returns:
+        Paths of deleted files
+    """
+    if max_bytes <= 0:
+        return []
+
+    entries = _list_artifacts(outputs_dir)
+    total = sum(entry.stat().st_size for entry in entries)
+    if total <= max_bytes:
+        return []
+
+    referenced = _referenced_paths()
+    removed = []
+
+    for entry in sorted(entries, key=_last_used):
+        if total <= max_bytes:
+            break
+        path = Path(entry.path)
+        # Only evict files we can rebuild from a stored final_resume
+        if str(path.resolve()) not in referenced:
+            continue
+        total -= entry.stat().st_size
+        path.unlink(missing_ok=True)
+        removed.append(path)
+
+    return removed
+
+
+def run_maintenance(outputs_dir: Path = OUTPUTS_DIR) -> Dict[str, int]:
+    """
+    Run orphan sweep, retention and size-cap eviction in one pass.
+
+    Returns:
+        Number of files removed by each stage
+    """
+    global _last_maintenance
+    _last_maintenance = time.time()
+
+    return {
+        "orphans": len(sweep_orphans(outputs_dir)),
+        "expired": len(enforce_retention(outputs_dir)),
+        "evicted": len(evict_to_size_cap(outputs_dir)),
+    }
+
+
+def maybe_run_maintenance(outputs_dir: Path = OUTPUTS_DIR) -> Optional[Dict[str, int]]:
+    """Run maintenance if the last pass is older than the configured interval."""
+    if time.time() - _last_maintenance < MAINTENANCE_INTERVAL_SECONDS:
+        return None
+    return run_maintenance(outputs_dir)
+
+
+def ensure_artifact(generation_id: int, fmt: str) -> Optional[Path]:
+    """
+    Return a generation's rendered file, regenerating it if it was evicted.
+
+    Args:
+        generation_id: Database ID
+        fmt: 'md' or 'pdf'
+
+    Returns:
+        Path to the file, or None if the generation or render is unavailable
+    """
+    from backend.exporters import export_document
+
+    gen = get_generation_by_id(generation_id)
+    if not gen:
+        return None
+
+    column = "markdown_path" if fmt == "md" else "pdf_path"
+    stored = gen.get(column)
+
+    if stored and Path(stored).exists():
+        touch_artifact(Path(stored))
+        return Path(stored)
+
+    filename_base = Path(stored).stem if stored else f"resume_{generation_id}"
+    path = export_document(gen["final_resume"], filename_base, (fmt,))[fmt]
+    if path is None:
+        return None
+
+    paths = {"md": gen.get("markdown_path") or "", "pdf": gen.get("pdf_path") or ""}
+    paths[fmt] = str(path)
+    update_artifact_paths(generation_id, paths["md"], paths["pdf"])
+
+    return path
@@ -0,0 +1,112 @@
+"""Incremental JSON parsing for structured (JSON) model replies."""
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+# Node schemas: keys a reply must contain before generation can stop early
+JD_ANALYSIS_KEYS = ("job_title", "required_skills", "ats_keywords")
+CRITIQUE_KEYS = ("overall_score", "improvements_needed")
+SUGGESTIONS_KEYS = ("suggestions",)
+
+
+class JSONObjectScanner:
+    """
+    Find the first complete, schema-valid JSON object in streamed text.
+
+    Text is fed in chunks; each character is examined once, tracking string
+    and nesting state, so a reply can be accepted the moment its closing
+    brace arrives rather than after the model stops generating.
+
+    Args:
+        required_keys: Keys the object must contain to be accepted
+    """
+
+    def __init__(self, required_keys: Iterable[str] = ()):
+        self.required_keys = tuple(required_keys)
+        self.text = ""
+        self.position = 0
+        self.start: Optional[int] = None
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.result: Optional[Dict[str, Any]] = None
+        self.result_text: Optional[str] = None
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """
+        Consume more text.
+
+        Args:
+            chunk: Next piece of the reply
+
+        Returns:
+            The parsed object once one is complete and valid, else None
+        """
+        if self.result is not None:
+            return self.result
+
+        self.text += chunk
+
+        for i in range(self.position, len(self.text)):
+            char = self.text[i]
+
+            if self.start is None:
+                if char == '{':
+                    self.start = i
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                continue
+
+            if char == '"':
+                self.in_string = True
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    if self._accept(self.text[self.start:i + 1]):
+                        self.position = i + 1
+                        return self.result
+                    # Not valid or not the expected object; keep looking
+                    self.start = None
+
+        self.position = len(self.text)
+        return None
+
+    def _accept(self, candidate: str) -> bool:
+        try:
+            obj = json.loads(candidate)
+        except json.JSONDecodeError:
+            return False
+        if not is_valid_object(obj, self.required_keys):
+            return False
+        self.result = obj
+        self.result_text = candidate
+        return True
+
+
+def is_valid_object(obj: Any, required_keys: Iterable[str] = ()) -> bool:
+    """Check that obj is a dict containing every required key."""
+    return isinstance(obj, dict) and all(key in obj for key in required_keys)
+
+
+def find_json_object(text: str, required_keys: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Return the first complete JSON object in text that has the required keys.
+
+    Args:
+        text: Model reply, possibly with prose or code fences around the JSON
+        required_keys: Keys the object must contain
+
+    Returns:
+        Parsed object, or None if there isn't one
+    """
+    return JSONObjectScanner(required_keys).feed(text)
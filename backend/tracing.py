@@ -0,0 +1,137 @@
+"""Per-node tracing of latency, tokens, retries and payload sizes."""
+
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from backend.events import changed_keys, emit, listening
+from backend.metrics import NODE_DURATION
+
+# Run record of the node executing in the current context
+_current_run: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_node_run", default=None)
+
+# Nodes that fan out (best-of-N drafting) record calls from several threads
+_record_lock = threading.Lock()
+
+
+def _new_run(node: str, iteration: int) -> Dict[str, Any]:
+    return {
+        "node": node,
+        "iteration": iteration,
+        "started_at": datetime.now().isoformat(),
+        "wall_time": 0.0,
+        # Time spent waiting on rate limits, Retry-After pauses and backoff
+        "queue_time": 0.0,
+        "llm_calls": 0,
+        # Calls that still failed after their retries (included in llm_calls)
+        "failed_calls": 0,
+        "attempts": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "prompt_bytes": 0,
+        "response_bytes": 0,
+        "json_fallbacks": 0,
+        # Model that answered (the last one, if a fallback was needed)
+        "model": None,
+        "error": None,
+    }
+
+
+def current_run() -> Optional[Dict[str, Any]]:
+    """Run record of the node executing in this context, if any."""
+    return _current_run.get()
+
+
+def record_llm_call(
+    attempts: int,
+    queue_time: float,
+    prompt_bytes: int,
+    response_bytes: int,
+    usage: Any = None,
+    model: Optional[str] = None,
+    failed: bool = False
+):
+    """
+    Add one LLM call's cost to the current node's run record.
+
+    Failed calls are recorded too, since their retries and waits are
+    where the time went.
+
+    Args:
+        attempts: Requests sent, including retries
+        queue_time: Seconds spent waiting rather than requesting
+        prompt_bytes: UTF-8 size of all prompt messages
+        response_bytes: UTF-8 size of the response text
+        usage: response.usage from the API, if reported
+        model: Model that produced the response (or last failed)
+        failed: The call gave up without a response
+    """
+    run = _current_run.get()
+    if run is None:
+        return
+
+    with _record_lock:
+        run["llm_calls"] += 1
+        run["failed_calls"] += int(failed)
+        run["attempts"] += attempts
+        run["queue_time"] += queue_time
+        run["prompt_bytes"] += prompt_bytes
+        run["response_bytes"] += response_bytes
+        if model:
+            run["model"] = model
+        if usage is not None:
+            run["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+            run["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+
+def record_json_fallback():
+    """Count a reply that needed extract_json_from_text instead of json.loads."""
+    run = _current_run.get()
+    if run is not None:
+        with _record_lock:
+            run["json_fallbacks"] += 1
+
+
+def traced_node(name: str) -> Callable:
+    """
+    Decorate a workflow node to record a run in state['metadata']['node_runs'].
+
+    Args:
+        name: Node name stored with the run
+
+    Returns:
+        Decorator wrapping the node function
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(state, *args, **kwargs):
+            run = _new_run(name, state.get("iteration", 0))
+            token = _current_run.set(run)
+            emit("node_start", name, iteration=run["iteration"])
+            start = time.perf_counter()
+
+            try:
+                result = fn(state, *args, **kwargs)
+            finally:
+                run["wall_time"] = time.perf_counter() - start
+                _current_run.reset(token)
+                NODE_DURATION.observe(run["wall_time"], node=name)
+
+            # Nodes carry earlier errors forward as the same object; a node's
+            # own error is a new string, even if its text repeats an earlier one
+            if result.get("error") and result.get("error") is not state.get("error"):
+                run["error"] = result["error"]
+
+            metadata = dict(result.get("metadata") or {})
+            metadata["node_runs"] = list(metadata.get("node_runs", [])) + [run]
+            
+            if listening():
+                emit("node_end", name, seconds=round(run["wall_time"], 3), run=run,
+                     partial=changed_keys(state, result), error=run["error"])
+            return {**result, "metadata": metadata}
+
+        return wrapper
+    return decorator
@@ -1,14 +1,22 @@
 """Utility functions for file processing."""
 
-from pathlib import Path
-import PyPDF2
-import markdown
 import re
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 # Data directories
 DATA_DIR = Path(__file__).parent.parent / "data"
 OUTPUTS_DIR = DATA_DIR / "outputs"
 
+# Filled/stroked rectangles (cell shading) or vertical rules (cell borders)
+# drawn on one page from which it's taken to contain a table
+TABLE_RECT_THRESHOLD = 6
+TABLE_VERTICAL_RULES = 2
+
+# Content stream operators: 're' (rectangle) and 'x1 y1 m x2 y2 l' (line)
+RECT_OPERATOR = re.compile(rb'(?<![A-Za-z])re(?![A-Za-z])')
+LINE_SEGMENT = re.compile(rb'(-?[\d.]+)\s+(-?[\d.]+)\s+m\s+(-?[\d.]+)\s+(-?[\d.]+)\s+l(?![A-Za-z])')
+
 
 def parse_pdf(file_path: Path) -> str:
     """
@@ -20,6 +28,9 @@ def parse_pdf(file_path: Path) -> str:
     Returns:
         Extracted text
     """
+    # Imported on first use to keep startup fast
+    import PyPDF2
+    
     try:
         with open(file_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
@@ -34,6 +45,63 @@ def parse_pdf(file_path: Path) -> str:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
 
 
+def inspect_pdf(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Find layout that ATS parsers handle badly: images and drawn tables.
+    
+    Tables are detected from the rectangles and vertical rules each page
+    draws (cell shading and borders), so borderless tables aren't found.
+    Best effort: a PDF whose text could be extracted is still evaluated
+    when its layout can't be read.
+    
+    Args:
+        file_path: Path to PDF file
+        
+    Returns:
+        Dict with 'pages', 'images' and 'tables' (pages with a table), or
+        None if the PDF couldn't be inspected
+    """
+    try:
+        import PyPDF2
+        
+        with open(file_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            images = 0
+            tables = 0
+            for page in pdf_reader.pages:
+                resources = page.get("/Resources")
+                resources = resources.get_object() if resources is not None else {}
+                xobjects = resources.get("/XObject")
+                xobjects = xobjects.get_object() if xobjects is not None else {}
+                images += sum(
+                    1 for name in xobjects
+                    if xobjects[name].get_object().get("/Subtype") == "/Image"
+                )
+                
+                contents = page.get_contents()
+                if contents is None:
+                    data = b""
+                elif hasattr(contents, "get_data"):
+                    data = contents.get_data()
+                else:
+                    # Content split over several streams
+                    data = b"\n".join(part.get_object().get_data() for part in contents)
+                # Section dividers are horizontal; table grids also have vertical rules
+                vertical_rules = sum(
+                    1 for x1, y1, x2, y2 in LINE_SEGMENT.findall(data)
+                    if x1 == x2 and y1 != y2
+                )
+                if (len(RECT_OPERATOR.findall(data)) >= TABLE_RECT_THRESHOLD
+                        or vertical_rules >= TABLE_VERTICAL_RULES):
+                    tables += 1
+            
+            return {"pages": len(pdf_reader.pages), "images": images, "tables": tables}
+            
+    except Exception:
+        return None
+
+
 def parse_text_file(file_path: Path) -> str:
     """
     Read text from .txt or .md file.
@@ -84,7 +152,7 @@ def save_markdown(content: str, filename: str) -> Path:
     return output_path
 
 
-def convert_markdown_to_pdf(content: str, filename: str) -> Path:
+def convert_markdown_to_pdf(content: str, filename: str) -> Optional[Path]:
     """
     Convert markdown to PDF using ReportLab (pure Python, no system dependencies).
     
@@ -95,127 +163,7 @@ def convert_markdown_to_pdf(content: str, filename: str) -> Path:
     Returns:
         Path to generated PDF, or None if conversion fails
     """
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER
-        
-    except ImportError:
-        raise ImportError(
-            "ReportLab not installed. Install with:\n"
-            "pip install reportlab\n"
-            "Or skip PDF generation and use Markdown download only."
-        )
+    from backend.exporters import export_document
     
-    try:
-        output_path = OUTPUTS_DIR / f"{filename}.pdf"
-        
-        # Create PDF
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18,
-        )
-        
-        # Container for PDF elements
-        story = []
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor='#2c3e50',
-            spaceAfter=12,
-            alignment=TA_CENTER,
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor='#34495e',
-            spaceAfter=6,
-            spaceBefore=12,
-        )
-        
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=14,
-            textColor='#333333',
-        )
-        
-        # Parse markdown into simple text (basic formatting)
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                story.append(Spacer(1, 0.2 * inch))
-                continue
-            
-            # Handle headers
-            if line.startswith('# '):
-                text = line[2:].strip()
-                # Remove markdown from headers
-                text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-                text = re.sub(r'\*(.+?)\*', r'\1', text)
-                story.append(Paragraph(text, title_style))
-                
-            elif line.startswith('## '):
-                text = line[3:].strip()
-                # Remove markdown from headers
-                text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-                text = re.sub(r'\*(.+?)\*', r'\1', text)
-                story.append(Paragraph(text, heading_style))
-                
-            elif line.startswith('### '):
-                text = line[4:].strip()
-                # Remove markdown from headers
-                text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-                text = re.sub(r'\*(.+?)\*', r'\1', text)
-                para_style = ParagraphStyle(
-                    'Heading3',
-                    parent=heading_style,
-                    fontSize=12,
-                )
-                story.append(Paragraph(text, para_style))
-                
-            # Handle lists
-            elif line.startswith('- ') or line.startswith('* '):
-                text = '• ' + line[2:].strip()
-                # Remove markdown from list items
-                text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-                text = re.sub(r'\*(.+?)\*', r'\1', text)
-                text = re.sub(r'`(.+?)`', r'\1', text)
-                story.append(Paragraph(text, normal_style))
-                
-            # Handle normal text - strip all markdown
-            else:
-                # Remove markdown formatting to avoid ReportLab parsing errors
-                text = re.sub(r'\*\*(.+?)\*\*', r'\1', line)  # Remove **bold**
-                text = re.sub(r'\*(.+?)\*', r'\1', text)      # Remove *italic*
-                text = re.sub(r'`(.+?)`', r'\1', text)        # Remove `code`
-                text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)  # Remove [links](url)
-                story.append(Paragraph(text, normal_style))
-        
-        # Build PDF
-        doc.build(story)
-        
-        return output_path
-        
-    except Exception as e:
-        # Return None on failure - PDF is optional
-        print(f"PDF generation failed: {str(e)}")
-        return None
\ No newline at end of file
+    # Parsing is shared with the other exporters and cached per content
+    return export_document(content, filename, ("pdf",))["pdf"]
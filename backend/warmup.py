@@ -0,0 +1,108 @@
+"""Optional warm-up so a new server's first request doesn't pay for cold starts."""
+
+import importlib
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Warm up when the service or Streamlit app starts
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "true").lower() in ("1", "true", "yes")
+# Seconds allowed for the request that opens the LLM connection
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "5"))
+
+# Modules imported lazily elsewhere, loaded ahead of the first request
+WARMUP_MODULES = (
+    "openai",
+    "backend.pipeline",
+    "backend.exporters",
+    "reportlab.platypus",
+    "PyPDF2",
+)
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def _open_llm_connections():
+    """Make one cheap request per routed endpoint so each client's TLS connection is pooled."""
+    from backend.nodes import get_client
+    from backend.routing import get_all_routes
+
+    endpoints = {}
+    for route in get_all_routes():
+        endpoints.setdefault((route.base_url, route.api_key), route)
+
+    for route in endpoints.values():
+        if not route.api_key:
+            continue
+        try:
+            get_client(route).with_options(timeout=WARMUP_TIMEOUT).models.list()
+        except Exception as e:
+            # Any response (even an error status) leaves the connection open
+            print(f"LLM warm-up request to {route.base_url} failed: {str(e)}")
+
+
+def _load_indexes():
+    from backend.minhash import JD_REUSE, get_jd_lsh
+
+    if JD_REUSE:
+        get_jd_lsh()
+
+
+def warm_up(llm: bool = True) -> Dict[str, float]:
+    """
+    Open the database, import deferred modules and pre-open the LLM connection.
+
+    Each step is best effort: a failure is printed and the rest still run.
+
+    Args:
+        llm: Also make a request to each routed LLM endpoint
+
+    Returns:
+        Dict of step name -> seconds taken
+    """
+    from backend.database import init_database
+
+    steps = {
+        "database": init_database,
+        "imports": lambda: [importlib.import_module(name) for name in WARMUP_MODULES],
+        "indexes": _load_indexes,
+    }
+    if llm:
+        steps["llm"] = _open_llm_connections
+
+    timings = {}
+    for name, step in steps.items():
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"Warm-up step '{name}' failed: {str(e)}")
+        timings[name] = round(time.perf_counter() - start, 4)
+    return timings
+
+
+def warm_up_on_start(background: bool = True) -> Optional[threading.Thread]:
+    """
+    Run warm_up() once per process if WARMUP_ON_START is set.
+
+    Args:
+        background: Warm up on a daemon thread instead of blocking startup
+
+    Returns:
+        The warm-up thread when started in the background, else None
+    """
+    global _started
+    with _start_lock:
+        if _started or not WARMUP_ON_START:
+            return None
+        _started = True
+
+    if not background:
+        warm_up()
+        return None
+
+    thread = threading.Thread(target=warm_up, daemon=True, name="warm-up")
+    thread.start()
+    return thread
@@ -0,0 +1 @@
+"""Benchmarks and local stand-in services for Resume-Optimizer-AI."""
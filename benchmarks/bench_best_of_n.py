@@ -0,0 +1,94 @@
+"""
+Best-of-N drafting vs the sequential draft → critique loop.
+
+Usage:
+    python -m benchmarks.bench_best_of_n [--pipelines 12] [--users 4]
+        [--candidates 3] [--concurrency 3] [--latency 0.3] [--tokens-per-second 400]
+
+Runs the generation step (drafting, critique, finalize) in each DRAFT_MODE
+against a mock server whose critique scores are drawn from --score-range,
+and reports wall-clock time, final score and LLM requests per pipeline.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.load_test import initial_state, percentile
+from benchmarks.mock_llm_server import MockLLMServer
+
+MODES = ("single", "iterative", "best_of_n")
+
+
+def run_mode(server: MockLLMServer, evaluated: dict, mode: str, pipelines: int, users: int) -> dict:
+    """Run the drafting step for several pipelines and summarize them."""
+    from backend.pipeline import run_drafting
+
+    start_requests = server.stats["requests"]
+    timings = []
+    scores = []
+
+    def one_pipeline(_):
+        state = {**evaluated, "metadata": dict(evaluated["metadata"])}
+        start = time.perf_counter()
+        result = run_drafting(state, mode=mode)
+        timings.append(time.perf_counter() - start)
+        scores.append(result["critique"].get("overall_score", 0))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(one_pipeline, range(pipelines)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "elapsed_s": round(elapsed, 2),
+        "p50_s": round(percentile(timings, 50), 3),
+        "p95_s": round(percentile(timings, 95), 3),
+        "mean_score": round(statistics.mean(scores), 2),
+        "min_score": min(scores),
+        "requests_per_pipeline": round((server.stats["requests"] - start_requests) / pipelines, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pipelines", type=int, default=12)
+    parser.add_argument("--users", type=int, default=4, help="Pipelines run concurrently")
+    parser.add_argument("--candidates", type=int, default=3, help="DRAFT_CANDIDATES")
+    parser.add_argument("--concurrency", type=int, default=3, help="DRAFT_CONCURRENCY")
+    parser.add_argument("--latency", type=float, default=0.3, help="Mean time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=400)
+    parser.add_argument("--score-range", type=float, nargs=2, default=(6.0, 9.5))
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        score_range=tuple(args.score_range),
+    )
+
+    with server:
+        # Must be set before backend.nodes is imported
+        os.environ["QUBRID_BASE_URL"] = server.base_url
+        os.environ.setdefault("QUBRID_API_KEY", "mock")
+        os.environ["DRAFT_CANDIDATES"] = str(args.candidates)
+        os.environ["DRAFT_CONCURRENCY"] = str(args.concurrency * args.users)
+
+        from backend.pipeline import run_evaluation
+        from backend.ratelimit import configure_rate_limiter
+
+        configure_rate_limiter(0, 0)
+        evaluated = run_evaluation(initial_state())
+
+        print(f"{'mode':<12}{'elapsed':>9}{'p50':>9}{'p95':>9}{'score':>8}{'min':>6}{'req/run':>9}")
+        for mode in MODES:
+            r = run_mode(server, evaluated, mode, args.pipelines, args.users)
+            print(f"{r['mode']:<12}{r['elapsed_s']:>9}{r['p50_s']:>9}{r['p95_s']:>9}"
+                  f"{r['mean_score']:>8}{r['min_score']:>6}{r['requests_per_pipeline']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Build and query time of the job description index.
+
+Usage:
+    python -m benchmarks.bench_jd_index [--postings 20000] [--queries 200] [--k 5]
+
+Indexes synthetic jd_analysis records (drawn from a skill vocabulary with
+a long tail, like real postings) and ranks synthetic resumes against them.
+No database or LLM is involved.
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.load_test import percentile
+
+BASE_SKILLS = [
+    "python", "java", "go", "rust", "c++", "c#", "javascript", "typescript", "node.js",
+    "react", "django", "flask", "fastapi", "spring boot", "sql", "postgresql", "mysql",
+    "mongodb", "redis", "kafka", "spark", "airflow", "docker", "kubernetes", "terraform",
+    "aws", "gcp", "azure", "machine learning", "deep learning", "pytorch", "tensorflow",
+    "rest apis", "graphql", "ci/cd", "linux", "microservices", "data pipelines",
+]
+TITLES = ["Backend Engineer", "Data Engineer", "ML Engineer", "Full Stack Developer",
+          "Platform Engineer", "Site Reliability Engineer", "Data Scientist"]
+
+
+def skill_vocabulary(size: int) -> list:
+    """Real skills plus a long tail of rarer tool names."""
+    return BASE_SKILLS + [f"tool{i}" for i in range(size - len(BASE_SKILLS))]
+
+
+def synthetic_analysis(rng: random.Random, vocabulary: list) -> dict:
+    # Zipf-like: common skills appear far more often than tail ones
+    picks = {vocabulary[min(int(rng.paretovariate(1.2)) - 1, len(vocabulary) - 1)] for _ in range(12)}
+    picks = list(picks)
+    return {
+        "job_title": rng.choice(TITLES),
+        "company": f"Company {rng.randrange(5000)}",
+        "required_skills": picks[:6],
+        "ats_keywords": picks[6:],
+        "key_responsibilities": ["Build and operate services", "Own data quality"],
+    }
+
+
+def synthetic_resume(rng: random.Random, vocabulary: list) -> str:
+    skills = ", ".join(rng.sample(vocabulary[:200], 15))
+    return f"# Candidate\n## Skills\n- {skills}\n## Experience\n- Built services with {skills}\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--postings", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--vocabulary", type=int, default=3000)
+    args = parser.parse_args()
+
+    from backend.jd_index import build_index
+
+    rng = random.Random(7)
+    vocabulary = skill_vocabulary(args.vocabulary)
+    rows = [
+        {"id": i, "jd_analysis": synthetic_analysis(rng, vocabulary), "job_title": "", "company": ""}
+        for i in range(args.postings)
+    ]
+
+    start = time.perf_counter()
+    index = build_index(rows)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(100):
+        index.add(args.postings + i, synthetic_analysis(rng, vocabulary))
+    add_ms = (time.perf_counter() - start) * 1000 / 100
+
+    resumes = [synthetic_resume(rng, vocabulary) for _ in range(args.queries)]
+    index.search(resumes[0], args.k)  # warm posting arrays
+    timings = []
+    for resume in resumes:
+        start = time.perf_counter()
+        index.search(resume, args.k)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(f"postings: {len(index)}  terms: {len(index.postings)}")
+    print(f"build: {build_seconds:.2f}s  incremental add: {add_ms:.3f}ms")
+    print(f"query (k={args.k}): p50 {percentile(timings, 50):.2f}ms  "
+          f"p95 {percentile(timings, 95):.2f}ms  p99 {percentile(timings, 99):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
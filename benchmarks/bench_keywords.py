@@ -0,0 +1,110 @@
+"""
+Keyword coverage scan time: Aho-Corasick matcher vs one regex per keyword.
+
+Usage:
+    python -m benchmarks.bench_keywords [--keywords 60] [--words 800] [--runs 200]
+
+Generates a job description analysis with --keywords keywords (some
+multi-word, some with synonyms) and a resume of --words words, then times
+building the matcher, scanning the resume with it, and the naive approach
+of searching for every keyword (and synonym) with its own regex.
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from benchmarks.load_test import percentile
+from backend.keywords import SYNONYM_GROUPS, KeywordMatcher, jd_keywords, keyword_coverage
+
+FILLER = (
+    "built led designed improved reduced delivered scalable services platform team "
+    "customers latency pipelines data systems across product engineering reliable "
+    "migrated owned launched automated monitoring infrastructure features growth"
+).split()
+
+TECH = (
+    "python java go rust c++ c# ruby scala kotlin swift terraform ansible docker "
+    "kafka spark airflow redis graphql grpc linux bash pandas pytorch tensorflow "
+    "django flask fastapi spring rails snowflake dbt tableau looker jenkins"
+).split()
+
+
+def make_jd(keywords: int, rng: random.Random) -> dict:
+    """JD analysis mixing single words, phrases and synonym-group keywords."""
+    pool = TECH + [group[0] for group in SYNONYM_GROUPS]
+    pool += [f"{rng.choice(FILLER)} {rng.choice(FILLER)}" for _ in range(keywords)]
+    chosen = rng.sample(pool, min(keywords, len(pool)))
+    half = len(chosen) // 2
+    return {"ats_keywords": chosen[:half], "required_skills": chosen[half:]}
+
+
+def make_resume(words: int, rng: random.Random) -> str:
+    """Resume text with a sprinkling of tech words and synonyms."""
+    vocabulary = FILLER * 4 + TECH + [rng.choice(group) for group in SYNONYM_GROUPS]
+    lines = []
+    while sum(len(line.split()) for line in lines) < words:
+        lines.append("- " + " ".join(rng.choice(vocabulary) for _ in range(12)).capitalize() + ".")
+    return "\n".join(lines)
+
+
+def naive_coverage(jd_analysis: dict, text: str) -> dict:
+    """One case-insensitive regex search per keyword and synonym (no stemming)."""
+    groups = {phrase: group for group in SYNONYM_GROUPS for phrase in group}
+    hits = {}
+    for keyword in jd_keywords(jd_analysis):
+        spans = []
+        for phrase in groups.get(keyword.lower(), (keyword,)):
+            pattern = re.compile(rf'(?<![\w+#]){re.escape(phrase)}(?![\w+#])', re.IGNORECASE)
+            spans.extend([m.start(), m.end()] for m in pattern.finditer(text))
+        hits[keyword] = spans
+    return hits
+
+
+def time_ms(fn, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keywords", type=int, default=60)
+    parser.add_argument("--words", type=int, default=800, help="Resume length in words")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    jd_analysis = make_jd(args.keywords, rng)
+    resume = make_resume(args.words, rng)
+    keywords = jd_keywords(jd_analysis)
+
+    build = time_ms(lambda: KeywordMatcher(keywords), args.runs)
+    matcher = KeywordMatcher(keywords)
+    scan = time_ms(lambda: matcher.scan(resume), args.runs)
+    cached = time_ms(lambda: keyword_coverage(jd_analysis, resume), args.runs)
+    naive = time_ms(lambda: naive_coverage(jd_analysis, resume), args.runs)
+
+    coverage = matcher.coverage(resume)
+    naive_found = sum(1 for spans in naive_coverage(jd_analysis, resume).values() if spans)
+    print(f"{len(keywords)} keywords, {len(resume.split())}-word resume, {args.runs} runs")
+    print(f"found: {len(coverage['matched'])} (naive regex: {naive_found})\n")
+
+    print(f"{'step':<28}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, timings in (
+        ("build matcher", build),
+        ("scan (aho-corasick)", scan),
+        ("keyword_coverage (cached)", cached),
+        ("naive regex per keyword", naive),
+    ):
+        print(f"{name:<28}{statistics.median(timings):>10.3f}{percentile(timings, 95):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
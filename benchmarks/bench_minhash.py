@@ -0,0 +1,108 @@
+"""
+Build and query time of the near-duplicate job description index.
+
+Usage:
+    python -m benchmarks.bench_minhash [--postings 100000] [--queries 1000] [--edits 2]
+
+Signs synthetic job descriptions, indexes them with MinHash LSH, then
+queries with lightly edited copies of indexed postings (which should be
+found) and with unseen postings (which should not). No database or LLM
+is involved.
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.load_test import percentile
+
+SENTENCES = [
+    "We are looking for a {title} to join our {team} team.",
+    "You will design, build and operate {skill} services used by millions of customers.",
+    "Strong experience with {skill} and {skill2} is required.",
+    "Experience with {skill} in production is a plus.",
+    "You will partner with product and design to ship features quickly.",
+    "Own the reliability, observability and performance of your systems.",
+    "Mentor junior engineers and contribute to code reviews.",
+    "We offer competitive salary, equity and {benefit}.",
+    "This role is {location} and reports to the head of {team}.",
+    "Bachelor's degree in computer science or equivalent experience with {skill2}.",
+    "Familiarity with {skill} and {skill2} pipelines at scale.",
+    "Write clear design documents and drive technical decisions for {team}.",
+]
+TITLES = ["Backend Engineer", "Data Engineer", "ML Engineer", "Frontend Developer",
+          "Platform Engineer", "Site Reliability Engineer", "Data Scientist"]
+TEAMS = ["payments", "search", "growth", "infrastructure", "analytics", "identity", "ads"]
+BENEFITS = ["remote stipend", "learning budget", "parental leave", "health coverage"]
+LOCATIONS = ["fully remote", "hybrid in Berlin", "onsite in Austin", "remote in Europe"]
+
+
+def synthetic_jd(rng: random.Random, skills: list) -> str:
+    lines = [f"Company {rng.randrange(100000)} - requisition {rng.randrange(10**6)}"]
+    for template in rng.sample(SENTENCES, 8):
+        lines.append(template.format(
+            title=rng.choice(TITLES), team=rng.choice(TEAMS), skill=rng.choice(skills),
+            skill2=rng.choice(skills), benefit=rng.choice(BENEFITS),
+            location=rng.choice(LOCATIONS),
+        ))
+    return "\n".join(lines)
+
+
+def edited_copy(rng: random.Random, text: str, edits: int) -> str:
+    """The same posting reposted: a few words replaced."""
+    words = text.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = f"edit{rng.randrange(1000)}"
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--postings", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--edits", type=int, default=2, help="Words changed in duplicate queries")
+    args = parser.parse_args()
+
+    from backend.minhash import JD_REUSE_THRESHOLD, MinHashLSH, minhash_signature
+
+    rng = random.Random(11)
+    skills = [f"skill{i}" for i in range(2000)]
+    texts = [synthetic_jd(rng, skills) for _ in range(args.postings)]
+
+    start = time.perf_counter()
+    signatures = [minhash_signature(text) for text in texts]
+    sign_seconds = time.perf_counter() - start
+
+    index = MinHashLSH()
+    start = time.perf_counter()
+    for key, signature in enumerate(signatures):
+        index.add(key, signature)
+    insert_seconds = time.perf_counter() - start
+
+    duplicates = rng.sample(range(args.postings), args.queries // 2)
+    queries = [(key, edited_copy(rng, texts[key], args.edits)) for key in duplicates]
+    queries += [(None, synthetic_jd(rng, skills)) for _ in range(args.queries - len(queries))]
+
+    timings = []
+    found = false_matches = 0
+    for expected, text in queries:
+        start = time.perf_counter()
+        match = index.query(minhash_signature(text), JD_REUSE_THRESHOLD)
+        timings.append((time.perf_counter() - start) * 1000)
+        if expected is not None and match and match[0] == expected:
+            found += 1
+        elif expected is None and match:
+            false_matches += 1
+
+    unseen = args.queries - len(duplicates)
+    print(f"postings: {len(index)}  threshold: {JD_REUSE_THRESHOLD}")
+    print(f"sign: {sign_seconds:.2f}s ({sign_seconds * 1e6 / args.postings:.0f}us/posting)  "
+          f"insert: {insert_seconds:.2f}s")
+    print(f"query (sign + lookup): p50 {percentile(timings, 50):.2f}ms  "
+          f"p95 {percentile(timings, 95):.2f}ms  p99 {percentile(timings, 99):.2f}ms")
+    print(f"duplicates found: {found}/{len(duplicates)}  "
+          f"false matches: {false_matches}/{unseen}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Goodput under bursts against a rate-limited stand-in server.
+
+Usage:
+    python -m benchmarks.bench_rate_limit [--users 40] [--server-rpm 300]
+
+Fires a burst of concurrent call_llm_with_retry calls at a mock server
+that returns 429 + Retry-After above its limit, with the client-side
+limiter off and then matched to the server's limit.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.mock_llm_server import MockLLMServer
+
+
+def run_burst(server: MockLLMServer, users: int, client_rpm: float) -> dict:
+    """Send one request per user concurrently and measure the outcome."""
+    from backend.nodes import call_llm_with_retry
+    from backend.ratelimit import configure_rate_limiter
+
+    configure_rate_limiter(client_rpm, 0)
+    messages = [{"role": "user", "content": "Polish and finalize this resume."}]
+    start_stats = dict(server.stats)
+
+    def one_call(_):
+        try:
+            call_llm_with_retry(messages, temperature=0.5, max_retries=5)
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        results = list(pool.map(one_call, range(users)))
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum(results)
+    return {
+        "client_rpm": client_rpm or "off",
+        "succeeded": succeeded,
+        "failed": users - succeeded,
+        "server_requests": server.stats["requests"] - start_stats["requests"],
+        "rate_limited": server.stats["rate_limited"] - start_stats["rate_limited"],
+        "elapsed_s": round(elapsed, 2),
+        "goodput_rps": round(succeeded / elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--server-rpm", type=float, default=300)
+    args = parser.parse_args()
+
+    with MockLLMServer(requests_per_minute=args.server_rpm, retry_after=1) as server:
+        # Must be set before backend.nodes is imported
+        os.environ["QUBRID_BASE_URL"] = server.base_url
+        os.environ.setdefault("QUBRID_API_KEY", "mock")
+
+        for client_rpm in (0, args.server_rpm):
+            print(run_burst(server, args.users, client_rpm))
+
+
+if __name__ == "__main__":
+    main()
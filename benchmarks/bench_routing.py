@@ -0,0 +1,101 @@
+"""
+Evaluation latency with per-node model routing.
+
+Usage:
+    python -m benchmarks.bench_routing [--runs 12] [--users 4] [--latency 0.5]
+        [--tokens-per-second 300] [--fast-factor 0.3]
+
+Serves a "large" model and a "fast" one (--fast-factor of its latency)
+from the mock server, then runs the evaluation pipeline (JD analysis,
+critique, suggestions) with every node on the large model, with the JSON
+nodes routed to the fast model, and with a fallback chain whose first
+model doesn't exist.
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.load_test import initial_state, percentile
+from benchmarks.mock_llm_server import MockLLMServer
+
+LARGE_MODEL = "large-model"
+FAST_MODEL = "fast-model"
+JSON_NODES = ("analyze_jd", "critique", "suggest")
+
+SCENARIOS = {
+    "single model": {"default": {"models": [LARGE_MODEL]}},
+    "fast JSON nodes": {
+        "default": {"models": [LARGE_MODEL]},
+        **{node: {"models": [FAST_MODEL]} for node in JSON_NODES},
+    },
+    "fallback chain": {
+        "default": {"models": [LARGE_MODEL]},
+        **{node: {"models": ["missing-model", FAST_MODEL]} for node in JSON_NODES},
+    },
+}
+
+
+def run_scenario(routes: dict, runs: int, users: int) -> dict:
+    """Evaluate the sample resume several times under one routing config."""
+    from backend.pipeline import run_evaluation
+    from backend.routing import configure_routes
+
+    configure_routes(routes)
+    timings = []
+    models = Counter()
+
+    def one_run(_):
+        start = time.perf_counter()
+        result = run_evaluation(initial_state())
+        timings.append(time.perf_counter() - start)
+        for run in result["metadata"].get("node_runs", []):
+            models[f"{run['node']}={run.get('model')}"] += 1
+
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(one_run, range(runs)))
+
+    return {
+        "p50_s": round(percentile(timings, 50), 3),
+        "p95_s": round(percentile(timings, 95), 3),
+        "models": sorted(models),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=12)
+    parser.add_argument("--users", type=int, default=4, help="Evaluations run concurrently")
+    parser.add_argument("--latency", type=float, default=0.5, help="Large model time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=300)
+    parser.add_argument("--fast-factor", type=float, default=0.3,
+                        help="Fast model latency relative to the large one")
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        models={LARGE_MODEL: 1.0, FAST_MODEL: args.fast_factor},
+    )
+
+    with server:
+        # Must be set before backend.nodes is imported
+        os.environ["QUBRID_BASE_URL"] = server.base_url
+        os.environ.setdefault("QUBRID_API_KEY", "mock")
+        # Every run analyzes the same posting; measure the model, not reuse
+        os.environ["JD_REUSE"] = "false"
+
+        from backend.ratelimit import configure_rate_limiter
+
+        configure_rate_limiter(0, 0)
+
+        print(f"{'routing':<18}{'p50':>8}{'p95':>8}  models")
+        for name, routes in SCENARIOS.items():
+            r = run_scenario(routes, args.runs, args.users)
+            print(f"{name:<18}{r['p50_s']:>8}{r['p95_s']:>8}  {', '.join(r['models'])}")
+
+
+if __name__ == "__main__":
+    main()
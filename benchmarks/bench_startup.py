@@ -0,0 +1,115 @@
+"""
+Cold-start import time of the backend entry points.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--modules backend,backend.service] [--top 8]
+    python -m benchmarks.bench_startup --warmup
+
+Each import runs in a fresh interpreter with `-X importtime`, so nothing
+is cached between runs. Reports the median wall time (minus a bare
+interpreter's), the module's own cumulative import time, which heavy
+dependencies it pulled in, and the slowest imports beneath it. --warmup
+also times backend.warmup.warm_up() (without the LLM request).
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+DEFAULT_MODULES = [
+    "backend",
+    "backend.cli",
+    "backend.pipeline",
+    "backend.jobs",
+    "backend.service",
+    "frontend.components",
+]
+
+# Dependencies that should only load when a request needs them
+HEAVY_MODULES = ["openai", "langgraph", "numpy", "PyPDF2", "reportlab", "docx", "PIL"]
+
+
+def import_once(module: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        (wall seconds, {module name: cumulative import microseconds})
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum)
+    return wall, cumulative
+
+
+def bare_interpreter(runs: int) -> Tuple[float, Set[str]]:
+    """Median wall time of an empty interpreter and the modules it loads at startup."""
+    timings, loaded = [], set()
+    for _ in range(runs):
+        wall, cumulative = import_once("sys")
+        timings.append(wall)
+        loaded = set(cumulative)
+    return statistics.median(timings), loaded
+
+
+def slowest_imports(cumulative: Dict[str, int], module: str, top: int,
+                    startup: Set[str]) -> List[Tuple[str, int]]:
+    """Slowest top-level packages imported on the way to the module."""
+    packages: Dict[str, int] = {}
+    for name, micros in cumulative.items():
+        root = name.split(".")[0]
+        if name not in startup and root != module.split(".")[0]:
+            packages[root] = max(packages.get(root, 0), micros)
+    return sorted(packages.items(), key=lambda item: -item[1])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", default=",".join(DEFAULT_MODULES))
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list")
+    parser.add_argument("--warmup", action="store_true", help="Also time warm_up()")
+    args = parser.parse_args()
+
+    baseline, startup = bare_interpreter(args.runs)
+    print(f"bare interpreter: {baseline * 1000:.0f}ms (subtracted below)\n")
+
+    for module in [m.strip() for m in args.modules.split(",") if m.strip()]:
+        walls, cumulative = [], {}
+        for _ in range(args.runs):
+            wall, cumulative = import_once(module)
+            walls.append(wall)
+
+        heavy = [name for name in HEAVY_MODULES if name in cumulative]
+        print(f"{module}: {(statistics.median(walls) - baseline) * 1000:.0f}ms wall, "
+              f"{cumulative.get(module, 0) / 1000:.0f}ms importtime")
+        print(f"  heavy deps loaded: {', '.join(heavy) or 'none'}")
+        for name, micros in slowest_imports(cumulative, module, args.top, startup):
+            print(f"  {micros / 1000:7.1f}ms  {name}")
+
+    if args.warmup:
+        code = "import json; from backend.warmup import warm_up; print(json.dumps(warm_up(llm=False)))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        steps = json.loads(result.stdout.strip().splitlines()[-1])
+        print("\nwarm_up (no LLM request): " + "  ".join(
+            f"{name} {seconds * 1000:.0f}ms" for name, seconds in steps.items()
+        ))
+
+
+if __name__ == "__main__":
+    main()
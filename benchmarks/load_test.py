@@ -0,0 +1,193 @@
+"""
+End-to-end load benchmark against a local mock OpenAI-compatible server.
+
+Usage:
+    python -m benchmarks.load_test [--users 10] [--runs 3] [--mode nodes|graph]
+        [--latency 0.5] [--jitter 0.5] [--tokens-per-second 200]
+        [--max-concurrency 0] [--error-rate 0.0] [--rate-limit-rate 0.0] [--json]
+        [--record cassette.jsonl | --replay cassette.jsonl [--replay-latency recorded]]
+
+Each simulated user runs the real backend nodes (mode "nodes": the full
+evaluation + generation sequence) or the compiled create_resume_workflow
+graph (mode "graph", which runs from its entry point through the
+evaluation half). Reports throughput, p50/p95/p99 latency per node,
+extra requests (retries and hedges) and node fallbacks.
+
+--record saves every LLM reply to a cassette; --replay serves replies from
+one instead of the server, so the node timings show only the pipeline's
+own work (parsing, database writes, rendering).
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.mock_llm_server import MockLLMServer, RESUME_REPLY
+
+JOB_DESCRIPTION = """Backend Engineer at Example Corp.
+We need Python, SQL, Docker and AWS experience building REST APIs."""
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(len(ordered) * percent / 100.0)) - 1))
+    return ordered[index]
+
+
+class Recorder:
+    """Thread-safe collector of per-node timings."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.node_calls = 0
+        self.fallbacks = 0
+
+    def record(self, node: str, seconds: float, state: dict):
+        with self.lock:
+            self.timings[node].append(seconds)
+            self.node_calls += 1
+            if state.get("error"):
+                self.fallbacks += 1
+
+
+def initial_state() -> dict:
+    from backend.pipeline import build_initial_state
+    return build_initial_state(RESUME_REPLY, "resume.md", JOB_DESCRIPTION, "pasted_text")
+
+
+def run_user_nodes(recorder: Recorder):
+    """One simulated user driving the node functions directly."""
+    from backend.pipeline import EVALUATION_STEPS, GENERATION_STEPS
+
+    state = initial_state()
+    for stage, node, _ in EVALUATION_STEPS + GENERATION_STEPS:
+        start = time.perf_counter()
+        result = node(state)
+        recorder.record(stage, time.perf_counter() - start, result)
+        # Errors are per-node; don't let one leak into the next node's count
+        state.update(result)
+        state.pop("error", None)
+
+
+def run_user_graph(recorder: Recorder, workflow):
+    """One simulated user driving the compiled LangGraph workflow."""
+    start = time.perf_counter()
+    for update in workflow.stream(initial_state(), stream_mode="updates"):
+        now = time.perf_counter()
+        for stage, result in update.items():
+            recorder.record(stage, now - start, result or {})
+        start = now
+
+
+def run_load(args) -> dict:
+    """Drive the backend with concurrent users and summarize the run."""
+    from backend.ratelimit import configure_rate_limiter
+
+    configure_rate_limiter(args.client_rpm, 0)
+    recorder = Recorder()
+
+    if args.mode == "graph":
+        from backend.graph import create_resume_workflow
+        workflow = create_resume_workflow()
+        run_user = lambda _: run_user_graph(recorder, workflow)
+    else:
+        run_user = lambda _: run_user_nodes(recorder)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        list(pool.map(run_user, range(args.users * args.runs)))
+    elapsed = time.perf_counter() - start
+
+    pipelines = args.users * args.runs
+    return {
+        "mode": args.mode,
+        "users": args.users,
+        "pipelines": pipelines,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_pipelines_per_s": round(pipelines / elapsed, 3),
+        "node_calls": recorder.node_calls,
+        "fallbacks": recorder.fallbacks,
+        "nodes": {
+            node: {
+                "count": len(values),
+                "p50_s": round(percentile(values, 50), 3),
+                "p95_s": round(percentile(values, 95), 3),
+                "p99_s": round(percentile(values, 99), 3),
+            }
+            for node, values in recorder.timings.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10, help="Concurrent simulated users")
+    parser.add_argument("--runs", type=int, default=3, help="Pipelines per user")
+    parser.add_argument("--mode", choices=["nodes", "graph"], default="nodes")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean time to first token (s)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Log-normal latency sigma")
+    parser.add_argument("--tokens-per-second", type=float, default=200)
+    parser.add_argument("--max-concurrency", type=int, default=0, help="Server slots (0 = unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 replies")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429 replies")
+    parser.add_argument("--client-rpm", type=float, default=0, help="Client limiter (0 = off)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", help="Record LLM replies to this cassette")
+    cassette.add_argument("--replay", help="Replay LLM replies from this cassette")
+    parser.add_argument("--replay-latency", default="none",
+                        help="Replay delay: 'none', 'recorded' or seconds")
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        retry_after=0.5,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        tokens_per_second=args.tokens_per_second,
+        max_concurrency=args.max_concurrency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+
+    with server:
+        # Must be set before backend.nodes is imported
+        os.environ["QUBRID_BASE_URL"] = server.base_url
+        os.environ.setdefault("QUBRID_API_KEY", "mock")
+
+        if args.record or args.replay:
+            from backend.cassette import configure_cassette
+            configure_cassette(
+                "record" if args.record else "replay",
+                args.record or args.replay,
+                args.replay_latency
+            )
+
+        report = run_load(args)
+        report["server"] = dict(server.stats)
+        report["extra_requests"] = server.stats["requests"] - report["node_calls"]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['pipelines']} pipelines ({report['mode']}) in {report['elapsed_s']}s "
+          f"→ {report['throughput_pipelines_per_s']} pipelines/s")
+    print(f"node calls: {report['node_calls']}  fallbacks: {report['fallbacks']}  "
+          f"extra requests (retries/hedges): {report['extra_requests']}")
+    print(f"server: {report['server']}")
+    print(f"{'node':<20}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for node, stats in report["nodes"].items():
+        print(f"{node:<20}{stats['count']:>8}{stats['p50_s']:>10}{stats['p95_s']:>10}{stats['p99_s']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""Local OpenAI-compatible stand-in server for benchmarks (no API credits)."""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# Canned replies, picked by what the prompt asks for
+JD_ANALYSIS_REPLY = {
+    "job_title": "Backend Engineer",
+    "company": "Example Corp",
+    "required_skills": ["Python", "SQL", "Docker"],
+    "key_responsibilities": ["Build APIs", "Own services"],
+    "ats_keywords": ["Python", "REST", "AWS"],
+}
+
+CRITIQUE_REPLY = {
+    "overall_score": 7.5,
+    "keyword_score": 7,
+    "experience_score": 8,
+    "ats_score": 8,
+    "formatting_score": 7,
+    "feedback": "Solid resume, missing some keywords.",
+    "improvements_needed": ["Add AWS experience", "Quantify impact"],
+}
+
+SUGGESTIONS_REPLY = {
+    "suggestions": [
+        {"category": "Keywords", "suggestion": "Add Python, AWS, Docker"},
+        {"category": "Experience", "suggestion": "Quantify API latency wins"},
+    ]
+}
+
+RESUME_REPLY = """# Jane Doe
+jane@example.com | (555) 555-0100
+
+## Summary
+Backend engineer with 6 years of Python and AWS experience.
+
+## Experience
+### Senior Engineer, Example Corp (2020 - 2024)
+- Built REST APIs serving 10M requests/day
+- Cut p99 latency by 40% with Redis caching
+
+## Skills
+- Python, SQL, Docker, AWS
+"""
+
+
+SECTION_REPLY = """- Cut p99 latency by 40% with Redis caching on AWS
+- Shipped REST APIs in Python serving 2M requests/day
+"""
+
+
+def pick_reply(prompt: str) -> str:
+    """Return a canned completion matching the prompt type."""
+    # Rewrite prompts embed the JD analysis, so recognize them by instruction
+    if "Rewrite this one section" in prompt:
+        return SECTION_REPLY
+    if "Rewrite this resume" in prompt:
+        return RESUME_REPLY
+    # Later prompts embed earlier replies, so check the most specific first
+    if '"suggestions"' in prompt:
+        return json.dumps(SUGGESTIONS_REPLY)
+    if '"overall_score"' in prompt:
+        return json.dumps(CRITIQUE_REPLY)
+    if '"job_title"' in prompt:
+        return json.dumps(JD_ANALYSIS_REPLY)
+    return RESUME_REPLY
+
+
+def corrupt_json(content: str) -> str:
+    """Introduce a defect models commonly produce into a JSON reply."""
+    defect = random.choice(("trailing_comma", "smart_quotes", "truncated"))
+    if defect == "trailing_comma":
+        return content[:-1] + ",}"
+    if defect == "smart_quotes":
+        return content.replace('"', '\u201c', 1).replace('"', '\u201d', 1)
+    return content[:int(len(content) * random.uniform(0.5, 0.9))]
+
+
+class MockLLMServer:
+    """
+    Threaded OpenAI-compatible chat completions server.
+
+    Args:
+        requests_per_minute: Server-side limit; excess requests get 429 (0 disables)
+        retry_after: Seconds sent in the Retry-After header of a 429
+        latency: Mean time to first token in seconds
+        latency_jitter: Log-normal sigma applied to latency (0 = constant)
+        tokens_per_second: Simulated generation speed (0 = instant)
+        max_concurrency: Requests processed at once; the rest queue (0 = unlimited)
+        error_rate: Fraction of requests answered with a 500
+        rate_limit_rate: Fraction of requests answered with a random 429
+        ramble_tokens: Extra prose tokens appended after JSON replies
+        supports_json_mode: If False, requests with response_format get a 400
+        score_range: (low, high) to draw critique overall_score uniformly
+            from, so drafting strategies produce different scores
+        malformed_rate: Fraction of JSON replies with a trailing comma, smart
+            quotes or truncation (fix-this-JSON follow-ups are always clean)
+        models: Served model name -> speed factor applied to latency and
+            generation time (0.25 = 4x faster); other models get a 404.
+            None serves any model at full latency
+        context_tokens: Prompts estimated above this get a 400 (0 = no limit)
+        port: Port to bind (0 picks a free one)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        retry_after: Optional[float] = 1.0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        tokens_per_second: float = 0.0,
+        max_concurrency: int = 0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        ramble_tokens: int = 0,
+        supports_json_mode: bool = True,
+        score_range: Optional[Tuple[float, float]] = None,
+        malformed_rate: float = 0.0,
+        models: Optional[Dict[str, float]] = None,
+        context_tokens: int = 0,
+        port: int = 0
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.retry_after = retry_after
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.ramble_tokens = ramble_tokens
+        self.supports_json_mode = supports_json_mode
+        self.score_range = score_range
+        self.malformed_rate = malformed_rate
+        self.models = models
+        self.context_tokens = context_tokens
+        self.slots = threading.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.stats: Dict[str, int] = {
+            "requests": 0, "ok": 0, "rate_limited": 0, "errors": 0,
+            "streamed_tokens": 0, "aborted_streams": 0,
+        }
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def _over_limit(self) -> bool:
+        """Fixed one-second window limiter, like many providers use."""
+        if self.requests_per_minute <= 0:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            self.window_count += 1
+            return self.window_count > self.requests_per_minute / 60.0
+
+    def speed_factor(self, model: str) -> float:
+        return self.models.get(model, 1.0) if self.models else 1.0
+
+    def first_token_delay(self, factor: float = 1.0) -> float:
+        """Sampled time to first token."""
+        delay = self.latency * factor
+        if delay and self.latency_jitter:
+            delay *= random.lognormvariate(0, self.latency_jitter)
+        return delay
+
+    def simulate_work(self, completion_tokens: int, factor: float = 1.0):
+        """Sleep for time-to-first-token plus generation time."""
+        delay = self.first_token_delay(factor)
+        if self.tokens_per_second:
+            delay += completion_tokens * factor / self.tokens_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+    def completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a chat completion response for a request body."""
+        prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+        content = pick_reply(prompt)
+        if self.score_range and content == json.dumps(CRITIQUE_REPLY):
+            score = round(random.uniform(*self.score_range), 1)
+            content = json.dumps({**CRITIQUE_REPLY, "overall_score": score})
+        is_fix_request = "This JSON is malformed" in prompt
+        if content.startswith("{") and not is_fix_request and random.random() < self.malformed_rate:
+            content = corrupt_json(content)
+        if self.ramble_tokens and content.startswith("{"):
+            content += "\n\nNote: " + "this score reflects the overall fit " * (self.ramble_tokens // 6)
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Dict[str, Any], headers=None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, response: Dict[str, Any], include_usage: bool = False):
+                """Send a completion as server-sent events, token by token."""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+
+                content = response["choices"][0]["message"]["content"]
+                pieces = [content[i:i + 4] for i in range(0, len(content), 4)]
+                factor = mock.speed_factor(response["model"])
+                token_delay = factor / mock.tokens_per_second if mock.tokens_per_second else 0
+
+                def event(delta: Optional[Dict[str, Any]], finish_reason=None, usage=None) -> bytes:
+                    chunk: Dict[str, Any] = {
+                        "id": response["id"],
+                        "object": "chat.completion.chunk",
+                        "created": response["created"],
+                        "model": response["model"],
+                        "choices": [] if delta is None else [
+                            {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                        ],
+                    }
+                    if usage is not None:
+                        chunk["usage"] = usage
+                    return f"data: {json.dumps(chunk)}\n\n".encode("utf-8")
+
+                try:
+                    time.sleep(mock.first_token_delay(factor))
+                    for piece in pieces:
+                        self.wfile.write(event({"content": piece}))
+                        self.wfile.flush()
+                        mock._count("streamed_tokens")
+                        if token_delay:
+                            time.sleep(token_delay)
+                    self.wfile.write(event({}, "stop"))
+                    if include_usage:
+                        # Like OpenAI: a last chunk with no choices carries the usage
+                        self.wfile.write(event(None, usage=response["usage"]))
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client stopped reading (e.g. structured output stopped early)
+                    mock._count("aborted_streams")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                mock._count("requests")
+
+                if not self.path.endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+
+                if mock.models is not None and body.get("model") not in mock.models:
+                    self._send_json(404, {"error": {
+                        "message": f"The model {body.get('model')} does not exist",
+                        "type": "invalid_request_error",
+                        "code": "model_not_found",
+                    }})
+                    return
+
+                if mock._over_limit():
+                    mock._count("rate_limited")
+                    headers = {}
+                    if mock.retry_after is not None:
+                        headers["Retry-After"] = str(mock.retry_after)
+                    self._send_json(
+                        429,
+                        {"error": {"message": "rate limited", "type": "rate_limit_error"}},
+                        headers
+                    )
+                    return
+
+                if random.random() < mock.rate_limit_rate:
+                    mock._count("rate_limited")
+                    self._send_json(
+                        429,
+                        {"error": {"message": "rate limited", "type": "rate_limit_error"}},
+                        {"Retry-After": str(mock.retry_after or 1)}
+                    )
+                    return
+
+                prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+                if mock.context_tokens and len(prompt) // 4 > mock.context_tokens:
+                    self._send_json(400, {"error": {
+                        "message": f"This model's maximum context length is {mock.context_tokens} tokens",
+                        "type": "invalid_request_error",
+                        "code": "context_length_exceeded",
+                    }})
+                    return
+
+                if body.get("response_format") and not mock.supports_json_mode:
+                    self._send_json(400, {"error": {
+                        "message": "response_format is not supported",
+                        "type": "invalid_request_error",
+                    }})
+                    return
+
+                if mock.slots:
+                    mock.slots.acquire()
+                try:
+                    response = mock.completion(body)
+                    if body.get("stream"):
+                        mock._count("ok")
+                        self._stream(response, (body.get("stream_options") or {}).get("include_usage", False))
+                        return
+                    mock.simulate_work(
+                        response["usage"]["completion_tokens"],
+                        mock.speed_factor(response["model"])
+                    )
+                finally:
+                    if mock.slots:
+                        mock.slots.release()
+
+                if random.random() < mock.error_rate:
+                    mock._count("errors")
+                    self._send_json(500, {"error": {"message": "internal error", "type": "server_error"}})
+                    return
+
+                mock._count("ok")
+                self._send_json(200, response)
+
+        return Handler
+
+    def start(self) -> "MockLLMServer":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
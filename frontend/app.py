@@ -2,6 +2,9 @@
 
 import sys
 import os
+import json
+import time
+import uuid
 from pathlib import Path
 
 # Add project root to Python path
@@ -12,15 +15,23 @@ import streamlit as st
 from datetime import datetime
 
 from backend.state import ResumeState
-from backend.utils import parse_pdf, parse_text_file, save_markdown, convert_markdown_to_pdf, validate_file_type
-from backend.nodes import analyze_job_description, critique_resume, draft_suggestions_only, draft_tailored_resume, finalize_resume
-from backend.database import init_database, save_generation, get_all_generations
+from backend.utils import inspect_pdf, parse_pdf, parse_text_file, validate_file_type
+from backend.pipeline import build_initial_state
+from backend.jobs import submit_job, get_job_status
+from backend.exporters import render_to_bytes
+from backend.database import init_database, get_all_generations
+from backend.keywords import keyword_coverage
+from backend.metrics import init_metrics, mark_session_active
+from backend.warmup import warm_up_on_start
+from backend.sessions import get_session_store, valid_token
 from frontend.styles import get_theme_css
 from frontend.components import (
     render_header,
     render_theme_toggle,
     render_file_uploader,
     render_critique_feedback,
+    render_keyword_coverage,
+    render_partial_results,
     render_resume_preview,
     render_download_buttons,
     render_history_sidebar,
@@ -33,12 +44,9 @@ INPUTS_DIR = DATA_DIR / "inputs"
 OUTPUTS_DIR = DATA_DIR / "outputs"
 
 
-# Load logo with fallback
-try:
-    from PIL import Image
-    logo = Image.open("frontend/assets/qubrid_logo.png")
-except:
-    logo = "🤖"  # Fallback emoji if logo not found
+# Logo path (Streamlit loads it, so PIL isn't imported here), with fallback
+LOGO_PATH = Path(__file__).parent / "assets" / "qubrid_logo.png"
+logo = LOGO_PATH if LOGO_PATH.exists() else "🤖"
 
 st.set_page_config(
     page_title="Resume-Optimizer-AI",
@@ -47,9 +55,68 @@ st.set_page_config(
 )
 
 
+# Session state shared through the session store, so any replica can continue
+PERSISTED_KEYS = (
+    "final_state",
+    "suggestions",
+    "current_state",
+    "evaluation_done",
+    "initial_critique",
+    "current_generation_id",
+    "active_job",
+)
+
+
+def restore_session():
+    """Adopt the URL's session token and load its saved state, once per browser session."""
+    token = st.query_params.get("session")
+    if not valid_token(token):
+        token = uuid.uuid4().hex
+        # Keep the token in the URL so a reload on any replica finds the session
+        st.query_params["session"] = token
+    st.session_state.session_id = token
+    
+    try:
+        saved = get_session_store().get(token)
+    except Exception as e:
+        print(f"Could not load session {token}: {str(e)}")
+        saved = None
+    
+    for key in PERSISTED_KEYS:
+        if saved and key in saved:
+            st.session_state[key] = saved[key]
+    st.session_state.persisted_snapshot = json.dumps(saved, sort_keys=True, default=str) if saved else None
+
+
+def persist_session():
+    """Save the session's state to the store if it changed since the last save."""
+    data = {key: st.session_state.get(key) for key in PERSISTED_KEYS}
+    snapshot = json.dumps(data, sort_keys=True, default=str)
+    if snapshot == st.session_state.get("persisted_snapshot"):
+        return
+    
+    try:
+        get_session_store().put(st.session_state.session_id, data)
+        st.session_state.persisted_snapshot = snapshot
+    except Exception as e:
+        print(f"Could not save session {st.session_state.session_id}: {str(e)}")
+
+
+def rerun():
+    """Save the session, then rerun the script."""
+    persist_session()
+    st.rerun()
+
+
 def initialize_session_state():
     """Initialize session state variables."""
     init_database()
+    init_metrics()
+    warm_up_on_start()
+    
+    if "session_id" not in st.session_state:
+        restore_session()
+    mark_session_active(st.session_state.session_id)
     
     if "workflow_running" not in st.session_state:
         st.session_state.workflow_running = False
@@ -65,6 +132,9 @@ def initialize_session_state():
         st.session_state.initial_critique = None
     if "current_generation_id" not in st.session_state:
         st.session_state.current_generation_id = None
+    if "active_job" not in st.session_state:
+        # Reattach to a job started before the page was reloaded
+        st.session_state.active_job = st.query_params.get("job")
 
 
 def parse_job_description_input(text_input, file_input) -> tuple[str, str]:
@@ -88,8 +158,8 @@ def parse_job_description_input(text_input, file_input) -> tuple[str, str]:
     raise ValueError("Please provide a job description (paste text or upload file)")
 
 
-def parse_resume_input(file_input) -> tuple[str, str]:
-    """Parse resume from file input."""
+def parse_resume_input(file_input) -> tuple[str, str, dict]:
+    """Parse resume from file input, with the PDF layout for the ATS linter."""
     if file_input is None:
         raise ValueError("Please upload a resume file")
 
@@ -101,125 +171,98 @@ def parse_resume_input(file_input) -> tuple[str, str]:
         f.write(file_input.getbuffer())
 
     try:
+        layout = None
         if file_input.name.lower().endswith('.pdf'):
             content = parse_pdf(temp_path)
+            layout = inspect_pdf(temp_path)
         else:
             content = parse_text_file(temp_path)
-        return content, file_input.name
+        return content, file_input.name, layout
     finally:
         if temp_path.exists():
             temp_path.unlink()
 
 
-def evaluate_resume(resume_content: str, resume_filename: str, jd_content: str, jd_source: str):
+# Status messages shown while each pipeline stage runs
+STAGE_MESSAGES = {
+    "queued": "⏳ Waiting for a free worker...",
+    "analyze_jd": "📊 Analyzing job requirements...",
+    "critique_original": "🔍 Evaluating your resume against requirements...",
+    "suggest": "💡 Generating improvement suggestions...",
+    "draft": "✨ Crafting your optimized resume...",
+    "critique_draft": "🎯 Polishing and perfecting...",
+    "finalize": "✅ Finalizing your professional resume...",
+    "save": "💾 Saving your resume...",
+}
+
+# Seconds between job status polls
+JOB_POLL_INTERVAL = 1.0
+
+
+def start_job(kind: str, state: ResumeState):
+    """Submit a pipeline job and remember it for this session."""
+    job_id = submit_job(kind, state)
+    st.session_state.active_job = job_id
+    # Keep the job in the URL so a reloaded tab can reattach to it
+    st.query_params["job"] = job_id
+    rerun()
+
+
+def evaluate_resume(resume_content: str, resume_filename: str, jd_content: str, jd_source: str,
+                    resume_layout: dict = None):
     """STEP 1: Evaluate resume against JD and show metrics + suggestions."""
-    
-    initial_state: ResumeState = {
-        "original_resume": resume_content,
-        "job_description": jd_content,
-        "resume_filename": resume_filename,
-        "jd_source": jd_source,
-        "draft_resume": resume_content,
-        "iteration": 0,
-        "metadata": {
-            "start_time": datetime.now().isoformat()
-        }
-    }
-    
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Step 1: Analyze JD
-    status_text.info("📊 Analyzing job requirements...")
-    progress_bar.progress(25)
-    
-    jd_result = analyze_job_description(initial_state)
-    initial_state.update(jd_result)
-    
-    # Step 2: Evaluate current resume
-    status_text.info("🔍 Evaluating your resume against requirements...")
-    progress_bar.progress(50)
-    
-    critique_result = critique_resume(initial_state)
-    initial_state.update(critique_result)
-    
-    # Step 3: Generate suggestions
-    status_text.info("💡 Generating improvement suggestions...")
-    progress_bar.progress(75)
-    
-    suggestions_result = draft_suggestions_only(initial_state)
-    initial_state.update(suggestions_result)
-    
-    progress_bar.progress(100)
-    status_text.empty()
-    progress_bar.empty()
-    
-    # Store results
-    st.session_state.current_state = initial_state
-    st.session_state.initial_critique = initial_state.get("critique")
-    st.session_state.suggestions = initial_state.get("suggestions")
-    st.session_state.evaluation_done = True
-    st.rerun()
+    initial_state = build_initial_state(resume_content, resume_filename, jd_content, jd_source, resume_layout)
+    start_job("evaluate", initial_state)
 
 
 def create_final_resume():
     """STEP 2: Create tailored resume with progress tracking."""
+    start_job("generate", st.session_state.current_state)
+
+
+def attach_job_result(job: dict):
+    """Move a finished job's result into the session."""
+    result = job["result"]
     
-    current_state = st.session_state.current_state
-    
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Step 1: Drafting
-    status_text.info("✨ Crafting your optimized resume...")
-    progress_bar.progress(33)
-    
-    draft_result = draft_tailored_resume(current_state)
-    current_state.update(draft_result)
-    
-    # Step 2: Final evaluation
-    status_text.info("🎯 Polishing and perfecting...")
-    progress_bar.progress(66)
-    
-    critique_result = critique_resume(current_state)
-    current_state.update(critique_result)
-    
-    # Step 3: Finalizing
-    status_text.info("✅ Finalizing your professional resume...")
-    progress_bar.progress(90)
-    
-    finalize_result = finalize_resume(current_state)
-    current_state.update(finalize_result)
-    
-    # Save files
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename_base = f"resume_{timestamp}"
-    
-    markdown_path = save_markdown(current_state["final_resume"], filename_base)
-    
-    # Try to generate PDF (optional - will return None if fails)
-    pdf_path = convert_markdown_to_pdf(current_state["final_resume"], filename_base)
-    
-    if pdf_path:
-        current_state["output_pdf_path"] = str(pdf_path)
+    if job["kind"] == "evaluate":
+        st.session_state.current_state = result
+        st.session_state.initial_critique = result.get("critique")
+        st.session_state.suggestions = result.get("suggestions")
+        st.session_state.evaluation_done = True
     else:
-        current_state["output_pdf_path"] = None
-        st.info("ℹ️ PDF generation unavailable - download Markdown instead")
+        if not result.get("output_pdf_path"):
+            st.info("ℹ️ PDF generation unavailable - download Markdown instead")
+        st.session_state.current_generation_id = result.get("generation_id")
+        st.session_state.final_state = result
+
+
+def render_active_job():
+    """Show progress for the session's running job and attach its result when done."""
+    job_id = st.session_state.active_job
+    if not job_id:
+        return
     
-    # Save to database
-    current_state["initial_critique"] = st.session_state.initial_critique
-    generation_id = save_generation(current_state, {
-        "markdown": str(markdown_path),
-        "pdf": str(pdf_path) if pdf_path else ""
-    })
-    st.session_state.current_generation_id = generation_id
+    job = get_job_status(job_id)
     
-    progress_bar.progress(100)
-    status_text.empty()
-    progress_bar.empty()
+    if job is None or job["status"] in ("done", "failed"):
+        st.session_state.active_job = None
+        st.query_params.pop("job", None)
+        
+        if job and job["status"] == "done":
+            attach_job_result(job)
+            rerun()
+        elif job:
+            render_error_message(job["error"])
+        return
     
-    st.session_state.final_state = current_state
-    st.rerun()
+    st.progress(job["progress"])
+    st.info(STAGE_MESSAGES.get(job["stage"] or job["status"], "⏳ Working..."))
+    # While running, the job's result holds what the finished nodes produced
+    render_partial_results(job["result"])
+    
+    # Poll by rerunning instead of blocking the script thread on the pipeline
+    time.sleep(JOB_POLL_INTERVAL)
+    rerun()
 
 
 def main():
@@ -272,7 +315,9 @@ def main():
     history = get_all_generations()
     render_history_sidebar(history)
 
-    # Main Content
+    # Main Content (returns only if no job is running)
+    render_active_job()
+    
     if st.session_state.final_state:
         # FINAL: Show tailored resume
         final_state = st.session_state.final_state
@@ -288,6 +333,12 @@ def main():
                     text = sug.get("suggestion", "")
                     st.markdown(f"**{i}. {category}:** {text}")
         
+        jd_analysis = final_state.get("jd_analysis") or {}
+        render_keyword_coverage(
+            keyword_coverage(jd_analysis, final_state["final_resume"]),
+            before=keyword_coverage(jd_analysis, final_state.get("original_resume", ""))
+        )
+        
         st.markdown("---")
         
         render_resume_preview(final_state["final_resume"])
@@ -296,7 +347,7 @@ def main():
         # Download buttons on main page
         st.markdown("### 📥 Download Your Resume")
         
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -326,6 +377,20 @@ def main():
             else:
                 st.info("ℹ️ PDF unavailable - download Markdown and convert online")
         
+        with col3:
+            try:
+                docx_bytes = render_to_bytes(final_state["final_resume"], "docx")
+                st.download_button(
+                    label="📃 Download DOCX",
+                    data=docx_bytes,
+                    file_name=f"resume_{timestamp}.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    use_container_width=True,
+                    type="primary"
+                )
+            except Exception:
+                st.info("ℹ️ DOCX unavailable - download Markdown instead")
+        
         st.markdown("---")
         
         # Reset button
@@ -338,7 +403,8 @@ def main():
                 st.session_state.evaluation_done = False
                 st.session_state.initial_critique = None
                 st.session_state.current_generation_id = None
-                st.rerun()
+                st.session_state.active_job = None
+                rerun()
     
     elif st.session_state.evaluation_done:
         # STEP 2: Show evaluation + suggestions
@@ -348,6 +414,11 @@ def main():
         if st.session_state.initial_critique:
             render_critique_feedback(st.session_state.initial_critique)
         
+        current_state = st.session_state.current_state or {}
+        render_keyword_coverage(
+            keyword_coverage(current_state.get("jd_analysis") or {}, current_state.get("original_resume", ""))
+        )
+        
         st.markdown("---")
         
         if st.session_state.suggestions:
@@ -406,16 +477,18 @@ def main():
         
         if evaluate_button:
             try:
-                resume_content, resume_filename = parse_resume_input(resume_file)
+                resume_content, resume_filename, resume_layout = parse_resume_input(resume_file)
                 jd_content, jd_source = parse_job_description_input(jd_text, jd_file)
                 
-                evaluate_resume(resume_content, resume_filename, jd_content, jd_source)
+                evaluate_resume(resume_content, resume_filename, jd_content, jd_source, resume_layout)
 
             except ValueError as e:
                 render_error_message(str(e))
             except Exception as e:
                 render_error_message(f"Error: {str(e)}")
 
+    persist_session()
+
     # Footer
     st.markdown("---")
     st.markdown(
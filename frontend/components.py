@@ -4,6 +4,7 @@ import streamlit as st
 from datetime import datetime
 import os
 import json
+import html
 
 
 def render_header(theme: str = "dark"):
@@ -97,6 +98,15 @@ def render_critique_feedback(critique: dict):
         with st.expander("📝 Detailed Feedback", expanded=True):
             st.write(critique["feedback"])
 
+    # Local ATS/format rule results
+    if critique.get("lint"):
+        with st.expander("🧹 ATS & Formatting Checks"):
+            for rule in critique["lint"]["rules"]:
+                icon = "✅" if rule["score"] >= 1 else "⚠️"
+                st.markdown(f"{icon} **{rule['id'].title()}** ({rule['score'] * 10:.0f}/10)")
+                for issue in rule["issues"]:
+                    st.markdown(f"  - {issue}")
+
     # Improvements
     if critique.get("improvements_needed"):
         with st.expander("🎯 AI Suggestions for Further Improvement"):
@@ -111,6 +121,69 @@ def render_critique_feedback(critique: dict):
         st.warning("⚠️ Resume needs improvement - generating new iteration...")
 
 
+def render_keyword_coverage(coverage: dict, before: dict = None):
+    """Render which job keywords the resume covers, optionally against an earlier version."""
+    if not coverage or not (coverage["matched"] or coverage["missing"]):
+        return
+
+    st.markdown("### 🔑 Keyword Coverage")
+
+    percent = coverage["coverage"] * 100
+    if before:
+        change = percent - before["coverage"] * 100
+        st.metric("Job keywords found", f"{percent:.0f}%", f"{change:+.0f}% vs original")
+    else:
+        st.metric("Job keywords found", f"{percent:.0f}%")
+
+    def chips(keywords: list, color: str) -> str:
+        return " ".join(
+            f'<span style="display: inline-block; padding: 2px 10px; margin: 2px; border-radius: 12px; '
+            f'background-color: {color}22; border: 1px solid {color}; font-size: 0.85em;">{html.escape(k)}</span>'
+            for k in keywords
+        )
+
+    if coverage["missing"]:
+        st.markdown(f"**Missing:** {chips(coverage['missing'], '#ef4444')}", unsafe_allow_html=True)
+    if coverage["matched"]:
+        st.markdown(f"**Found:** {chips(coverage['matched'], '#10b981')}", unsafe_allow_html=True)
+
+
+def render_partial_results(partial: dict):
+    """Render what a running job has produced so far."""
+    if not partial:
+        return
+
+    jd_analysis = partial.get("jd_analysis")
+    if jd_analysis:
+        role = " at ".join(str(v) for v in (jd_analysis.get("job_title"), jd_analysis.get("company")) if v)
+        if role:
+            st.markdown(f"**🎯 Role:** {role}")
+        skills = jd_analysis.get("required_skills") or []
+        if skills:
+            st.caption("Required skills: " + ", ".join(str(skill) for skill in skills))
+
+    critique = partial.get("critique")
+    if critique:
+        cols = st.columns(3)
+        for col, (label, key) in zip(cols, (
+            ("Overall", "overall_score"),
+            ("ATS", "ats_score"),
+            ("Keywords", "keyword_score"),
+        )):
+            if critique.get(key) is not None:
+                col.metric(label, f"{critique[key]}/10")
+
+    if partial.get("suggestions"):
+        st.caption(f"💡 {len(partial['suggestions'])} suggestions ready")
+
+    live_text = partial.get("live_text")
+    if live_text:
+        # Show the call that has written the most so far
+        text = max(live_text.values(), key=len)
+        with st.expander("✍️ Writing...", expanded=True):
+            st.markdown(text)
+
+
 def render_resume_preview(markdown_content: str):
     """Render resume preview."""
     st.markdown("---")
@@ -177,12 +250,10 @@ def render_history_sidebar(history: list):
             col1, col2 = st.columns(2)
             
             with col1:
-                # Markdown download
-                md_path = entry.get("markdown_path")
-                if md_path and os.path.exists(md_path):
+                # Markdown download (from stored final_resume, so evicted files don't matter)
+                md_content = entry.get("final_resume")
+                if md_content:
                     try:
-                        with open(md_path, "r", encoding="utf-8") as f:
-                            md_content = f.read()
                         st.download_button(
                             "📝 MD",
                             data=md_content,
@@ -220,12 +291,16 @@ def render_history_sidebar(history: list):
 def restore_generation(generation_id: int):
     """Restore a previous generation to current state."""
     from backend.database import get_generation_by_id
+    from backend.storage import ensure_artifact
     
     gen = get_generation_by_id(generation_id)
     if not gen:
         st.error("Generation not found")
         return
     
+    # Rebuild the PDF if storage maintenance evicted it
+    pdf_path = ensure_artifact(generation_id, "pdf")
+    
     # Restore to session state
     st.session_state.final_state = {
         "original_resume": gen["original_resume"],
@@ -234,7 +309,7 @@ def restore_generation(generation_id: int):
         "final_resume": gen["final_resume"],
         "critique": json.loads(gen["final_critique"]),
         "iteration": gen["iterations"],
-        "output_pdf_path": gen["pdf_path"]
+        "output_pdf_path": str(pdf_path) if pdf_path else None
     }
     
     st.session_state.initial_critique = json.loads(gen["initial_critique"])
@@ -0,0 +1,79 @@
+"""Deterministic ATS/format lint rules and how they merge into a critique."""
+
+import pytest
+
+from backend import ats_lint
+from backend.ats_lint import apply_lint, lint_resume
+
+BULLETS = "\n".join(f"- Shipped feature {i} that cut page load time by {i + 10}% for 2M users" for i in range(30))
+RESUME = f"""# Jane Doe
+jane@example.com | +1 555 123 4567 | linkedin.com/in/janedoe
+
+## Experience
+### Backend Engineer, Acme (Jan 2020 - Present)
+{BULLETS}
+
+## Education
+BSc Computer Science, State University (2016 - 2020)
+
+## Skills
+Python, PostgreSQL, Kubernetes, AWS
+"""
+
+
+def rule(lint, rule_id):
+    return next(r for r in lint["rules"] if r["id"] == rule_id)
+
+
+def test_clean_resume_scores_full_marks():
+    lint = lint_resume(RESUME)
+
+    assert lint["issues"] == []
+    assert lint["ats_score"] == 10.0
+    assert lint["formatting_score"] == 10.0
+
+
+def test_each_problem_costs_its_rule():
+    messy = RESUME.replace("jane@example.com | ", "").replace("Jan 2020 - Present", "01/2020 - Present")
+    messy = messy.replace("## Education", "| School | Year |\n|---|---|\n| State | 2020 |\n\n## Schooling")
+
+    lint = lint_resume(messy)
+
+    assert rule(lint, "contact")["score"] == pytest.approx(0.5)
+    assert rule(lint, "layout")["score"] == pytest.approx(0.5)
+    assert rule(lint, "headings")["issues"] == ["Add standard section headings: Education"]
+    assert lint["ats_score"] < 10.0
+
+
+def test_mixed_date_styles_flagged():
+    mixed = RESUME.replace("(2016 - 2020)", "(09/2016 - 06/2020)")
+
+    assert rule(lint_resume(mixed), "dates")["issues"] == ["Use one date format throughout (found MM/YYYY, Mon YYYY)"]
+
+
+def test_plain_text_headings_from_a_pdf_count():
+    plain = "\n".join(
+        line.lstrip("#").strip() if line.startswith("#") and not line.startswith("###") else line
+        for line in RESUME.split("\n")
+    ).upper()
+
+    assert rule(lint_resume(plain, {"pages": 1, "images": 0, "tables": 0}), "headings")["score"] == 1.0
+
+
+def test_page_count_from_pdf_layout_caps_length_score():
+    assert rule(lint_resume(RESUME, {"pages": 3, "images": 0, "tables": 0}), "length")["score"] == 0.4
+
+
+def test_apply_lint_blends_ats_and_replaces_formatting(monkeypatch):
+    monkeypatch.setattr(ats_lint, "ATS_LINT_WEIGHT", 0.5)
+    lint = {"ats_score": 8.0, "formatting_score": 6.0, "rules": [], "issues": ["Use one bullet style"]}
+
+    critique = apply_lint(
+        {"ats_score": 4, "keyword_score": 7, "experience_score": 9, "improvements_needed": ["Add metrics"]},
+        lint
+    )
+
+    assert critique["ats_score"] == 6.0
+    assert critique["formatting_score"] == 6.0
+    assert critique["overall_score"] == 7.0
+    assert critique["improvements_needed"] == ["Add metrics", "Formatting: Use one bullet style"]
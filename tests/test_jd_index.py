@@ -0,0 +1,39 @@
+"""BM25 ranking of stored job descriptions against a resume."""
+
+import pytest
+
+from backend.jd_index import JDIndex, build_index
+
+POSTINGS = [
+    {"id": 1, "job_title": "Backend Engineer", "jd_analysis": {
+        "job_title": "Backend Engineer", "required_skills": ["Python", "PostgreSQL"], "ats_keywords": ["REST APIs"]}},
+    {"id": 2, "job_title": "Data Scientist", "jd_analysis": {
+        "job_title": "Data Scientist", "required_skills": ["Python", "machine learning"], "ats_keywords": ["pandas"]}},
+    {"id": 3, "job_title": "Frontend Engineer", "jd_analysis": {
+        "job_title": "Frontend Engineer", "required_skills": ["React", "TypeScript"], "ats_keywords": ["CSS"]}},
+]
+RESUME = "Python developer building REST APIs on PostgreSQL, some pandas and machine learning."
+
+
+def test_best_match_first_with_matched_terms():
+    results = build_index(POSTINGS).search(RESUME, k=3)
+
+    assert [result["generation_id"] for result in results] == [1, 2]
+    assert "rest apis" in results[0]["matched_terms"]
+    assert results[0]["job_title"] == "Backend Engineer"
+
+
+def test_removed_posting_leaves_scores_as_if_never_indexed():
+    index = build_index(POSTINGS)
+    index.remove(2)
+
+    fresh = build_index([posting for posting in POSTINGS if posting["id"] != 2])
+
+    results, expected = index.search(RESUME), fresh.search(RESUME)
+    assert len(index) == 2
+    assert [r["generation_id"] for r in results] == [r["generation_id"] for r in expected]
+    assert [r["score"] for r in results] == pytest.approx([r["score"] for r in expected])
+
+
+def test_empty_index_returns_nothing():
+    assert JDIndex().search(RESUME) == []
@@ -0,0 +1,36 @@
+"""Keyword coverage: synonyms, short aliases and stemming."""
+
+from backend.keywords import jd_keywords, keyword_coverage
+
+JD = {"ats_keywords": ["Golang", "Node.js", "Machine Learning", "CI/CD"], "required_skills": ["Kubernetes", "golang"]}
+
+
+def test_keywords_deduplicated_in_jd_order():
+    assert jd_keywords(JD) == ["Golang", "Node.js", "Machine Learning", "CI/CD", "Kubernetes"]
+
+
+def test_synonyms_and_aliases_match():
+    coverage = keyword_coverage(JD, "Built Go services on Node with ML models, CI/CD and k8s.")
+
+    assert coverage["missing"] == []
+    assert coverage["coverage"] == 1.0
+    start, end = coverage["hits"]["Kubernetes"][0]
+    assert "Built Go services on Node with ML models, CI/CD and k8s."[start:end] == "k8s"
+
+
+def test_short_aliases_need_their_usual_spelling():
+    coverage = keyword_coverage(JD, "Happy to go the extra mile; I pour 5 ml of coffee into a node.")
+
+    assert coverage["matched"] == []
+
+
+def test_keyword_matches_its_own_spelling_in_any_case():
+    coverage = keyword_coverage({"ats_keywords": ["AI"]}, "Shipped ai features")
+
+    assert coverage["matched"] == ["AI"]
+
+
+def test_inflected_forms_match():
+    coverage = keyword_coverage({"ats_keywords": ["managing APIs"]}, "Managed API gateways")
+
+    assert coverage["matched"] == ["managing APIs"]
@@ -0,0 +1,67 @@
+"""MinHash signatures and LSH lookup of near-duplicate job descriptions."""
+
+import random
+
+from backend.minhash import MinHashLSH, is_reusable_analysis, minhash_signature, similarity
+
+WORDS = (
+    "python java react kubernetes aws docker sql postgres spark airflow terraform design build "
+    "scale ship maintain own lead mentor review test deploy monitor api service platform data "
+    "pipeline customer product team remote hybrid senior staff backend frontend cloud security "
+    "latency reliability growth analytics dashboard model training inference batch stream"
+).split()
+
+
+def job_description(rng: random.Random, words: int = 250) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def edited(text: str, rng: random.Random, edits: int) -> str:
+    """The same posting with a few words changed (a repost with a new date or location)."""
+    words = text.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def test_similarity_tracks_overlap():
+    rng = random.Random(1)
+    text = job_description(rng)
+
+    assert similarity(minhash_signature(text), minhash_signature(text)) == 1.0
+    assert similarity(minhash_signature(text), minhash_signature(edited(text, rng, 5))) > 0.85
+    assert similarity(minhash_signature(text), minhash_signature(job_description(rng))) < 0.3
+
+
+def test_lsh_finds_near_duplicates_among_unrelated_postings():
+    rng = random.Random(7)
+    postings = [job_description(rng) for _ in range(200)]
+    lsh = MinHashLSH()
+    for key, text in enumerate(postings):
+        lsh.add(key, minhash_signature(text))
+
+    found = 0
+    for key in range(0, 200, 4):
+        match = lsh.query(minhash_signature(edited(postings[key], rng, 3)), threshold=0.8)
+        found += match is not None and match[0] == key
+
+    assert found / 50 >= 0.95
+    assert lsh.query(minhash_signature(job_description(rng)), threshold=0.8) is None
+
+
+def test_removed_postings_are_not_returned():
+    rng = random.Random(3)
+    text = job_description(rng)
+    lsh = MinHashLSH()
+    lsh.add(1, minhash_signature(text))
+
+    lsh.remove(1)
+
+    assert len(lsh) == 0
+    assert lsh.query(minhash_signature(text), threshold=0.8) is None
+
+
+def test_only_analyses_that_found_something_are_reusable():
+    assert is_reusable_analysis({"required_skills": ["Python"], "ats_keywords": ["APIs"]})
+    assert not is_reusable_analysis({"required_skills": ["Python"], "ats_keywords": []})
+    assert not is_reusable_analysis({})
@@ -0,0 +1,39 @@
+"""Pipeline control flow with the LLM stubbed out."""
+
+import pytest
+
+from backend import nodes
+from backend.pipeline import build_initial_state, run_drafting
+
+RESUME = "# Jane Doe\njane@example.com\n\n## Experience\n- Built APIs\n"
+
+
+@pytest.fixture
+def evaluated_state():
+    state = build_initial_state(RESUME, "resume.md", "Python engineer", "test")
+    state.update({
+        "jd_analysis": {"required_skills": ["Python"], "ats_keywords": ["APIs"]},
+        "critique": {"overall_score": 5, "approved": False, "improvements_needed": ["Add metrics"]},
+        "suggestions": [{"category": "Experience", "suggestion": "Add metrics"}],
+    })
+    return state
+
+
+def test_iterative_drafting_stops_when_the_llm_keeps_failing(monkeypatch, evaluated_state):
+    calls = []
+
+    def failing_call(messages, **kwargs):
+        calls.append(kwargs.get("node"))
+        if len(calls) > 20:
+            pytest.fail("drafting kept retrying a failing LLM")  # not caught by the nodes
+        raise Exception("API call failed: endpoint down")
+
+    monkeypatch.setattr(nodes, "call_llm_with_retry", failing_call)
+
+    state = run_drafting(evaluated_state, mode="iterative")
+
+    assert state["error"]
+    assert state["draft_resume"] == RESUME
+    # One failed draft, then finalize; no critique of a draft that wasn't written
+    assert calls.count("draft") == 1
+    assert "critique" not in calls
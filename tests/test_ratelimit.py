@@ -0,0 +1,132 @@
+"""Rate limiting, Retry-After handling and retry classification against the mock LLM server."""
+
+import time
+
+import openai
+import pytest
+
+from backend import ratelimit
+from backend.ratelimit import RateLimiter, TokenBucket, classify_error, parse_retry_after
+from benchmarks.mock_llm_server import MockLLMServer
+
+MESSAGES = [{"role": "user", "content": "Rewrite this resume"}]
+
+
+def client_for(server: MockLLMServer) -> openai.OpenAI:
+    return openai.OpenAI(api_key="mock", base_url=server.base_url, max_retries=0, timeout=5)
+
+
+def api_error(server: MockLLMServer, **kwargs) -> Exception:
+    """Error the client raises for one request to the server."""
+    with pytest.raises(openai.APIError) as excinfo:
+        client_for(server).chat.completions.create(
+            model=kwargs.pop("model", "mock"), messages=MESSAGES, **kwargs
+        )
+    return excinfo.value
+
+
+def test_token_bucket_paces_beyond_burst():
+    bucket = TokenBucket(per_minute=600, capacity=2)  # 10/s, two at once
+
+    waits = [bucket.reserve(1) for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+
+def test_default_burst_allows_parallel_fan_out():
+    bucket = TokenBucket(per_minute=60)
+
+    assert bucket.capacity == 60 / 60 * ratelimit.BURST_SECONDS
+    assert all(bucket.reserve(1) == 0.0 for _ in range(int(bucket.capacity)))
+
+
+def test_limiter_pause_holds_every_caller(monkeypatch):
+    monkeypatch.setattr(ratelimit, "RETRY_AFTER_JITTER", 0.0)
+    limiter = RateLimiter(0, 0)
+    limiter.pause(0.2)
+
+    start = time.monotonic()
+    waited = limiter.acquire(10)
+
+    assert waited >= 0.2
+    assert time.monotonic() - start >= 0.2
+
+
+def test_token_usage_correction_refunds_overestimates():
+    limiter = RateLimiter(0, 600)
+    limiter.acquire(10)
+    before = limiter.tokens.tokens
+
+    limiter.record_usage(estimated_tokens=10, actual_tokens=4)
+
+    assert limiter.tokens.tokens == pytest.approx(before + 6, abs=0.5)
+
+
+def test_429_retry_after_is_retryable_and_parsed():
+    with MockLLMServer(rate_limit_rate=1.0, retry_after=0.3) as server:
+        error = api_error(server)
+
+    assert isinstance(error, openai.RateLimitError)
+    assert parse_retry_after(error) == pytest.approx(0.3)
+    assert classify_error(error) == (True, pytest.approx(0.3))
+
+
+def test_429_without_retry_after_falls_back_to_backoff():
+    with MockLLMServer(requests_per_minute=60, retry_after=None) as server:
+        client_for(server).chat.completions.create(model="mock", messages=MESSAGES)
+        error = api_error(server)
+
+    assert classify_error(error) == (True, None)
+
+
+def test_server_errors_are_retryable():
+    with MockLLMServer(error_rate=1.0) as server:
+        error = api_error(server)
+
+    assert classify_error(error) == (True, None)
+
+
+def test_connection_errors_are_retryable():
+    server = MockLLMServer()
+    base_url = server.base_url
+    server.server.server_close()
+
+    client = openai.OpenAI(api_key="mock", base_url=base_url, max_retries=0, timeout=2)
+    with pytest.raises(openai.APIConnectionError) as excinfo:
+        client.chat.completions.create(model="mock", messages=MESSAGES)
+
+    assert classify_error(excinfo.value) == (True, None)
+
+
+def test_bad_requests_and_missing_models_are_not_retried():
+    with MockLLMServer(supports_json_mode=False, models={"served": 1.0}) as server:
+        bad_request = api_error(server, model="served", response_format={"type": "json_object"})
+        missing_model = api_error(server, model="unknown")
+
+    assert classify_error(bad_request) == (False, None)
+    assert classify_error(missing_model) == (False, None)
+
+
+def test_call_route_waits_out_retry_after(monkeypatch):
+    from backend import nodes
+    from backend.routing import ModelRoute
+
+    monkeypatch.setenv("QUBRID_API_KEY", "mock")
+    monkeypatch.setattr(ratelimit, "RATE_LIMITER", RateLimiter(0, 0))
+    monkeypatch.setattr(ratelimit, "RETRY_AFTER_JITTER", 0.0)
+
+    # One request per one-second window, so the second call is rate limited once
+    with MockLLMServer(requests_per_minute=60, retry_after=1.0) as server:
+        route = ModelRoute(model="mock", base_url=server.base_url)
+        nodes._call_route(route, MESSAGES, 0.7, 3, "default", None)
+
+        start = time.monotonic()
+        content = nodes._call_route(route, MESSAGES, 0.7, 3, "default", None)
+        elapsed = time.monotonic() - start
+
+        assert content.startswith("# Jane Doe")
+        assert server.stats["rate_limited"] == 1
+        assert server.stats["ok"] == 2
+    assert elapsed >= 1.0
@@ -0,0 +1,41 @@
+"""Section splitting and critique feedback routing."""
+
+from backend.ats_lint import apply_lint, lint_resume
+from backend.sections import assign_feedback, join_sections, split_sections
+
+RESUME = "# Jane Doe\njane@example.com\n\n## Summary\nBackend engineer.\n\n## Experience\n- Built APIs\n\n## Skills\nPython, SQL\n"
+
+
+def test_lint_issues_are_not_routed_to_the_sections_they_name():
+    lint = lint_resume("# Jane Doe\n\nNo sections at all.")
+    critique = apply_lint({"overall_score": 6, "improvements_needed": ["Quantify experience bullets"]}, lint)
+
+    feedback = assign_feedback(split_sections(RESUME), critique["improvements_needed"])
+
+    assert any("Experience, Education, Skills" in item for item in feedback[""])
+    assert feedback["experience"] == ["Quantify experience bullets"]
+    assert "skills" not in feedback and "summary" not in feedback
+
+
+def test_split_sections_keys_and_round_trip():
+    resume = RESUME + "\n## Skills\nDocker\n"
+    sections = split_sections(resume)
+
+    assert [section.key for section in sections] == ["header", "summary", "experience", "skills", "skills_2"]
+    assert sections[-1].base_key == "skills"
+    assert sections[0].heading == "" and sections[0].body.startswith("# Jane Doe")
+    assert join_sections(sections) == resume
+
+
+def test_feedback_goes_to_the_sections_it_mentions():
+    feedback = assign_feedback(split_sections(RESUME), [
+        "Skills: group the tools by area",
+        "Add metrics to each role",
+        "Tighten the summary",
+        "Use a more confident tone",
+    ])
+
+    assert feedback["skills"] == ["Skills: group the tools by area"]
+    assert feedback["experience"] == ["Add metrics to each role"]
+    assert feedback["summary"] == ["Tighten the summary"]
+    assert feedback[""] == ["Use a more confident tone"]
@@ -0,0 +1,94 @@
+"""Streamed JSON replies against the mock LLM server: usage, JSON mode fallback and re-asks."""
+
+import json
+
+import pytest
+
+from backend import nodes
+from backend.routing import ModelRoute
+from benchmarks.mock_llm_server import CRITIQUE_REPLY, MockLLMServer
+
+MESSAGES = [{"role": "user", "content": 'Score this resume. Reply with "overall_score".'}]
+REQUIRED_KEYS = ("overall_score",)
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("QUBRID_API_KEY", "mock")
+
+
+def complete(server: MockLLMServer, messages=MESSAGES, required_keys=REQUIRED_KEYS):
+    route = ModelRoute(model="mock", base_url=server.base_url)
+    return nodes._create_completion(route, messages, 0.0, 10, 100, required_keys)
+
+
+def test_stream_reports_usage_when_read_to_the_end():
+    with MockLLMServer() as server:
+        # No required keys match, so the whole stream (and its usage chunk) is read
+        content, usage, _ = complete(server, required_keys=("missing_key",))
+
+    assert content.startswith("{")
+    assert not isinstance(usage, nodes.EstimatedUsage)
+    assert usage.prompt_tokens > 0
+    assert usage.completion_tokens == len(content) // 4
+
+
+def test_stream_stopped_early_estimates_usage():
+    with MockLLMServer(ramble_tokens=300) as server:
+        content, usage, _ = complete(server)
+
+    assert json.loads(content)["overall_score"] == CRITIQUE_REPLY["overall_score"]
+    assert isinstance(usage, nodes.EstimatedUsage)
+    assert usage.completion_tokens > 0
+    assert usage.total_tokens == usage.prompt_tokens + usage.completion_tokens
+
+
+def test_json_mode_disabled_only_when_endpoint_rejects_it(monkeypatch):
+    monkeypatch.setattr(nodes, "_json_mode_rejected", set())
+
+    with MockLLMServer(supports_json_mode=False) as server:
+        content, _, _ = complete(server)
+
+    assert server.base_url in nodes._json_mode_rejected
+    assert json.loads(content)["overall_score"] == CRITIQUE_REPLY["overall_score"]
+
+
+def test_other_bad_requests_keep_json_mode(monkeypatch):
+    from openai import BadRequestError
+
+    monkeypatch.setattr(nodes, "_json_mode_rejected", set())
+    long_prompt = [{"role": "user", "content": "x" * 4000}]
+
+    with MockLLMServer(context_tokens=100) as server:
+        with pytest.raises(BadRequestError):
+            complete(server, messages=long_prompt)
+
+    assert server.base_url not in nodes._json_mode_rejected
+
+
+def test_truncated_reply_missing_required_keys_is_reasked(monkeypatch):
+    truncated = '{"overall_score": 7, "strengths": ["Clear summary"'
+    replies = iter([truncated, json.dumps(CRITIQUE_REPLY)])
+    prompts = []
+
+    def fake_call(messages, **kwargs):
+        prompts.append(messages[-1]["content"])
+        return next(replies)
+
+    monkeypatch.setattr(nodes, "call_llm_with_retry", fake_call)
+
+    with pytest.raises(ValueError):
+        nodes.parse_json_response(truncated, ("overall_score", "improvements_needed"))
+    obj = nodes.call_llm_json(MESSAGES, 0.0, "critique", ("overall_score", "improvements_needed"))
+
+    assert obj == CRITIQUE_REPLY
+    assert len(prompts) == 2
+
+
+def test_repair_keeps_smart_quotes_inside_values():
+    from backend.json_repair import repair_json
+
+    delimited = repair_json('{“overall_score”: 7, “summary”: “Led “Project X” rollout”,')
+    plain = repair_json('{"overall_score": 7, "summary": "Led “Project X” rollout",')
+
+    assert delimited == plain == {"overall_score": 7, "summary": "Led “Project X” rollout"}